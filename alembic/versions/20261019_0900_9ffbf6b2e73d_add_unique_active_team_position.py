@@ -0,0 +1,34 @@
+"""add unique active team position
+
+Revision ID: 9ffbf6b2e73d
+Revises: f673f7100000
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9ffbf6b2e73d'
+down_revision = 'f673f7100000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    op.create_index(
+        'ux_teams_trainer_position_active',
+        'teams',
+        ['trainer_id', 'position'],
+        unique=True,
+        sqlite_where=sa.text('is_active = 1'),
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_index('ux_teams_trainer_position_active', table_name='teams')
@@ -0,0 +1,32 @@
+"""add table versions
+
+Revision ID: 3c1d7a52e8b4
+Revises: 9ffbf6b2e73d
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1d7a52e8b4'
+down_revision = '9ffbf6b2e73d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    op.create_table(
+        'table_versions',
+        sa.Column('table_name', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('table_name'),
+    )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_table('table_versions')
@@ -0,0 +1,66 @@
+"""add trainer battle stats
+
+Revision ID: b7e2f09a4c61
+Revises: 3c1d7a52e8b4
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2f09a4c61'
+down_revision = '3c1d7a52e8b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    op.create_table(
+        'trainer_battle_stats',
+        sa.Column('trainer_id', sa.Integer(), nullable=False),
+        sa.Column('wins', sa.Integer(), nullable=False),
+        sa.Column('losses', sa.Integer(), nullable=False),
+        sa.Column('total_battles', sa.Integer(), nullable=False),
+        sa.Column('win_rate', sa.Float(), nullable=False),
+        sa.Column('last_battle_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['trainer_id'], ['trainers.id'], ),
+        sa.PrimaryKeyConstraint('trainer_id'),
+    )
+    op.create_index(
+        'ix_trainer_battle_stats_ranking',
+        'trainer_battle_stats',
+        [sa.text('wins DESC'), sa.text('win_rate DESC'), 'trainer_id'],
+        unique=False,
+    )
+    # Backfill from existing battles; scripts/rebuild_battle_stats.py does the
+    # same at any later point to repair drift.
+    op.execute(
+        """
+        INSERT INTO trainer_battle_stats
+            (trainer_id, wins, losses, total_battles, win_rate, last_battle_at)
+        SELECT trainer_id,
+               SUM(winner_trainer_id = trainer_id),
+               COUNT(*) - SUM(winner_trainer_id = trainer_id),
+               COUNT(*),
+               ROUND(SUM(winner_trainer_id = trainer_id) * 100.0 / COUNT(*), 2),
+               MAX(battle_date)
+        FROM (
+            SELECT team1_trainer_id AS trainer_id, winner_trainer_id, battle_date
+            FROM battles
+            UNION ALL
+            SELECT team2_trainer_id, winner_trainer_id, battle_date
+            FROM battles
+        )
+        GROUP BY trainer_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_index('ix_trainer_battle_stats_ranking', table_name='trainer_battle_stats')
+    op.drop_table('trainer_battle_stats')
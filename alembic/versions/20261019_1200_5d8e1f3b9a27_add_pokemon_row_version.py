@@ -0,0 +1,30 @@
+"""add pokemon row version
+
+Revision ID: 5d8e1f3b9a27
+Revises: b7e2f09a4c61
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8e1f3b9a27'
+down_revision = 'b7e2f09a4c61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    with op.batch_alter_table('pokemon', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('version', sa.Integer(), nullable=False, server_default='1')
+        )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    with op.batch_alter_table('pokemon', schema=None) as batch_op:
+        batch_op.drop_column('version')
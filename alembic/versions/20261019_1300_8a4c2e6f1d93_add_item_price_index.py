@@ -0,0 +1,25 @@
+"""add item price index
+
+Revision ID: 8a4c2e6f1d93
+Revises: 5d8e1f3b9a27
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4c2e6f1d93'
+down_revision = '5d8e1f3b9a27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    op.create_index(op.f('ix_items_price'), 'items', ['price'], unique=False)
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_index(op.f('ix_items_price'), table_name='items')
@@ -0,0 +1,41 @@
+"""add idempotency keys
+
+Revision ID: c41f7e2a9b58
+Revises: 8a4c2e6f1d93
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41f7e2a9b58'
+down_revision = '8a4c2e6f1d93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    op.create_table(
+        'idempotency_keys',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('scope', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column('key', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column('fingerprint', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=True),
+        sa.Column('headers', sa.LargeBinary(), nullable=True),
+        sa.Column('body', sa.LargeBinary(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('scope', 'key', name='uq_idempotency_keys'),
+    )
+    op.create_index(op.f('ix_idempotency_keys_expires_at'), 'idempotency_keys', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_index(op.f('ix_idempotency_keys_expires_at'), table_name='idempotency_keys')
+    op.drop_table('idempotency_keys')
@@ -0,0 +1,30 @@
+"""add user token version
+
+Revision ID: e5b93d0c7a14
+Revises: c41f7e2a9b58
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b93d0c7a14'
+down_revision = 'c41f7e2a9b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('token_version', sa.Integer(), nullable=False, server_default='0')
+        )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('token_version')
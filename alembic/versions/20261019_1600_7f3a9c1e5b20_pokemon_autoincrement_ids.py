@@ -0,0 +1,38 @@
+"""pokemon autoincrement ids
+
+Revision ID: 7f3a9c1e5b20
+Revises: e5b93d0c7a14
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7f3a9c1e5b20'
+down_revision = 'e5b93d0c7a14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    # SQLite can only switch to AUTOINCREMENT by rebuilding the table.
+    with op.batch_alter_table(
+        'pokemon',
+        schema=None,
+        recreate='always',
+        table_kwargs={'sqlite_autoincrement': True},
+    ):
+        pass
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    with op.batch_alter_table(
+        'pokemon',
+        schema=None,
+        recreate='always',
+        table_kwargs={'sqlite_autoincrement': False},
+    ):
+        pass
@@ -435,7 +435,9 @@ def _handle_password_change(
     try:
         with st.spinner("Changing password..."):
             api_client.change_password(current_password, new_password)
-        st.success("✅ Password successfully updated")
+        # The change revokes every token issued before, this one included.
+        logout_user()
+        st.success("✅ Password successfully updated, please log in again")
 
     except Exception as e:
         error_msg = str(e)
@@ -82,7 +82,7 @@ def _fetch_and_prepare_backpack_data() -> list[dict[str, Any]]:
     )
 
     # Add empty backpacks for trainers without items
-    all_trainers = api_client.get_trainers(limit=1000)
+    all_trainers = api_client.get_trainers(limit=1000, fields="id,name")
     trainer_ids_with_backpacks = {bp.get("trainer_id") for bp in backpacks}
 
     for trainer in all_trainers:
@@ -303,7 +303,7 @@ def show_backpack_management() -> None:
 
     # Trainer selection
     try:
-        trainers = api_client.get_trainers(limit=1000)
+        trainers = api_client.get_trainers(limit=1000, fields="id,name,region")
 
         if not trainers:
             st.info("No trainers available.")
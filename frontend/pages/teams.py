@@ -234,7 +234,7 @@ def show_team_management() -> None:
     st.subheader("➕ Team Management")
 
     try:
-        trainers = api_client.get_trainers(limit=1000)
+        trainers = api_client.get_trainers(limit=1000, fields="id,name,region")
         if not trainers:
             st.info("No trainers available.")
             return
@@ -311,7 +311,9 @@ def _show_add_pokemon_section(
         st.warning("Team is full (6/6 Pokémon)")
         return
 
-    all_pokemon = api_client.get_pokemon(limit=1000)
+    all_pokemon = api_client.get_pokemon(
+        limit=1000, fields="id,name,level,type_primary"
+    )
     current_pokemon_ids = [m.get("pokemon_id") for m in current_members]
     available_pokemon = [p for p in all_pokemon if p["id"] not in current_pokemon_ids]
 
@@ -422,7 +424,7 @@ def show_position_management() -> None:
     st.subheader("🔄 Position Management")
 
     try:
-        trainers = api_client.get_trainers(limit=1000)
+        trainers = api_client.get_trainers(limit=1000, fields="id,name,region")
         if not trainers:
             st.info("No trainers available.")
             return
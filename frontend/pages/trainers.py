@@ -54,21 +54,19 @@ def show_trainers_list() -> None:
             st.rerun()
 
     try:
-        trainers_response = api_client.get_trainers(limit=1000)
+        filters = [f"region:eq:{region_filter}"] if region_filter != "All" else None
+        trainers_response = api_client.get_trainers(limit=1000, filters=filters)
         trainers: list[dict[str, Any]] = (
             trainers_response if isinstance(trainers_response, list) else []
         )
 
-        if not trainers:
+        if not trainers and not filters:
             st.info("No trainers registered.")
             return
 
         if search_term:
             trainers = [t for t in trainers if search_term.lower() in t["name"].lower()]
 
-        if region_filter != "All":
-            trainers = [t for t in trainers if t["region"] == region_filter]
-
         if trainers:
             display_data = []
             for trainer in trainers:
@@ -135,7 +135,7 @@ class BackpacksClient(BaseAPIClient):
         try:
             response = requests.get(
                 f"{self.base_url}/trainers",
-                params={"skip": 0, "limit": 1000},
+                params={"skip": 0, "limit": 1000, "fields": "id"},
                 headers=self._get_headers(),
                 timeout=30,
             )
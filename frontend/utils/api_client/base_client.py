@@ -1,7 +1,9 @@
 """Base API client with common functionality."""
 
 import json
+from http import HTTPStatus
 from typing import Any
+from urllib.parse import urlsplit
 
 import requests
 import streamlit as st
@@ -10,6 +12,13 @@ import streamlit as st
 class BaseAPIClient:
     """Base client with common API functionality."""
 
+    # Last ETag-bearing response per request, shared so polling pages revalidate.
+    _etag_cache: dict[str, tuple[str, requests.Response]] = {}
+    _etag_cache_max_entries = 256
+
+    # Server-side cap on sub-requests per POST /batch.
+    _batch_max_requests = 50
+
     def __init__(self, base_url: str = "http://localhost:8000/api/v1") -> None:
         """Initialize API client with base URL."""
         self.base_url = base_url
@@ -40,6 +49,47 @@ class BaseAPIClient:
         except (ValueError, json.JSONDecodeError):
             return {"error": "Invalid JSON response", "text": response.text}
 
+    def _conditional_get(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> requests.Response:
+        """GET that revalidates a previously seen response with If-None-Match."""
+        headers = self._get_headers()
+        key = f"{url}?{sorted((params or {}).items())}|{headers.get('Authorization')}"
+        cached = self._etag_cache.get(key)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        response = requests.get(url, params=params, headers=headers, timeout=30)
+        if response.status_code == HTTPStatus.NOT_MODIFIED and cached:
+            return cached[1]
+
+        etag = response.headers.get("ETag")
+        if response.ok and etag:
+            if len(self._etag_cache) >= self._etag_cache_max_entries:
+                self._etag_cache.clear()
+            self._etag_cache[key] = (etag, response)
+        return response
+
+    def _api_path(self, resource: str) -> str:
+        """App-relative path of ``resource``, as batch sub-requests expect."""
+        return f"{urlsplit(self.base_url).path.rstrip('/')}/{resource.lstrip('/')}"
+
+    def _batch(self, sub_requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Run sub-requests (method, path, body) in as few round-trips as possible.
+
+        Returns one ``{"status", "headers", "body"}`` dict per sub-request.
+        """
+        responses: list[dict[str, Any]] = []
+        for start in range(0, len(sub_requests), self._batch_max_requests):
+            response = requests.post(
+                f"{self.base_url}/batch",
+                json=sub_requests[start : start + self._batch_max_requests],
+                headers=self._get_headers(),
+                timeout=30,
+            )
+            responses.extend(self._handle_response(response))
+        return responses
+
     def health_check(self) -> Any:
         """Check API health status."""
         try:
@@ -51,6 +101,21 @@ class BaseAPIClient:
         except requests.RequestException as e:
             return {"status": "unhealthy", "error": str(e)}
 
+    def _get_total_count(self, resource: str) -> int | None:
+        """Read a collection size from the X-Total-Count header of a 1-row page."""
+        try:
+            response = requests.get(
+                f"{self.base_url}/{resource}",
+                params={"skip": 0, "limit": 1},
+                headers=self._get_headers(),
+                timeout=30,
+            )
+            response.raise_for_status()
+            total = response.headers.get("X-Total-Count")
+            return int(total) if total is not None else None
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
     def _get_trainers_for_stats(self) -> list[dict[str, Any]]:
         """Internal method to get trainers for dashboard stats."""
         try:
@@ -96,6 +161,52 @@ class BaseAPIClient:
         except Exception:  # pylint: disable=broad-exception-caught
             return []
 
+    def _get_precomputed_dashboard(self) -> dict[str, Any] | None:
+        """Read the server's precomputed dashboard figures, if it has them."""
+        try:
+            response = requests.get(
+                f"{self.base_url}/dashboard/",
+                headers=self._get_headers(),
+                timeout=30,
+            )
+            response.raise_for_status()
+            data = response.json()
+            if data.get("age_seconds") is None:
+                return None
+            return {key: value for key, value in data.items() if value is not None}
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
+    def _get_dashboard_stats_batched(self) -> dict[str, Any]:
+        """Dashboard figures from a single batch round-trip."""
+        dashboard, trainers, pokemon, items = self._batch(
+            [
+                {"path": self._api_path("dashboard/")},
+                {"path": self._api_path("trainers/?skip=0&limit=1")},
+                {"path": self._api_path("pokemon/?skip=0&limit=100")},
+                {"path": self._api_path("items/?skip=0&limit=1")},
+            ]
+        )
+        precomputed = dashboard["body"] if dashboard["status"] == HTTPStatus.OK else {}
+        if precomputed.get("age_seconds") is not None:
+            return {
+                key: value for key, value in precomputed.items() if value is not None
+            }
+
+        stats: dict[str, Any] = {}
+        for key, result in (
+            ("trainers_count", trainers),
+            ("pokemon_count", pokemon),
+            ("items_count", items),
+        ):
+            total = result["headers"].get("x-total-count")
+            if result["status"] == HTTPStatus.OK and total is not None:
+                stats[key] = int(total)
+        if pokemon["status"] == HTTPStatus.OK and pokemon["body"]:
+            levels = [p.get("level", 1) for p in pokemon["body"]]
+            stats["average_level"] = sum(levels) / len(levels)
+        return stats
+
     def get_dashboard_stats(self) -> dict[str, Any]:
         """Get dashboard statistics."""
         try:
@@ -108,14 +219,28 @@ class BaseAPIClient:
             }
 
             try:
-                trainers = self._get_trainers_for_stats()
-                stats["trainers_count"] = len(trainers)
+                return {**stats, **self._get_dashboard_stats_batched()}
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(f"Warning: Batched dashboard request failed: {e}")
+
+            precomputed = self._get_precomputed_dashboard()
+            if precomputed is not None:
+                return {**stats, **precomputed}
+
+            try:
+                trainers_total = self._get_total_count("trainers")
+                if trainers_total is None:
+                    trainers_total = len(self._get_trainers_for_stats())
+                stats["trainers_count"] = trainers_total
             except Exception as e:  # pylint: disable=broad-exception-caught
                 print(f"Warning: Could not load trainers data: {e}")
 
             try:
                 pokemon = self._get_pokemon_for_stats()
-                stats["pokemon_count"] = len(pokemon)
+                pokemon_total = self._get_total_count("pokemon")
+                stats["pokemon_count"] = (
+                    pokemon_total if pokemon_total is not None else len(pokemon)
+                )
                 if pokemon:
                     levels = [p.get("level", 1) for p in pokemon]
                     stats["average_level"] = sum(levels) / len(levels)
@@ -123,8 +248,10 @@ class BaseAPIClient:
                 print(f"Warning: Could not load pokemon data: {e}")
 
             try:
-                items = self._get_items_for_stats()
-                stats["items_count"] = len(items)
+                items_total = self._get_total_count("items")
+                if items_total is None:
+                    items_total = len(self._get_items_for_stats())
+                stats["items_count"] = items_total
             except Exception as e:  # pylint: disable=broad-exception-caught
                 print(f"Warning: Could not load items data: {e}")
 
@@ -70,11 +70,11 @@ class BattlesClient(BaseAPIClient):
         except Exception:
             return []
 
-    def get_leaderboard(self) -> dict[str, Any]:
-        """Get battle leaderboard."""
+    def get_trainer_stats(self, trainer_id: int) -> dict[str, Any]:
+        """Get aggregated battle statistics for a trainer."""
         try:
             response = requests.get(
-                f"{self.base_url}/battles/leaderboard",
+                f"{self.base_url}/battles/trainer/{trainer_id}/stats",
                 headers=self._get_headers(),
                 timeout=30,
             )
@@ -87,6 +87,22 @@ class BattlesClient(BaseAPIClient):
             response.raise_for_status()
             return cast(dict[str, Any], response.json())
 
+        except Exception:
+            return {}
+
+    def get_leaderboard(self) -> dict[str, Any]:
+        """Get battle leaderboard."""
+        try:
+            response = self._conditional_get(f"{self.base_url}/battles/leaderboard")
+
+            if response.status_code == 401:
+                st.session_state.authenticated = False
+                st.error("Session expired. Please log in again.")
+                st.rerun()
+
+            response.raise_for_status()
+            return cast(dict[str, Any], response.json())
+
         except Exception:
             return {"leaderboard": [], "total_trainers": 0, "total_battles": 0}
 
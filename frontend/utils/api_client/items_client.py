@@ -14,11 +14,8 @@ class ItemsClient(BaseAPIClient):
     def get_items(self, skip: int = 0, limit: int = 100) -> list[dict[str, Any]]:
         """Get list of items."""
         try:
-            response = requests.get(
-                f"{self.base_url}/items",
-                params={"skip": skip, "limit": limit},
-                headers=self._get_headers(),
-                timeout=30,
+            response = self._conditional_get(
+                f"{self.base_url}/items", params={"skip": skip, "limit": limit}
             )
 
             if response.status_code == 401:
@@ -11,15 +11,15 @@ from .base_client import BaseAPIClient
 class PokemonClient(BaseAPIClient):
     """Pokemon API endpoints."""
 
-    def get_pokemon(self, skip: int = 0, limit: int = 100) -> list[dict[str, Any]]:
-        """Get list of pokemon."""
+    def get_pokemon(
+        self, skip: int = 0, limit: int = 100, fields: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Get list of pokemon, optionally with only the comma-separated fields."""
+        params: dict[str, Any] = {"skip": skip, "limit": limit}
+        if fields:
+            params["fields"] = fields
         try:
-            response = requests.get(
-                f"{self.base_url}/pokemon",
-                params={"skip": skip, "limit": limit},
-                headers=self._get_headers(),
-                timeout=30,
-            )
+            response = self._conditional_get(f"{self.base_url}/pokemon", params=params)
 
             if response.status_code == 401:
                 st.session_state.authenticated = False
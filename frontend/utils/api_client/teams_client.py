@@ -1,5 +1,6 @@
 """Teams API endpoints."""
 
+from http import HTTPStatus
 from typing import Any
 
 import requests
@@ -111,11 +112,7 @@ class TeamsClient(BaseAPIClient):
 
     def get_trainer_team(self, trainer_id: int) -> Any:
         """Get trainer's team."""
-        response = requests.get(
-            f"{self.base_url}/teams/trainers/{trainer_id}",
-            headers=self._get_headers(),
-            timeout=30,
-        )
+        response = self._conditional_get(f"{self.base_url}/teams/trainers/{trainer_id}")
         return self._handle_response(response)
 
     def _get_trainers_list(self) -> list[dict[str, Any]]:
@@ -123,7 +120,7 @@ class TeamsClient(BaseAPIClient):
         try:
             response = requests.get(
                 f"{self.base_url}/trainers",
-                params={"skip": 0, "limit": 1000},
+                params={"skip": 0, "limit": 1000, "fields": "id"},
                 headers=self._get_headers(),
                 timeout=30,
             )
@@ -148,20 +145,48 @@ class TeamsClient(BaseAPIClient):
         """Get all teams by fetching all trainers and their teams."""
         try:
             trainers = self._get_trainers_list()
-            teams = []
+            if not trainers:
+                return []
+
+            try:
+                results = self._batch(
+                    [
+                        {"path": self._api_path(f"teams/trainers/{trainer['id']}")}
+                        for trainer in trainers
+                    ]
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(f"Warning: Batched team request failed: {e}")
+                return self._get_teams_one_by_one(trainers)
 
-            for trainer in trainers:
-                try:
-                    team = self.get_trainer_team(trainer["id"])
-                    if team and team.get("members"):
-                        teams.append(team)
-                except Exception as e:  # pylint: disable=broad-exception-caught
+            teams = []
+            for trainer, result in zip(trainers, results):
+                team = result["body"]
+                if result["status"] != HTTPStatus.OK:
                     print(
-                        f"Warning: Could not load team for trainer {trainer.get('id')}: {e}"
+                        f"Warning: Could not load team for trainer {trainer.get('id')}: "
+                        f"HTTP {result['status']}"
                     )
-
+                elif team and team.get("members"):
+                    teams.append(team)
             return teams
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             st.error(f"Error loading teams: {str(e)}")
             return []
+
+    def _get_teams_one_by_one(
+        self, trainers: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Fallback for servers without the batch endpoint."""
+        teams = []
+        for trainer in trainers:
+            try:
+                team = self.get_trainer_team(trainer["id"])
+                if team and team.get("members"):
+                    teams.append(team)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(
+                    f"Warning: Could not load team for trainer {trainer.get('id')}: {e}"
+                )
+        return teams
@@ -11,12 +11,27 @@ from .base_client import BaseAPIClient
 class TrainersClient(BaseAPIClient):
     """Trainers API endpoints."""
 
-    def get_trainers(self, skip: int = 0, limit: int = 100) -> list[dict[str, Any]]:
-        """Get list of trainers."""
+    def get_trainers(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: str | None = None,
+        filters: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get list of trainers.
+
+        ``fields`` limits the response to the comma-separated fields and
+        ``filters`` are ``field:operator:value`` conditions applied server-side.
+        """
+        params: dict[str, Any] = {"skip": skip, "limit": limit}
+        if fields:
+            params["fields"] = fields
+        if filters:
+            params["filter"] = filters
         try:
             response = requests.get(
                 f"{self.base_url}/trainers",
-                params={"skip": skip, "limit": limit},
+                params=params,
                 headers=self._get_headers(),
                 timeout=30,
             )
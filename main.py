@@ -1,29 +1,92 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlmodel import Session
 
-from src.persistence.database.connection import create_tables
+from src.config import settings
+from src.persistence.database.connection import create_tables, engine
+from src.persistence.repositories import (
+    SqlModelItemRepository,
+    entity_cache_stats,
+    item_catalog,
+)
 from src.presentation.api.auth import router as auth_router
 from src.presentation.api.backpacks import router as backpacks_router
+from src.presentation.api.batch import router as batch_router
+from src.presentation.api.battles import leaderboard_flight
 from src.presentation.api.battles import router as battles_router
+from src.presentation.api.dashboard import dashboard_refresher
+from src.presentation.api.dashboard import router as dashboard_router
+from src.presentation.api.export import router as export_router
 from src.presentation.api.items import router as items_router
+from src.presentation.api.pokemon import pokemon_fragments
 from src.presentation.api.pokemon import router as pokemon_router
 from src.presentation.api.teams import router as teams_router
 from src.presentation.api.trainers import router as trainers_router
+from src.presentation.dependencies.auth import (
+    password_hasher,
+    principal_cache,
+    token_revocations,
+)
+from src.presentation.dependencies.pagination import TOTAL_COUNT_HEADER
+from src.presentation.middleware import (
+    IdempotencyMiddleware,
+    LoadSheddingMiddleware,
+    ResponseCacheMiddleware,
+    idempotency_store,
+    load_shedder,
+    response_cache,
+)
+from src.presentation.responses import FastJSONResponse
 
 create_tables()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    with Session(engine) as db:
+        item_catalog.reload(SqlModelItemRepository(db))
+    dashboard_refresher.refresh_due()
+    dashboard_refresher.start()
+    yield
+    dashboard_refresher.stop()
+    password_hasher.shutdown()
+
+
 app = FastAPI(
     title="Pokemon API",
     description="API REST for Trainers and Pokemons with JWT Authentication",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+# Inside the response cache, so cache hits never wait for a slot.
+if settings.LOAD_SHEDDING_ENABLED:
+    app.add_middleware(LoadSheddingMiddleware, shedder=load_shedder)
+
+if settings.RESPONSE_CACHE_ENABLED:
+    app.add_middleware(ResponseCacheMiddleware, cache=response_cache, engine=engine)
+
+# Outside load shedding, so replaying a stored response never waits for a slot.
+if settings.IDEMPOTENCY_ENABLED:
+    app.add_middleware(IdempotencyMiddleware, store=idempotency_store, engine=engine)
+
+# Added last so it wraps cached responses too.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        TOTAL_COUNT_HEADER,
+        "ETag",
+        "Retry-After",
+        "Idempotent-Replayed",
+    ],
 )
 
 
@@ -41,6 +104,21 @@ def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+def metrics() -> dict[str, dict]:
+    return {
+        "entity_cache": entity_cache_stats(),
+        "leaderboard": leaderboard_flight.stats(),
+        "principals": principal_cache.stats(),
+        "password_hasher": password_hasher.stats(),
+        "token_revocations": token_revocations.stats(),
+        "pokemon_fragments": pokemon_fragments.stats(),
+        "dashboard": dashboard_refresher.stats(),
+        "responses": response_cache.stats(),
+        "load_shedding": load_shedder.stats(),
+    }
+
+
 @app.get("/version")
 def version() -> dict[str, str]:
     return {"version": "1.0.0"}
@@ -53,6 +131,9 @@ app.include_router(teams_router, prefix="/api/v1")
 app.include_router(items_router, prefix="/api/v1")
 app.include_router(backpacks_router, prefix="/api/v1")
 app.include_router(battles_router, prefix="/api/v1")
+app.include_router(dashboard_router, prefix="/api/v1")
+app.include_router(export_router, prefix="/api/v1")
+app.include_router(batch_router, prefix="/api/v1")
 
 if __name__ == "__main__":
     import uvicorn
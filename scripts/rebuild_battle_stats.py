@@ -0,0 +1,21 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlmodel import Session
+
+from src.persistence.database.connection import engine
+from src.persistence.repositories import SqlModelBattleRepository
+
+
+def rebuild_battle_stats() -> None:
+    """Recompute trainer_battle_stats from the battles table."""
+    with Session(engine) as db:
+        print("Rebuilding trainer battle stats...")
+        ranked = SqlModelBattleRepository(db).rebuild_trainer_battle_stats()
+        print(f"Rebuilt stats for {ranked} trainers")
+
+
+if __name__ == "__main__":
+    rebuild_battle_stats()
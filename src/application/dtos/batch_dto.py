@@ -0,0 +1,16 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class BatchSubRequestDTO(BaseModel):
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str = Field(pattern=r"^/", description="App-relative path with query")
+    body: Any = None
+    headers: dict[str, str] = Field(default_factory=dict)
+
+
+class BatchSubResponseDTO(BaseModel):
+    status: int
+    headers: dict[str, str]
+    body: Any = None
@@ -42,3 +42,14 @@ class LeaderboardResponseDTO(BaseModel):
     leaderboard: list[LeaderboardEntryDTO]
     total_trainers: int
     total_battles: int
+
+
+class TrainerBattleStatsDTO(BaseModel):
+    trainer_id: int
+    trainer_name: str
+    wins: int
+    losses: int
+    total_battles: int
+    win_rate: float
+    average_victory_margin: float | None = None
+    last_battle_date: datetime | None = None
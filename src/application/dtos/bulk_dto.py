@@ -0,0 +1,30 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class BulkRowStatus(str, Enum):
+    CREATED = "created"
+    FAILED = "failed"
+
+
+class BulkRowResultDTO[ResultT](BaseModel):
+    index: int
+    status: BulkRowStatus
+    data: ResultT | None = None
+    error: str | None = None
+
+
+class BulkResponseDTO[ResultT](BaseModel):
+    created: int
+    failed: int
+    results: list[BulkRowResultDTO[ResultT]]
+
+    @classmethod
+    def from_results(
+        cls, results: list[BulkRowResultDTO[ResultT]]
+    ) -> "BulkResponseDTO[ResultT]":
+        created = sum(result.status is BulkRowStatus.CREATED for result in results)
+        return cls.model_construct(
+            created=created, failed=len(results) - created, results=results
+        )
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+from src.application.dtos.battle_dto import LeaderboardEntryDTO
+
+
+class DashboardStatsDTO(BaseModel):
+    trainers_count: int | None = None
+    pokemon_count: int | None = None
+    items_count: int | None = None
+    average_level: float | None = None
+    top_trainers: list[LeaderboardEntryDTO] = []
+    # Age of the oldest figure above; None until the first refresh completes.
+    age_seconds: float | None = None
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class PageResponseDTO[ItemT](BaseModel):
+    items: list[ItemT]
+    total: int
+    skip: int
+    limit: int
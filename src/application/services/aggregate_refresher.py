@@ -0,0 +1,127 @@
+import logging
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AggregateSnapshot:
+    """Last computed value of an aggregate and when it was computed."""
+
+    value: Any
+    computed_at: datetime
+    computed_monotonic: float
+
+    @property
+    def age_seconds(self) -> float:
+        return monotonic() - self.computed_monotonic
+
+
+@dataclass
+class _Aggregate:
+    compute: Callable[[], Any]
+    stamp: Callable[[], Hashable] | None
+    snapshot: AggregateSnapshot | None = None
+    computed_stamp: Hashable = None
+
+
+class AggregateRefresher:
+    """Keep expensive aggregates precomputed on a background thread.
+
+    Readers only ever get the latest snapshot, never wait for a computation.
+    An aggregate is recomputed once it is ``interval_seconds`` old, or sooner
+    when its ``stamp`` (e.g. the versions of the tables it reads) changes,
+    but never more often than every ``min_interval_seconds``. A failed
+    computation keeps serving the previous snapshot.
+    """
+
+    def __init__(self, interval_seconds: float, min_interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.min_interval_seconds = min_interval_seconds
+        self.refreshes = 0
+        self.errors = 0
+        self._aggregates: dict[str, _Aggregate] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+    def register(
+        self,
+        name: str,
+        compute: Callable[[], Any],
+        stamp: Callable[[], Hashable] | None = None,
+    ) -> None:
+        with self._lock:
+            self._aggregates[name] = _Aggregate(compute=compute, stamp=stamp)
+
+    def get(self, name: str) -> AggregateSnapshot | None:
+        """Latest snapshot, or ``None`` before the first computation."""
+        with self._lock:
+            return self._aggregates[name].snapshot
+
+    def refresh_due(self) -> None:
+        """Recompute every aggregate that is due; runs on the caller's thread."""
+        with self._lock:
+            aggregates = list(self._aggregates.items())
+
+        for name, aggregate in aggregates:
+            stamp = aggregate.stamp() if aggregate.stamp is not None else None
+            if not self._is_due(aggregate, stamp):
+                continue
+            try:
+                value = aggregate.compute()
+            except Exception:
+                self.errors += 1
+                logger.exception("Refreshing aggregate %r failed", name)
+                continue
+            with self._lock:
+                aggregate.snapshot = AggregateSnapshot(
+                    value=value,
+                    computed_at=datetime.utcnow(),
+                    computed_monotonic=monotonic(),
+                )
+                aggregate.computed_stamp = stamp
+                self.refreshes += 1
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="aggregate-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            ages = {
+                name: (
+                    round(aggregate.snapshot.age_seconds, 3)
+                    if aggregate.snapshot is not None
+                    else None
+                )
+                for name, aggregate in self._aggregates.items()
+            }
+        return {"refreshes": self.refreshes, "errors": self.errors, "ages": ages}
+
+    def _is_due(self, aggregate: _Aggregate, stamp: Hashable) -> bool:
+        snapshot = aggregate.snapshot
+        if snapshot is None:
+            return True
+        age = snapshot.age_seconds
+        if age >= self.interval_seconds:
+            return True
+        return stamp != aggregate.computed_stamp and age >= self.min_interval_seconds
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.min_interval_seconds):
+            self.refresh_due()
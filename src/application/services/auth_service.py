@@ -1,7 +1,6 @@
 from datetime import datetime, timedelta
 
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from src.application.dtos.auth_dto import (
     ChangePasswordDTO,
@@ -11,21 +10,34 @@ from src.application.dtos.auth_dto import (
     UserRegistrationDTO,
     UserResponseDTO,
 )
+from src.application.services.password_hasher import PasswordHasher
+from src.application.services.principal_cache import PrincipalCache
+from src.application.services.token_revocations import TokenRevocationList
 from src.config import settings
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import UserRepository
 
 
 class AuthService:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        principal_cache: PrincipalCache | None = None,
+        password_hasher: PasswordHasher | None = None,
+        token_revocations: TokenRevocationList | None = None,
+    ):
         self.user_repository = user_repository
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.principal_cache = principal_cache
+        self.token_revocations = token_revocations
+        self.password_hasher = password_hasher or PasswordHasher(
+            rounds=settings.BCRYPT_ROUNDS
+        )
 
     def _hash_password(self, password: str) -> str:
-        return str(self.pwd_context.hash(password))
+        return self.password_hasher.hash(password)
 
     def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return bool(self.pwd_context.verify(plain_password, hashed_password))
+        return self.password_hasher.verify(plain_password, hashed_password)
 
     def _create_access_token(self, data: dict) -> str:
         to_encode = data.copy()
@@ -70,21 +82,32 @@ class AuthService:
 
     def authenticate_user(self, login_data: UserLoginDTO) -> LoginResponseDTO:
         user = self.user_repository.get_by_username(login_data.username)
+        if not user:
+            raise ValueError("Invalid credentials")
 
-        if not user or not self._verify_password(
+        verified, new_hash = self.password_hasher.verify_and_update(
             login_data.password, user.hashed_password
-        ):
+        )
+        if not verified:
             raise ValueError("Invalid credentials")
 
         if not user.is_active:
             raise ValueError("User account is inactive")
 
+        if new_hash is not None and user.id is not None:
+            # Stored with outdated bcrypt parameters; upgrade while we have
+            # the plain password.
+            user.hashed_password = new_hash
+            self.user_repository.update(user.id, user)
+
         access_token = self._create_access_token(
             {
                 "sub": str(user.id),
                 "username": user.username,
                 "email": user.email,
                 "is_superuser": user.is_superuser,
+                "trainer_id": user.trainer_id,
+                "ver": user.token_version,
             }
         )
 
@@ -116,11 +139,82 @@ class AuthService:
             if user_id is None:
                 return None
 
-            return self.user_repository.get_by_id(int(user_id))
+            # Tokens issued before versioning still resolve through the DB.
+            if self.token_revocations is not None and "ver" in payload:
+                return self._principal_from_claims(
+                    self.token_revocations, int(user_id), payload
+                )
+
+            user = self._user_for_token(int(user_id), token, payload)
+            if user is None or int(payload.get("ver", 0)) < user.token_version:
+                return None
+            return user
 
         except JWTError:
             return None
 
+    def get_user_profile(self, user_id: int) -> UserResponseDTO:
+        user = self.user_repository.get_by_id(user_id)
+        if not user:
+            raise ValueError("User not found")
+
+        return UserResponseDTO(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            created_at=user.created_at or datetime.utcnow(),
+            trainer_id=user.trainer_id,
+        )
+
+    def _user_for_token(self, user_id: int, token: str, payload: dict) -> User | None:
+        if self.principal_cache is None:
+            return self.user_repository.get_by_id(user_id)
+
+        cached_user = self.principal_cache.get(user_id, token)
+        if cached_user is not None:
+            return cached_user
+
+        user = self.user_repository.get_by_id(user_id)
+        if user is not None:
+            self.principal_cache.put(user_id, token, user, payload.get("exp"))
+        return user
+
+    def _principal_from_claims(
+        self, revocations: TokenRevocationList, user_id: int, payload: dict
+    ) -> User | None:
+        """Build the user from verified claims alone, without a DB lookup.
+
+        Revoked tokens are rejected against the in-memory revocation list.
+        The principal carries no password hash and no timestamps, and neither
+        superuser rights nor a trainer link: claims outlive changes to those,
+        so checks that need them go through :meth:`get_privileged_user`.
+        """
+        if revocations.needs_refresh():
+            revocations.refresh(self.user_repository)
+        if revocations.is_revoked(user_id, int(payload["ver"])):
+            return None
+
+        return User(
+            id=user_id,
+            username=payload["username"],
+            email=payload["email"],
+            hashed_password="",
+            is_active=True,
+            token_version=int(payload["ver"]),
+        )
+
+    def get_privileged_user(self, principal: User) -> User | None:
+        """Return the principal with current superuser rights and trainer link.
+
+        Principals resolved through the DB already have them; stateless ones
+        are reloaded from the user's row.
+        """
+        if self.token_revocations is None or principal.id is None:
+            return principal
+        return self.user_repository.get_by_id(principal.id)
+
     def change_password(self, user_id: int, password_data: ChangePasswordDTO) -> bool:
         user = self.user_repository.get_by_id(user_id)
         if not user:
@@ -132,6 +226,38 @@ class AuthService:
             raise ValueError("Current password is incorrect")
 
         user.hashed_password = self._hash_password(password_data.new_password)
+        # Tokens issued with the old password stop working.
+        user.token_version += 1
         self.user_repository.update(user_id, user)
+        self._forget_principal(user_id)
+        self._revoke_tokens(user_id, user.token_version)
 
         return True
+
+    def deactivate_user(self, user_id: int) -> UserResponseDTO:
+        user = self.user_repository.get_by_id(user_id)
+        if not user:
+            raise ValueError("User not found")
+
+        user.is_active = False
+        updated_user = self.user_repository.update(user_id, user) or user
+        self._forget_principal(user_id)
+        self._revoke_tokens(user_id, None)
+
+        return UserResponseDTO(
+            id=updated_user.id,
+            username=updated_user.username,
+            email=updated_user.email,
+            is_active=updated_user.is_active,
+            is_superuser=updated_user.is_superuser,
+            created_at=updated_user.created_at or datetime.utcnow(),
+            trainer_id=updated_user.trainer_id,
+        )
+
+    def _forget_principal(self, user_id: int) -> None:
+        if self.principal_cache is not None:
+            self.principal_cache.invalidate_user(user_id)
+
+    def _revoke_tokens(self, user_id: int, min_version: int | None) -> None:
+        if self.token_revocations is not None:
+            self.token_revocations.revoke(user_id, min_version)
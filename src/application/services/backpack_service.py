@@ -5,7 +5,13 @@ from src.application.dtos.backpack_dto import (
     BackpackResponseDTO,
     BackpackUpdateQuantityDTO,
 )
+from src.application.dtos.bulk_dto import (
+    BulkResponseDTO,
+    BulkRowResultDTO,
+    BulkRowStatus,
+)
 from src.domain.entities.backpack import Backpack
+from src.domain.entities.item import Item
 from src.domain.exceptions import BusinessRuleException, EntityNotFoundException
 from src.domain.repositories.backpack_repository import BackpackRepository
 from src.domain.repositories.item_repository import ItemRepository
@@ -44,6 +50,78 @@ class BackpackService:
         self.backpack_repository.add_item(backpack_entry)
         return self.get_trainer_backpack(dto.trainer_id)
 
+    def add_items_to_backpacks(
+        self, dtos: list[BackpackAddItemDTO]
+    ) -> BulkResponseDTO[BackpackItemResponseDTO]:
+        """Validate every row, then add the valid ones in one transaction.
+
+        Quantity limits account for earlier rows of the same batch. Each
+        created row reports the backpack entry as it is after the batch.
+        """
+        trainer_ids = {dto.trainer_id for dto in dtos}
+        item_ids = {dto.item_id for dto in dtos}
+        known_trainers = {
+            trainer_id
+            for trainer_id in trainer_ids
+            if self.trainer_repository.get_by_id(trainer_id)
+        }
+        items = {
+            item.id: item
+            for item_id in item_ids
+            if (item := self.item_repository.get_by_id(item_id)) is not None
+        }
+        quantities = self.backpack_repository.get_item_quantities(
+            {(dto.trainer_id, dto.item_id) for dto in dtos}
+        )
+
+        results: list[BulkRowResultDTO[BackpackItemResponseDTO]] = []
+        accepted: list[int] = []
+        entries: list[Backpack] = []
+        for index, dto in enumerate(dtos):
+            pair = (dto.trainer_id, dto.item_id)
+            try:
+                if dto.trainer_id not in known_trainers:
+                    raise EntityNotFoundException("Trainer", dto.trainer_id)
+                if dto.item_id not in items:
+                    raise EntityNotFoundException("Item", dto.item_id)
+                if dto.quantity <= 0:
+                    raise BusinessRuleException("Quantity must be positive")
+                self._check_add_quantity(dto, quantities.get(pair, 0))
+            except (BusinessRuleException, EntityNotFoundException) as e:
+                results.append(
+                    BulkRowResultDTO.model_construct(
+                        index=index,
+                        status=BulkRowStatus.FAILED,
+                        data=None,
+                        error=str(e),
+                    )
+                )
+                continue
+            quantities[pair] = quantities.get(pair, 0) + dto.quantity
+            accepted.append(index)
+            entries.append(
+                Backpack(
+                    id=None,
+                    trainer_id=dto.trainer_id,
+                    item_id=dto.item_id,
+                    quantity=dto.quantity,
+                )
+            )
+
+        saved = self.backpack_repository.add_items(entries) if entries else []
+        for index, entry in zip(accepted, saved, strict=True):
+            results.append(
+                BulkRowResultDTO.model_construct(
+                    index=index,
+                    status=BulkRowStatus.CREATED,
+                    data=self._backpack_item_response(entry, items[entry.item_id]),
+                    error=None,
+                )
+            )
+
+        results.sort(key=lambda result: result.index)
+        return BulkResponseDTO.from_results(results)
+
     def remove_item_from_backpack(
         self, trainer_id: int, item_id: int, dto: BackpackRemoveItemDTO
     ) -> BackpackResponseDTO:
@@ -100,17 +178,7 @@ class BackpackService:
         for backpack_item in backpack_items:
             item = self.item_repository.get_by_id(backpack_item.item_id)
             if item:
-                item_dto = BackpackItemResponseDTO(
-                    id=backpack_item.id,
-                    trainer_id=backpack_item.trainer_id,
-                    item_id=backpack_item.item_id,
-                    item_name=item.name,
-                    item_type=item.type.value,
-                    item_description=item.description or "",
-                    item_price=item.price,
-                    quantity=backpack_item.quantity,
-                )
-                item_dtos.append(item_dto)
+                item_dtos.append(self._backpack_item_response(backpack_item, item))
 
         return BackpackResponseDTO(
             trainer_id=trainer_id,
@@ -127,6 +195,21 @@ class BackpackService:
         self.backpack_repository.clear_backpack(trainer_id)
         return self.get_trainer_backpack(trainer_id)
 
+    @staticmethod
+    def _backpack_item_response(
+        backpack_item: Backpack, item: Item
+    ) -> BackpackItemResponseDTO:
+        return BackpackItemResponseDTO(
+            id=backpack_item.id,
+            trainer_id=backpack_item.trainer_id,
+            item_id=backpack_item.item_id,
+            item_name=item.name,
+            item_type=item.type.value,
+            item_description=item.description or "",
+            item_price=item.price,
+            quantity=backpack_item.quantity,
+        )
+
     def _validate_add_item_rules(self, dto: BackpackAddItemDTO) -> None:
         if dto.quantity <= 0:
             raise BusinessRuleException("Quantity must be positive")
@@ -134,6 +217,10 @@ class BackpackService:
         current_quantity = self.backpack_repository.get_item_quantity(
             dto.trainer_id, dto.item_id
         )
+        self._check_add_quantity(dto, current_quantity)
+
+    @staticmethod
+    def _check_add_quantity(dto: BackpackAddItemDTO, current_quantity: int) -> None:
         total_quantity = current_quantity + dto.quantity
 
         if total_quantity > 999:
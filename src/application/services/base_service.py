@@ -1,7 +1,14 @@
+from collections.abc import Collection, Iterator
 from typing import TypeVar
 
 from pydantic import BaseModel
 
+from src.application.dtos.bulk_dto import (
+    BulkResponseDTO,
+    BulkRowResultDTO,
+    BulkRowStatus,
+)
+from src.domain.exceptions import BusinessRuleException
 from src.domain.protocols.entity_protocol import (
     CreateDTOProtocol,
     EntityProtocol,
@@ -9,6 +16,7 @@ from src.domain.protocols.entity_protocol import (
     UpdateDTOProtocol,
 )
 from src.domain.repositories.base_repository import BaseRepository
+from src.domain.repositories.list_query import ListQuery
 
 EntityType = TypeVar("EntityType", bound=EntityProtocol)
 CreateDTOType = TypeVar("CreateDTOType", bound=CreateDTOProtocol)
@@ -31,14 +39,58 @@ class BaseService[
         created_entity = self.repository.create(entity)
         return self._transform_to_response_dto(created_entity)
 
+    # Quoted: pydantic cannot build a model for the protocol-bound type param.
+    def create_many(
+        self, dtos: list[CreateDTOType]
+    ) -> "BulkResponseDTO[ResponseDTOType]":
+        """Validate every row, then insert the valid ones in one transaction."""
+        results: list[BulkRowResultDTO[ResponseDTOType]] = []
+        accepted: list[int] = []
+        entities: list[EntityType] = []
+        for index, dto in enumerate(dtos):
+            try:
+                self._validate_business_rules_for_creation(dto)
+            except BusinessRuleException as e:
+                results.append(
+                    BulkRowResultDTO.model_construct(
+                        index=index,
+                        status=BulkRowStatus.FAILED,
+                        data=None,
+                        error=str(e),
+                    )
+                )
+                continue
+            accepted.append(index)
+            entities.append(self._dto_to_entity(dto))
+
+        created = self.repository.create_many(entities) if entities else []
+        for index, entity in zip(accepted, created, strict=True):
+            results.append(
+                BulkRowResultDTO.model_construct(
+                    index=index,
+                    status=BulkRowStatus.CREATED,
+                    data=self._transform_to_response_dto(entity),
+                    error=None,
+                )
+            )
+
+        results.sort(key=lambda result: result.index)
+        return BulkResponseDTO.from_results(results)
+
     def get_by_id(self, entity_id: int) -> ResponseDTOType | None:
         entity = self.repository.get_by_id(entity_id)
         return self._transform_to_response_dto(entity) if entity else None
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[ResponseDTOType]:
-        entities = self.repository.get_all(skip, limit)
+    def get_all(
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
+    ) -> list[ResponseDTOType]:
+        entities = self.repository.get_all(skip, limit, query)
         return [self._transform_to_response_dto(entity) for entity in entities]
 
+    def iter_all(self, chunk_size: int = 500) -> Iterator[list[ResponseDTOType]]:
+        for entities in self.repository.iter_chunks(chunk_size):
+            yield [self._transform_to_response_dto(entity) for entity in entities]
+
     def update(self, entity_id: int, dto: UpdateDTOType) -> ResponseDTOType | None:
         existing_entity = self.repository.get_by_id(entity_id)
         if not existing_entity:
@@ -53,6 +105,9 @@ class BaseService[
     def delete(self, entity_id: int) -> bool:
         return self.repository.delete(entity_id)
 
+    def count(self, exact: bool = False, query: ListQuery | None = None) -> int:
+        return self.repository.count(exact=exact, query=query)
+
     def _validate_business_rules_for_creation(self, dto: CreateDTOType) -> None:
         pass
 
@@ -72,5 +127,15 @@ class BaseService[
     ) -> EntityType:
         raise NotImplementedError("Subclasses must implement _apply_update_dto")
 
+    @staticmethod
+    def _select_fields(
+        fields: Collection[str], dto_class: type[BaseModel]
+    ) -> list[str]:
+        """Validate a sparse fieldset against ``dto_class``, in its field order."""
+        unknown = set(fields) - dto_class.model_fields.keys()
+        if unknown:
+            raise BusinessRuleException(f"Unknown fields: {', '.join(sorted(unknown))}")
+        return [name for name in dto_class.model_fields if name in fields]
+
     def _get_dto_non_none_fields(self, dto: BaseModel) -> dict:
         return {k: v for k, v in dto.model_dump().items() if v is not None}
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from datetime import datetime
 
 from src.application.dtos.battle_dto import (
@@ -5,10 +6,18 @@ from src.application.dtos.battle_dto import (
     BattleResponseDTO,
     LeaderboardEntryDTO,
     LeaderboardResponseDTO,
+    TrainerBattleStatsDTO,
 )
+from src.application.dtos.bulk_dto import (
+    BulkResponseDTO,
+    BulkRowResultDTO,
+    BulkRowStatus,
+)
+from src.application.services.single_flight import SingleFlight
 from src.domain.entities.battle import Battle
 from src.domain.exceptions import BusinessRuleException, EntityNotFoundException
 from src.domain.repositories.battle_repository import BattleRepository
+from src.domain.repositories.list_query import ListQuery
 from src.domain.repositories.team_repository import TeamRepository
 from src.domain.repositories.trainer_repository import TrainerRepository
 
@@ -19,94 +28,102 @@ class BattleService:
         battle_repository: BattleRepository,
         trainer_repository: TrainerRepository,
         team_repository: TeamRepository,
+        leaderboard_flight: SingleFlight[LeaderboardResponseDTO] | None = None,
     ):
         self.battle_repository = battle_repository
         self.trainer_repository = trainer_repository
         self.team_repository = team_repository
+        self.leaderboard_flight = leaderboard_flight
 
     def create_battle(self, dto: BattleCreateDTO) -> BattleResponseDTO:
-        team1_trainer = self.trainer_repository.get_by_id(dto.team1_trainer_id)
-        if not team1_trainer:
-            raise EntityNotFoundException("Trainer", dto.team1_trainer_id)
+        validation = self.battle_repository.get_battle_validation_data(
+            dto.team1_trainer_id, dto.team2_trainer_id, dto.winner_trainer_id
+        )
+        self._validate_participants(dto, validation)
 
-        team2_trainer = self.trainer_repository.get_by_id(dto.team2_trainer_id)
-        if not team2_trainer:
-            raise EntityNotFoundException("Trainer", dto.team2_trainer_id)
+        created_battle = self.battle_repository.create_battle(self._dto_to_battle(dto))
+        self._invalidate_leaderboard()
 
-        winner_trainer = self.trainer_repository.get_by_id(dto.winner_trainer_id)
-        if not winner_trainer:
-            raise EntityNotFoundException("Trainer", dto.winner_trainer_id)
+        return self._battle_response(created_battle, validation)
 
-        team1_size = self.team_repository.get_trainer_team_size(dto.team1_trainer_id)
-        team2_size = self.team_repository.get_trainer_team_size(dto.team2_trainer_id)
-
-        if team1_size == 0:
-            raise BusinessRuleException(
-                f"Trainer {team1_trainer.name} has no Pokemon in their team"
+    def create_battles(
+        self, dtos: list[BattleCreateDTO]
+    ) -> BulkResponseDTO[BattleResponseDTO]:
+        """Validate every row, then insert the valid ones in one transaction."""
+        trainer_ids = {
+            trainer_id
+            for dto in dtos
+            for trainer_id in (
+                dto.team1_trainer_id,
+                dto.team2_trainer_id,
+                dto.winner_trainer_id,
             )
-
-        if team2_size == 0:
-            raise BusinessRuleException(
-                f"Trainer {team2_trainer.name} has no Pokemon in their team"
-            )
-
-        battle = Battle(
-            id=None,
-            team1_trainer_id=dto.team1_trainer_id,
-            team2_trainer_id=dto.team2_trainer_id,
-            winner_trainer_id=dto.winner_trainer_id,
-            team1_strength=dto.team1_strength,
-            team2_strength=dto.team2_strength,
-            victory_margin=dto.victory_margin,
-            battle_date=datetime.utcnow(),
-            battle_details=dto.battle_details,
+        }
+        participants = (
+            self.battle_repository.get_battle_participants(trainer_ids)
+            if trainer_ids
+            else {}
         )
 
-        created_battle = self.battle_repository.create_battle(battle)
+        results: list[BulkRowResultDTO[BattleResponseDTO]] = []
+        accepted: list[tuple[int, dict]] = []
+        battles: list[Battle] = []
+        for index, dto in enumerate(dtos):
+            validation = self._validation_from_participants(dto, participants)
+            try:
+                self._validate_participants(dto, validation)
+            except (BusinessRuleException, EntityNotFoundException) as e:
+                results.append(
+                    BulkRowResultDTO.model_construct(
+                        index=index,
+                        status=BulkRowStatus.FAILED,
+                        data=None,
+                        error=str(e),
+                    )
+                )
+                continue
+            accepted.append((index, validation))
+            battles.append(self._dto_to_battle(dto))
 
-        return BattleResponseDTO(
-            id=created_battle.id or 0,
-            team1_trainer_id=created_battle.team1_trainer_id,
-            team2_trainer_id=created_battle.team2_trainer_id,
-            winner_trainer_id=created_battle.winner_trainer_id,
-            team1_strength=created_battle.team1_strength,
-            team2_strength=created_battle.team2_strength,
-            victory_margin=created_battle.victory_margin,
-            battle_date=created_battle.battle_date,
-            battle_details=created_battle.battle_details,
-            team1_trainer_name=team1_trainer.name,
-            team2_trainer_name=team2_trainer.name,
-            winner_trainer_name=winner_trainer.name,
-        )
+        if battles:
+            created = self.battle_repository.create_battles(battles)
+            self._invalidate_leaderboard()
+            for (index, validation), battle in zip(accepted, created, strict=True):
+                results.append(
+                    BulkRowResultDTO.model_construct(
+                        index=index,
+                        status=BulkRowStatus.CREATED,
+                        data=self._battle_response(battle, validation),
+                        error=None,
+                    )
+                )
+
+        results.sort(key=lambda result: result.index)
+        return BulkResponseDTO.from_results(results)
 
     def get_all_battles(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
     ) -> list[BattleResponseDTO]:
-        battles = self.battle_repository.get_all(skip=skip, limit=limit)
-
-        battle_dtos = []
-        for battle in battles:
-            team1_trainer = self.trainer_repository.get_by_id(battle.team1_trainer_id)
-            team2_trainer = self.trainer_repository.get_by_id(battle.team2_trainer_id)
-            winner_trainer = self.trainer_repository.get_by_id(battle.winner_trainer_id)
-
-            battle_dto = BattleResponseDTO(
-                id=battle.id or 0,
-                team1_trainer_id=battle.team1_trainer_id,
-                team2_trainer_id=battle.team2_trainer_id,
-                winner_trainer_id=battle.winner_trainer_id,
-                team1_strength=battle.team1_strength,
-                team2_strength=battle.team2_strength,
-                victory_margin=battle.victory_margin,
-                battle_date=battle.battle_date,
-                battle_details=battle.battle_details,
-                team1_trainer_name=team1_trainer.name if team1_trainer else None,
-                team2_trainer_name=team2_trainer.name if team2_trainer else None,
-                winner_trainer_name=winner_trainer.name if winner_trainer else None,
-            )
-            battle_dtos.append(battle_dto)
+        battles = self.battle_repository.get_all(skip=skip, limit=limit, query=query)
+        return [self._transform_battle(battle) for battle in battles]
 
-        return battle_dtos
+    def iter_battles(
+        self,
+        chunk_size: int = 500,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> Iterator[list[BattleResponseDTO]]:
+        # Validated here, before the caller starts streaming the chunks.
+        if date_from is not None and date_to is not None and date_from > date_to:
+            raise BusinessRuleException("date_from cannot be after date_to")
+
+        chunks = self.battle_repository.iter_battles(chunk_size, date_from, date_to)
+        return (
+            [self._transform_battle(battle) for battle in chunk] for chunk in chunks
+        )
+
+    def count_battles(self, exact: bool = False, query: ListQuery | None = None) -> int:
+        return self.battle_repository.count(exact=exact, query=query)
 
     def get_trainer_battles(self, trainer_id: int) -> list[BattleResponseDTO]:
         trainer = self.trainer_repository.get_by_id(trainer_id)
@@ -114,36 +131,32 @@ class BattleService:
             raise EntityNotFoundException("Trainer", trainer_id)
 
         battles = self.battle_repository.get_battles_by_trainer(trainer_id)
+        return [self._transform_battle(battle) for battle in battles]
 
-        battle_dtos = []
-        for battle in battles:
-            team1_trainer = self.trainer_repository.get_by_id(battle.team1_trainer_id)
-            team2_trainer = self.trainer_repository.get_by_id(battle.team2_trainer_id)
-            winner_trainer = self.trainer_repository.get_by_id(battle.winner_trainer_id)
-
-            battle_dto = BattleResponseDTO(
-                id=battle.id or 0,
-                team1_trainer_id=battle.team1_trainer_id,
-                team2_trainer_id=battle.team2_trainer_id,
-                winner_trainer_id=battle.winner_trainer_id,
-                team1_strength=battle.team1_strength,
-                team2_strength=battle.team2_strength,
-                victory_margin=battle.victory_margin,
-                battle_date=battle.battle_date,
-                battle_details=battle.battle_details,
-                team1_trainer_name=team1_trainer.name if team1_trainer else None,
-                team2_trainer_name=team2_trainer.name if team2_trainer else None,
-                winner_trainer_name=winner_trainer.name if winner_trainer else None,
-            )
-            battle_dtos.append(battle_dto)
+    def get_trainer_stats(self, trainer_id: int) -> TrainerBattleStatsDTO:
+        stats = self.battle_repository.get_trainer_battle_stats(trainer_id)
+        if stats["trainer_name"] is None:
+            raise EntityNotFoundException("Trainer", trainer_id)
 
-        return battle_dtos
+        return TrainerBattleStatsDTO(**stats)
 
-    def get_leaderboard(self) -> LeaderboardResponseDTO:
-        leaderboard_data = self.battle_repository.get_leaderboard_data()
+    def get_leaderboard(
+        self, skip: int = 0, limit: int = 100
+    ) -> LeaderboardResponseDTO:
+        if self.leaderboard_flight is None:
+            return self._build_leaderboard(skip, limit)
+        return self.leaderboard_flight.do(
+            ("leaderboard", skip, limit),
+            lambda: self._build_leaderboard(skip, limit),
+        )
+
+    def _build_leaderboard(self, skip: int, limit: int) -> LeaderboardResponseDTO:
+        leaderboard_data = self.battle_repository.get_leaderboard_data(
+            skip=skip, limit=limit
+        )
 
         leaderboard_entries = [
-            LeaderboardEntryDTO(
+            LeaderboardEntryDTO.model_construct(
                 trainer_id=entry["trainer_id"],
                 trainer_name=entry["trainer_name"],
                 wins=entry["wins"],
@@ -154,12 +167,12 @@ class BattleService:
             for entry in leaderboard_data
         ]
 
-        total_battles = sum(entry.total_battles for entry in leaderboard_entries) // 2
+        totals = self.battle_repository.get_leaderboard_totals()
 
         return LeaderboardResponseDTO(
             leaderboard=leaderboard_entries,
-            total_trainers=len(leaderboard_entries),
-            total_battles=total_battles,
+            total_trainers=totals["ranked_trainers"],
+            total_battles=totals["recorded_battles"],
         )
 
     def delete_battle(self, battle_id: int) -> bool:
@@ -167,4 +180,103 @@ class BattleService:
         if not battle:
             raise EntityNotFoundException("Battle", battle_id)
 
-        return bool(self.battle_repository.delete_battle(battle_id))
+        deleted = bool(self.battle_repository.delete_battle(battle_id))
+        if deleted:
+            self._invalidate_leaderboard()
+        return deleted
+
+    def _transform_battle(self, battle: Battle) -> BattleResponseDTO:
+        team1_trainer = self.trainer_repository.get_by_id(battle.team1_trainer_id)
+        team2_trainer = self.trainer_repository.get_by_id(battle.team2_trainer_id)
+        winner_trainer = self.trainer_repository.get_by_id(battle.winner_trainer_id)
+
+        return BattleResponseDTO.model_construct(
+            id=battle.id or 0,
+            team1_trainer_id=battle.team1_trainer_id,
+            team2_trainer_id=battle.team2_trainer_id,
+            winner_trainer_id=battle.winner_trainer_id,
+            team1_strength=battle.team1_strength,
+            team2_strength=battle.team2_strength,
+            victory_margin=battle.victory_margin,
+            battle_date=battle.battle_date,
+            battle_details=battle.battle_details,
+            team1_trainer_name=team1_trainer.name if team1_trainer else None,
+            team2_trainer_name=team2_trainer.name if team2_trainer else None,
+            winner_trainer_name=winner_trainer.name if winner_trainer else None,
+        )
+
+    @staticmethod
+    def _validation_from_participants(
+        dto: BattleCreateDTO, participants: dict[int, dict]
+    ) -> dict:
+        """Shape batched participant data like ``get_battle_validation_data``."""
+        unknown = {"trainer_name": None, "team_size": 0}
+        team1 = participants.get(dto.team1_trainer_id, unknown)
+        team2 = participants.get(dto.team2_trainer_id, unknown)
+        winner = participants.get(dto.winner_trainer_id, unknown)
+        return {
+            "team1_trainer_name": team1["trainer_name"],
+            "team2_trainer_name": team2["trainer_name"],
+            "winner_trainer_name": winner["trainer_name"],
+            "team1_size": team1["team_size"],
+            "team2_size": team2["team_size"],
+        }
+
+    @staticmethod
+    def _validate_participants(dto: BattleCreateDTO, validation: dict) -> None:
+        team1_trainer_name = validation["team1_trainer_name"]
+        team2_trainer_name = validation["team2_trainer_name"]
+
+        if team1_trainer_name is None:
+            raise EntityNotFoundException("Trainer", dto.team1_trainer_id)
+
+        if team2_trainer_name is None:
+            raise EntityNotFoundException("Trainer", dto.team2_trainer_id)
+
+        if validation["winner_trainer_name"] is None:
+            raise EntityNotFoundException("Trainer", dto.winner_trainer_id)
+
+        if validation["team1_size"] == 0:
+            raise BusinessRuleException(
+                f"Trainer {team1_trainer_name} has no Pokemon in their team"
+            )
+
+        if validation["team2_size"] == 0:
+            raise BusinessRuleException(
+                f"Trainer {team2_trainer_name} has no Pokemon in their team"
+            )
+
+    @staticmethod
+    def _dto_to_battle(dto: BattleCreateDTO) -> Battle:
+        return Battle(
+            id=None,
+            team1_trainer_id=dto.team1_trainer_id,
+            team2_trainer_id=dto.team2_trainer_id,
+            winner_trainer_id=dto.winner_trainer_id,
+            team1_strength=dto.team1_strength,
+            team2_strength=dto.team2_strength,
+            victory_margin=dto.victory_margin,
+            battle_date=datetime.utcnow(),
+            battle_details=dto.battle_details,
+        )
+
+    @staticmethod
+    def _battle_response(battle: Battle, validation: dict) -> BattleResponseDTO:
+        return BattleResponseDTO(
+            id=battle.id or 0,
+            team1_trainer_id=battle.team1_trainer_id,
+            team2_trainer_id=battle.team2_trainer_id,
+            winner_trainer_id=battle.winner_trainer_id,
+            team1_strength=battle.team1_strength,
+            team2_strength=battle.team2_strength,
+            victory_margin=battle.victory_margin,
+            battle_date=battle.battle_date,
+            battle_details=battle.battle_details,
+            team1_trainer_name=validation["team1_trainer_name"],
+            team2_trainer_name=validation["team2_trainer_name"],
+            winner_trainer_name=validation["winner_trainer_name"],
+        )
+
+    def _invalidate_leaderboard(self) -> None:
+        if self.leaderboard_flight is not None:
+            self.leaderboard_flight.invalidate()
@@ -0,0 +1,52 @@
+from src.application.dtos.battle_dto import LeaderboardEntryDTO
+from src.application.dtos.dashboard_dto import DashboardStatsDTO
+from src.application.services.aggregate_refresher import AggregateRefresher
+from src.domain.repositories.item_repository import ItemRepository
+from src.domain.repositories.pokemon_repository import PokemonRepository
+from src.domain.repositories.trainer_repository import TrainerRepository
+
+COUNTS = "counts"
+AVERAGE_LEVEL = "average_level"
+TOP_TRAINERS = "top_trainers"
+
+
+class DashboardService:
+    """Dashboard figures: computed by the refresher, read from its snapshots."""
+
+    def __init__(
+        self,
+        trainer_repository: TrainerRepository,
+        pokemon_repository: PokemonRepository,
+        item_repository: ItemRepository,
+    ):
+        self.trainer_repository = trainer_repository
+        self.pokemon_repository = pokemon_repository
+        self.item_repository = item_repository
+
+    def compute_counts(self) -> dict[str, int]:
+        return {
+            "trainers_count": self.trainer_repository.count(exact=True),
+            "pokemon_count": self.pokemon_repository.count(exact=True),
+            "items_count": self.item_repository.count(exact=True),
+        }
+
+    def compute_average_level(self) -> float:
+        return self.pokemon_repository.get_average_level()
+
+    @staticmethod
+    def read(refresher: AggregateRefresher) -> DashboardStatsDTO:
+        """Assemble the latest snapshots without touching the database."""
+        counts = refresher.get(COUNTS)
+        average_level = refresher.get(AVERAGE_LEVEL)
+        top_trainers = refresher.get(TOP_TRAINERS)
+
+        snapshots = [counts, average_level, top_trainers]
+        ages = [snapshot.age_seconds for snapshot in snapshots if snapshot]
+        top: list[LeaderboardEntryDTO] = top_trainers.value if top_trainers else []
+
+        return DashboardStatsDTO(
+            **(counts.value if counts else {}),
+            average_level=average_level.value if average_level else None,
+            top_trainers=top,
+            age_seconds=round(max(ages), 3) if ages else None,
+        )
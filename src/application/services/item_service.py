@@ -3,6 +3,7 @@ from src.application.services.base_service import BaseService
 from src.domain.entities.item import Item
 from src.domain.exceptions import BusinessRuleException
 from src.domain.repositories.item_repository import ItemRepository
+from src.domain.repositories.list_query import ListQuery
 
 
 class ItemService(BaseService[Item, ItemCreateDTO, ItemUpdateDTO, ItemResponseDTO]):
@@ -16,8 +17,10 @@ class ItemService(BaseService[Item, ItemCreateDTO, ItemUpdateDTO, ItemResponseDT
     def get_item(self, item_id: int) -> ItemResponseDTO | None:
         return self.get_by_id(item_id)
 
-    def get_all_items(self, skip: int = 0, limit: int = 100) -> list[ItemResponseDTO]:
-        return self.get_all(skip, limit)
+    def get_all_items(
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
+    ) -> list[ItemResponseDTO]:
+        return self.get_all(skip, limit, query)
 
     def update_item(self, item_id: int, dto: ItemUpdateDTO) -> ItemResponseDTO | None:
         return self.update(item_id, dto)
@@ -29,6 +32,14 @@ class ItemService(BaseService[Item, ItemCreateDTO, ItemUpdateDTO, ItemResponseDT
         items = self.item_repository.get_by_type(item_type)
         return [self._transform_to_response_dto(item) for item in items]
 
+    def get_items_by_price_range(
+        self, min_price: int, max_price: int
+    ) -> list[ItemResponseDTO]:
+        if min_price > max_price:
+            raise BusinessRuleException("min_price cannot be greater than max_price")
+        items = self.item_repository.get_by_price_range(min_price, max_price)
+        return [self._transform_to_response_dto(item) for item in items]
+
     def _validate_business_rules_for_creation(self, dto: ItemCreateDTO) -> None:
         if dto.price < 0:
             raise BusinessRuleException("Item price cannot be negative")
@@ -53,7 +64,8 @@ class ItemService(BaseService[Item, ItemCreateDTO, ItemUpdateDTO, ItemResponseDT
         )
 
     def _transform_to_response_dto(self, item: Item) -> ItemResponseDTO:
-        return ItemResponseDTO(
+        # Entities come from our own rows; skip re-validating them.
+        return ItemResponseDTO.model_construct(
             id=item.id,
             name=item.name,
             type=item.type.value,
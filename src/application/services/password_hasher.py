@@ -0,0 +1,109 @@
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from threading import BoundedSemaphore, Lock
+
+from passlib.context import CryptContext
+
+
+class PasswordHasherBusyError(Exception):
+    """Every hashing slot is taken; the caller should retry later."""
+
+
+class PasswordHasher:
+    """bcrypt hashing and verification off the request threads.
+
+    With ``max_workers`` above zero the work runs in a process pool, so a
+    burst of logins burns at most that many cores instead of one per request
+    thread. At most ``max_queue`` more calls wait for a worker, which also
+    bounds the request threads parked on hashing; beyond that
+    :class:`PasswordHasherBusyError` is raised at once. ``max_workers=0``
+    hashes on the calling thread.
+
+    Hashes with a cost other than ``rounds`` still verify and are reported as
+    needing an update, so they are upgraded on the next successful login.
+    """
+
+    def __init__(self, rounds: int, max_workers: int = 0, max_queue: int = 0):
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.rejected = 0
+        self._slots = BoundedSemaphore(max(max_workers, 1) + max_queue)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+
+    def hash(self, password: str) -> str:
+        return self._submit(_hash, password, self.rounds)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._submit(_verify, password, hashed_password, self.rounds)
+
+    def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Verify, and rehash with the current rounds if the hash is outdated."""
+        return self._submit(_verify_and_update, password, hashed_password, self.rounds)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "rounds": self.rounds,
+            "workers": self.max_workers,
+            "rejected": self.rejected,
+        }
+
+    def _submit[T](self, function: Callable[..., T], *args: object) -> T:
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise PasswordHasherBusyError("Too many password checks in progress")
+        try:
+            if self.max_workers == 0:
+                return function(*args)
+            return self._get_executor().submit(function, *args).result()
+        finally:
+            self._slots.release()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Forking a process that runs threads is unsafe; start clean.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+
+@cache
+def _crypt_context(rounds: int) -> CryptContext:
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+# Module-level so that the process pool can pickle them.
+def _hash(password: str, rounds: int) -> str:
+    return str(_crypt_context(rounds).hash(password))
+
+
+def _verify(password: str, hashed_password: str, rounds: int) -> bool:
+    return bool(_crypt_context(rounds).verify(password, hashed_password))
+
+
+def _verify_and_update(
+    password: str, hashed_password: str, rounds: int
+) -> tuple[bool, str | None]:
+    verified, new_hash = _crypt_context(rounds).verify_and_update(
+        password, hashed_password
+    )
+    return bool(verified), new_hash
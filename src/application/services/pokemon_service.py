@@ -1,3 +1,6 @@
+from collections.abc import Collection
+from typing import Any
+
 from src.application.dtos.pokemon_dto import (
     PokemonCreateDTO,
     PokemonResponseDTO,
@@ -6,6 +9,7 @@ from src.application.dtos.pokemon_dto import (
 from src.application.services.base_service import BaseService
 from src.domain import BusinessRuleException
 from src.domain.entities.pokemon import Pokemon
+from src.domain.repositories.list_query import ListQuery
 from src.domain.repositories.pokemon_repository import PokemonRepository
 
 
@@ -14,6 +18,7 @@ class PokemonService(
 ):
     def __init__(self, pokemon_repository: PokemonRepository):
         super().__init__(pokemon_repository)
+        self.pokemon_repository = pokemon_repository
 
     def create_pokemon(self, dto: PokemonCreateDTO) -> PokemonResponseDTO:
         return self.create(dto)
@@ -22,9 +27,35 @@ class PokemonService(
         return self.get_by_id(pokemon_id)
 
     def get_all_pokemon(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
     ) -> list[PokemonResponseDTO]:
-        return self.get_all(skip, limit)
+        return self.get_all(skip, limit, query)
+
+    def get_pokemon_versions(
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
+    ) -> list[tuple[int, int]]:
+        return self.pokemon_repository.get_row_versions(skip, limit, query)
+
+    def get_pokemon_by_ids(self, pokemon_ids: list[int]) -> list[PokemonResponseDTO]:
+        pokemon = self.pokemon_repository.get_by_ids(pokemon_ids)
+        return [self._transform_to_response_dto(entity) for entity in pokemon]
+
+    def get_pokemon_fields(
+        self,
+        fields: Collection[str],
+        skip: int = 0,
+        limit: int = 100,
+        query: ListQuery | None = None,
+    ) -> list[dict[str, Any]]:
+        """Page of pokemon with only ``fields``, read from only those columns."""
+        columns = self._select_fields(fields, PokemonResponseDTO)
+        return self.pokemon_repository.get_projection(columns, skip, limit, query)
+
+    def get_pokemon_fields_by_id(
+        self, pokemon_id: int, fields: Collection[str]
+    ) -> dict[str, Any] | None:
+        columns = self._select_fields(fields, PokemonResponseDTO)
+        return self.pokemon_repository.get_projection_by_id(pokemon_id, columns)
 
     def update_pokemon(
         self, pokemon_id: int, pokemon_dto: PokemonUpdateDTO
@@ -127,7 +158,8 @@ class PokemonService(
         )
 
     def _transform_to_response_dto(self, pokemon: Pokemon) -> PokemonResponseDTO:
-        return PokemonResponseDTO(
+        # Entities come from our own rows; skip re-validating them.
+        return PokemonResponseDTO.model_construct(
             id=pokemon.id,
             name=pokemon.name,
             type_primary=pokemon.type_primary.value,
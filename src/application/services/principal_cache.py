@@ -0,0 +1,69 @@
+from collections import OrderedDict
+from dataclasses import replace
+from threading import Lock
+from time import monotonic, time
+
+from src.domain.entities.user import User
+
+
+class PrincipalCache:
+    """Short-lived map of (user id, bearer token) to the authenticated user.
+
+    Entries live for ``ttl_seconds`` or until the token expires, whichever is
+    sooner, so a cached principal can never outlive its token. Anything that
+    changes a user's credentials or status must call :meth:`invalidate_user`.
+    Users are copied in and out, so no request can change another's principal.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 4096):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[int, str], tuple[float, User]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, user_id: int, token: str) -> User | None:
+        key = (user_id, token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return replace(entry[1])
+
+    def put(
+        self, user_id: int, token: str, user: User, token_expires_at: float | None
+    ) -> None:
+        lifetime = self.ttl_seconds
+        if token_expires_at is not None:
+            lifetime = min(lifetime, token_expires_at - time())
+        if lifetime <= 0 or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[(user_id, token)] = (monotonic() + lifetime, replace(user))
+            self._entries.move_to_end((user_id, token))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
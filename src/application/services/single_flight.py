@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Event, Lock
+from time import monotonic
+
+
+class _Call[ResultT]:
+    """One in-flight computation that concurrent callers wait on."""
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: ResultT | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight[ResultT]:
+    """Coalesce concurrent computations of the same key into one.
+
+    Results are kept for ``ttl_seconds``. The first caller past that
+    recomputes synchronously; for a further ``stale_ttl_seconds`` callers
+    arriving while it runs get the expired result instead of waiting. Past
+    that window, or on a cold key, everyone arriving during the computation
+    waits for its result instead of issuing the same query.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 0.0,
+        stale_ttl_seconds: float = 0.0,
+        max_entries: int = 256,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries: OrderedDict[Hashable, tuple[float, ResultT]] = OrderedDict()
+        self._calls: dict[Hashable, _Call[ResultT]] = {}
+        self._generation = 0
+        self._lock = Lock()
+
+    def do(self, key: Hashable, compute: Callable[[], ResultT]) -> ResultT:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = monotonic() - entry[0]
+                if age < self.ttl_seconds:
+                    self.hits += 1
+                    return entry[1]
+                revalidating = key in self._calls
+                if revalidating and age < self.ttl_seconds + self.stale_ttl_seconds:
+                    self.stale_hits += 1
+                    return entry[1]
+
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                self.misses += 1
+                call = self._calls[key] = _Call()
+                leader = True
+            generation = self._generation
+
+        if leader:
+            return self._run(key, call, compute, generation)
+        return self._wait(call)
+
+    def _wait(self, call: _Call[ResultT]) -> ResultT:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result  # type: ignore[return-value]
+
+    def _run(
+        self,
+        key: Hashable,
+        call: _Call[ResultT],
+        compute: Callable[[], ResultT],
+        generation: int,
+    ) -> ResultT:
+        try:
+            call.result = compute()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                # A result computed across an invalidate() may predate the write.
+                if call.error is None and generation == self._generation:
+                    self._store(key, call.result)  # type: ignore[arg-type]
+            call.done.set()
+        return call.result
+
+    def _store(self, key: Hashable, result: ResultT) -> None:
+        self._entries[key] = (monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every cached result; in-flight computations are not stored."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+            }
@@ -31,7 +31,8 @@ class TeamService:
         if not pokemon:
             raise EntityNotFoundException("Pokemon", dto.pokemon_id)
 
-        self._validate_add_pokemon_rules(dto)
+        team_members = self.team_repository.get_team_by_trainer(dto.trainer_id)
+        self._validate_add_pokemon_rules(dto, team_members)
 
         team_entry = Team(
             id=None,
@@ -62,13 +63,15 @@ class TeamService:
     def update_pokemon_position(
         self, trainer_id: int, pokemon_id: int, dto: TeamUpdatePositionDTO
     ) -> TeamResponseDTO:
-        team_member = self.team_repository.get_team_member(trainer_id, pokemon_id)
-        if not team_member:
+        team_members = self.team_repository.get_team_by_trainer(trainer_id)
+        if not any(member.pokemon_id == pokemon_id for member in team_members):
             raise BusinessRuleException(
                 f"Pokemon {pokemon_id} is not in trainer {trainer_id}'s team"
             )
 
-        self._validate_position_available(trainer_id, dto.new_position, pokemon_id)
+        self._validate_position_available(
+            team_members, trainer_id, dto.new_position, pokemon_id
+        )
         self.team_repository.update_position(trainer_id, pokemon_id, dto.new_position)
         return self.get_trainer_team(trainer_id)
 
@@ -102,26 +105,26 @@ class TeamService:
             members=member_dtos,
         )
 
-    def _validate_add_pokemon_rules(self, dto: TeamAddPokemonDTO) -> None:
-        current_size = self.team_repository.get_trainer_team_size(dto.trainer_id)
-        if current_size >= 6:
+    def _validate_add_pokemon_rules(
+        self, dto: TeamAddPokemonDTO, team_members: list[Team]
+    ) -> None:
+        if len(team_members) >= 6:
             raise BusinessRuleException("Maximum 6 Pokemon per team")
 
-        existing_member = self.team_repository.get_team_member(
-            dto.trainer_id, dto.pokemon_id
-        )
-        if existing_member:
+        if any(member.pokemon_id == dto.pokemon_id for member in team_members):
             raise BusinessRuleException(
                 f"Pokemon {dto.pokemon_id} is already in trainer {dto.trainer_id}'s team"
             )
 
-        self._validate_position_available(dto.trainer_id, dto.position)
+        self._validate_position_available(team_members, dto.trainer_id, dto.position)
 
     def _validate_position_available(
-        self, trainer_id: int, position: int, exclude_pokemon_id: int | None = None
+        self,
+        team_members: list[Team],
+        trainer_id: int,
+        position: int,
+        exclude_pokemon_id: int | None = None,
     ) -> None:
-        team_members = self.team_repository.get_team_by_trainer(trainer_id)
-
         for member in team_members:
             if member.position == position and member.pokemon_id != exclude_pokemon_id:
                 raise BusinessRuleException(
@@ -0,0 +1,78 @@
+from threading import Lock
+from time import monotonic
+
+from src.domain.repositories.user_repository import UserRepository
+
+
+class TokenRevocationList:
+    """Process-local set of users whose older access tokens are revoked.
+
+    Holds the lowest valid token version of every user that ever revoked
+    tokens, and ``None`` for inactive users, so checking a token touches no
+    table. The set is reloaded when it is ``refresh_interval_seconds`` old or
+    after :meth:`mark_stale`, e.g. when another worker wrote the users table.
+    Revocations made by this process apply at once through :meth:`revoke`.
+    """
+
+    def __init__(self, refresh_interval_seconds: float):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.refreshes = 0
+        self._revoked: dict[int, int | None] = {}
+        self._loaded_at: float | None = None
+        self._generation = 0
+        # Revocations made while a reload runs, which it may not have seen.
+        self._revoked_during_refresh: dict[int, int | None] | None = None
+        self._lock = Lock()
+        self._refresh_lock = Lock()
+
+    def is_revoked(self, user_id: int, token_version: int) -> bool:
+        with self._lock:
+            if user_id not in self._revoked:
+                return False
+            min_version = self._revoked[user_id]
+        return min_version is None or token_version < min_version
+
+    def needs_refresh(self) -> bool:
+        loaded_at = self._loaded_at
+        return (
+            loaded_at is None
+            or monotonic() - loaded_at >= self.refresh_interval_seconds
+        )
+
+    def refresh(self, repository: UserRepository) -> None:
+        """Reload from the database unless another thread just did."""
+        with self._refresh_lock:
+            if not self.needs_refresh():
+                return
+            loaded_at = monotonic()
+            with self._lock:
+                generation = self._generation
+                self._revoked_during_refresh = {}
+            try:
+                revoked = repository.get_revoked_tokens()
+            finally:
+                with self._lock:
+                    during_refresh = self._revoked_during_refresh or {}
+                    self._revoked_during_refresh = None
+            with self._lock:
+                self._revoked = revoked | during_refresh
+                # Marked stale mid-load: the next check reloads again.
+                if generation == self._generation:
+                    self._loaded_at = loaded_at
+                self.refreshes += 1
+
+    def revoke(self, user_id: int, min_version: int | None) -> None:
+        """Revoke tokens below ``min_version``, or all of them for ``None``."""
+        with self._lock:
+            self._revoked[user_id] = min_version
+            if self._revoked_during_refresh is not None:
+                self._revoked_during_refresh[user_id] = min_version
+
+    def mark_stale(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._loaded_at = None
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._revoked), "refreshes": self.refreshes}
@@ -1,3 +1,6 @@
+from collections.abc import Collection
+from typing import Any
+
 from src.application.dtos.trainer_dto import (
     PokemonSummaryDTO,
     TrainerCreateDTO,
@@ -6,10 +9,14 @@ from src.application.dtos.trainer_dto import (
 )
 from src.application.services.base_service import BaseService
 from src.domain.entities.trainer import Trainer
+from src.domain.repositories.list_query import ListQuery
 from src.domain.repositories.pokemon_repository import PokemonRepository
 from src.domain.repositories.team_repository import TeamRepository
 from src.domain.repositories.trainer_repository import TrainerRepository
 
+# Response fields stored on the trainers table; the rest are built from teams.
+TRAINER_COLUMNS = frozenset({"id", "name", "gender", "region"})
+
 
 class TrainerService(
     BaseService[Trainer, TrainerCreateDTO, TrainerUpdateDTO, TrainerResponseDTO]
@@ -21,6 +28,7 @@ class TrainerService(
         pokemon_repository: PokemonRepository | None = None,
     ):
         super().__init__(trainer_repository)
+        self.trainer_repository = trainer_repository
         self.team_repository = team_repository
         self.pokemon_repository = pokemon_repository
 
@@ -31,9 +39,36 @@ class TrainerService(
         return self.get_by_id(trainer_id)
 
     def get_all_trainers(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
     ) -> list[TrainerResponseDTO]:
-        return self.get_all(skip, limit)
+        return self.get_all(skip, limit, query)
+
+    def get_trainers_fields(
+        self,
+        fields: Collection[str],
+        skip: int = 0,
+        limit: int = 100,
+        query: ListQuery | None = None,
+    ) -> list[dict[str, Any]]:
+        """Page of trainers with only ``fields``.
+
+        Only the requested columns are read, and team data is only loaded
+        when ``team_size`` or ``pokemon_team`` is requested.
+        """
+        selected = self._select_fields(fields, TrainerResponseDTO)
+        rows = self.trainer_repository.get_projection(
+            self._projection_columns(selected), skip, limit, query
+        )
+        return [self._project_trainer(row, selected) for row in rows]
+
+    def get_trainer_fields_by_id(
+        self, trainer_id: int, fields: Collection[str]
+    ) -> dict[str, Any] | None:
+        selected = self._select_fields(fields, TrainerResponseDTO)
+        row = self.trainer_repository.get_projection_by_id(
+            trainer_id, self._projection_columns(selected)
+        )
+        return self._project_trainer(row, selected) if row is not None else None
 
     def update_trainer(
         self, trainer_id: int, trainer_dto: TrainerUpdateDTO
@@ -52,16 +87,29 @@ class TrainerService(
         )
 
     def _transform_to_response_dto(self, trainer: Trainer) -> TrainerResponseDTO:
-        pokemon_team = []
+        pokemon_team = self._build_pokemon_team(trainer.id)
+
+        # Entities come from our own rows; skip re-validating them.
+        return TrainerResponseDTO.model_construct(
+            id=trainer.id,
+            name=trainer.name,
+            gender=trainer.gender.value,
+            region=trainer.region.value,
+            team_size=len(pokemon_team),
+            pokemon_team=pokemon_team,
+        )
+
+    def _build_pokemon_team(self, trainer_id: int | None) -> list[PokemonSummaryDTO]:
+        pokemon_team: list[PokemonSummaryDTO] = []
 
-        if self.team_repository and self.pokemon_repository and trainer.id:
-            team_members = self.team_repository.get_team_by_trainer(trainer.id)
+        if self.team_repository and self.pokemon_repository and trainer_id:
+            team_members = self.team_repository.get_team_by_trainer(trainer_id)
 
             for team_member in team_members:
                 pokemon = self.pokemon_repository.get_by_id(team_member.pokemon_id)
                 if pokemon and pokemon.id is not None:
                     pokemon_team.append(
-                        PokemonSummaryDTO(
+                        PokemonSummaryDTO.model_construct(
                             id=pokemon.id,
                             name=pokemon.name,
                             type_primary=pokemon.type_primary.value,
@@ -69,14 +117,33 @@ class TrainerService(
                         )
                     )
 
-        return TrainerResponseDTO(
-            id=trainer.id,
-            name=trainer.name,
-            gender=trainer.gender.value,
-            region=trainer.region.value,
-            team_size=len(pokemon_team),
-            pokemon_team=pokemon_team,
-        )
+        return pokemon_team
+
+    @staticmethod
+    def _projection_columns(selected: list[str]) -> list[str]:
+        # The id is always read: team data is looked up by it.
+        return ["id", *(name for name in selected if name in TRAINER_COLUMNS - {"id"})]
+
+    def _project_trainer(
+        self, row: dict[str, Any], selected: list[str]
+    ) -> dict[str, Any]:
+        computed: dict[str, Any] = {}
+        if "pokemon_team" in selected:
+            pokemon_team = self._build_pokemon_team(row["id"])
+            computed["pokemon_team"] = [
+                summary.model_dump() for summary in pokemon_team
+            ]
+            computed["team_size"] = len(pokemon_team)
+        elif "team_size" in selected:
+            # The size alone needs the team rows, not the pokemon behind them.
+            computed["team_size"] = (
+                len(self.team_repository.get_team_by_trainer(row["id"]))
+                if self.team_repository and self.pokemon_repository
+                else 0
+            )
+        return {
+            name: computed[name] if name in computed else row[name] for name in selected
+        }
 
     def _apply_update_dto(
         self, existing_trainer: Trainer, dto: TrainerUpdateDTO
@@ -19,5 +19,62 @@ class Settings(BaseSettings):
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    ENTITY_CACHE_ENABLED: bool = True
+    ENTITY_CACHE_MAX_SIZE: int = 1024
+    ENTITY_CACHE_TTL_SECONDS: float = 60.0
+    ITEM_CATALOG_ENABLED: bool = True
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+    # Build the principal from verified token claims instead of the users table.
+    JWT_STATELESS_PRINCIPAL: bool = True
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = 30.0
+
+    # Existing hashes with another cost are upgraded on the next login.
+    BCRYPT_ROUNDS: int = 12
+    # 0 hashes on the request thread instead of in worker processes.
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 8
+
+    FRAGMENT_CACHE_MAX_ENTRIES: int = 10_000
+
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 0
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    RESPONSE_CACHE_MAX_ENTRY_BYTES: int = 1024 * 1024
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+
+    LEADERBOARD_CACHE_TTL_SECONDS: float = 5.0
+    LEADERBOARD_STALE_TTL_SECONDS: float = 30.0
+
+    DASHBOARD_REFRESH_INTERVAL_SECONDS: float = 60.0
+    DASHBOARD_MIN_REFRESH_SECONDS: float = 2.0
+    DASHBOARD_TOP_TRAINERS: int = 5
+
+    EXPORT_CHUNK_SIZE: int = 500
+
+    BULK_MAX_ROWS: int = 5000
+
+    BATCH_MAX_REQUESTS: int = 50
+    BATCH_MAX_CONCURRENCY: int = 8
+
+    # Slots per route class; together they stay within the 40 threads of the
+    # default threadpool so admitted requests do not queue again there.
+    LOAD_SHEDDING_ENABLED: bool = True
+    LOAD_SHEDDING_READ_LIMIT: int = 24
+    LOAD_SHEDDING_READ_QUEUE: int = 200
+    LOAD_SHEDDING_AGGREGATE_LIMIT: int = 4
+    LOAD_SHEDDING_AGGREGATE_QUEUE: int = 20
+    LOAD_SHEDDING_WRITE_LIMIT: int = 8
+    LOAD_SHEDDING_WRITE_QUEUE: int = 100
+    LOAD_SHEDDING_AUTH_LIMIT: int = 4
+    LOAD_SHEDDING_AUTH_QUEUE: int = 20
+    LOAD_SHEDDING_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    LOAD_SHEDDING_RETRY_AFTER_SECONDS: int = 1
+
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_TTL_SECONDS: int = 24 * 60 * 60
+    # How long an unfinished request holds its key; a few request timeouts.
+    IDEMPOTENCY_LEASE_SECONDS: int = 60
+    IDEMPOTENCY_PURGE_BATCH_SIZE: int = 100
+
 
 settings = Settings()
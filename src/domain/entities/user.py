@@ -13,3 +13,5 @@ class User:
     created_at: datetime | None = None
     updated_at: datetime | None = None
     trainer_id: int | None = None
+    # Bumped to revoke every access token issued before.
+    token_version: int = 0
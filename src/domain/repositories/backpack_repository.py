@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 
 from src.domain.repositories.base_repository import BaseRepository
 
@@ -10,6 +11,10 @@ class BackpackRepository(BaseRepository[Backpack], ABC):
     def add_item(self, backpack: Backpack) -> Backpack:
         pass
 
+    @abstractmethod
+    def add_items(self, backpacks: list[Backpack]) -> list[Backpack]:
+        pass
+
     @abstractmethod
     def remove_item(self, trainer_id: int, item_id: int, quantity: int) -> bool:
         pass
@@ -22,6 +27,12 @@ class BackpackRepository(BaseRepository[Backpack], ABC):
     def get_item_quantity(self, trainer_id: int, item_id: int) -> int:
         pass
 
+    @abstractmethod
+    def get_item_quantities(
+        self, pairs: Collection[tuple[int, int]]
+    ) -> dict[tuple[int, int], int]:
+        pass
+
     @abstractmethod
     def update_quantity(
         self, trainer_id: int, item_id: int, new_quantity: int
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import TypeVar
 
 from src.domain.protocols.entity_protocol import EntityProtocol
+from src.domain.repositories.list_query import ListQuery
 
 EntityType = TypeVar("EntityType", bound=EntityProtocol)
 
@@ -13,13 +15,19 @@ class BaseRepository[EntityType: EntityProtocol](ABC):
     def create(self, entity: EntityType) -> EntityType:
         """Create a new entity."""
 
+    @abstractmethod
+    def create_many(self, entities: list[EntityType]) -> list[EntityType]:
+        """Create ``entities`` in one transaction, returned in the same order."""
+
     @abstractmethod
     def get_by_id(self, entity_id: int) -> EntityType | None:
         """Get entity by ID."""
 
     @abstractmethod
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[EntityType]:
-        """Get all entities with pagination."""
+    def get_all(
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
+    ) -> list[EntityType]:
+        """Get all entities with pagination, filtered and sorted by ``query``."""
 
     @abstractmethod
     def update(self, entity_id: int, entity: EntityType) -> EntityType | None:
@@ -28,3 +36,11 @@ class BaseRepository[EntityType: EntityProtocol](ABC):
     @abstractmethod
     def delete(self, entity_id: int) -> bool:
         """Delete an entity by ID."""
+
+    @abstractmethod
+    def count(self, exact: bool = False, query: ListQuery | None = None) -> int:
+        """Count entities matching ``query``; ``exact`` bypasses any cached total."""
+
+    @abstractmethod
+    def iter_chunks(self, chunk_size: int = 500) -> Iterator[list[EntityType]]:
+        """Iterate over every entity in ID order, ``chunk_size`` at a time."""
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Iterator
+from datetime import datetime
 
 from src.domain.repositories.base_repository import BaseRepository
 
@@ -10,10 +12,34 @@ class BattleRepository(BaseRepository[Battle], ABC):
     def create_battle(self, battle: Battle) -> Battle:
         pass
 
+    @abstractmethod
+    def create_battles(self, battles: list[Battle]) -> list[Battle]:
+        pass
+
+    @abstractmethod
+    def get_battle_participants(self, trainer_ids: Collection[int]) -> dict[int, dict]:
+        pass
+
+    @abstractmethod
+    def get_battle_validation_data(
+        self, team1_trainer_id: int, team2_trainer_id: int, winner_trainer_id: int
+    ) -> dict:
+        pass
+
     @abstractmethod
     def get_battles_by_trainer(self, trainer_id: int) -> list[Battle]:
         pass
 
+    @abstractmethod
+    def iter_battles(
+        self,
+        chunk_size: int = 500,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> Iterator[list[Battle]]:
+        """Like ``iter_chunks``, limited to battles fought in [date_from, date_to]."""
+        pass
+
     @abstractmethod
     def get_trainer_wins(self, trainer_id: int) -> int:
         pass
@@ -23,7 +49,19 @@ class BattleRepository(BaseRepository[Battle], ABC):
         pass
 
     @abstractmethod
-    def get_leaderboard_data(self) -> list[dict]:
+    def get_trainer_battle_stats(self, trainer_id: int) -> dict:
+        pass
+
+    @abstractmethod
+    def get_leaderboard_data(self, skip: int = 0, limit: int = 100) -> list[dict]:
+        pass
+
+    @abstractmethod
+    def get_leaderboard_totals(self) -> dict:
+        pass
+
+    @abstractmethod
+    def rebuild_trainer_battle_stats(self) -> int:
         pass
 
     @abstractmethod
@@ -9,3 +9,7 @@ class ItemRepository(BaseRepository[Item], ABC):
     @abstractmethod
     def get_by_type(self, item_type: str) -> list[Item]:
         pass
+
+    @abstractmethod
+    def get_by_price_range(self, min_price: int, max_price: int) -> list[Item]:
+        pass
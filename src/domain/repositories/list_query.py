@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+
+class FilterOperator(str, Enum):
+    EQ = "eq"
+    IN = "in"
+    RANGE = "range"
+    PREFIX = "prefix"
+
+
+@dataclass(frozen=True)
+class FieldFilter:
+    """Condition on one field.
+
+    ``values`` holds one value for ``eq`` and ``prefix``, any number for
+    ``in``, and ``(low, high)`` for ``range`` with ``None`` for an open end.
+    """
+
+    field: str
+    operator: FilterOperator
+    values: tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class SortKey:
+    field: str
+    descending: bool = False
+
+
+@dataclass(frozen=True)
+class ListQuery:
+    """Filters (all must match) and sort order for a list read."""
+
+    filters: tuple[FieldFilter, ...] = ()
+    order_by: tuple[SortKey, ...] = ()
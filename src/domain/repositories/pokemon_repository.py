@@ -1,9 +1,43 @@
-from abc import ABC
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 
 from src.domain.repositories.base_repository import BaseRepository
+from src.domain.repositories.list_query import ListQuery
 
 from ..entities.pokemon import Pokemon
 
 
 class PokemonRepository(BaseRepository[Pokemon], ABC):
-    pass
+    @abstractmethod
+    def get_row_versions(
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
+    ) -> list[tuple[int, int]]:
+        """(id, version) of the rows ``get_all(skip, limit, query)`` would return."""
+        pass
+
+    @abstractmethod
+    def get_projection(
+        self,
+        columns: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+        query: ListQuery | None = None,
+    ) -> list[dict[str, Any]]:
+        """Like ``get_all`` but selecting only ``columns``, as plain dicts."""
+        pass
+
+    @abstractmethod
+    def get_projection_by_id(
+        self, entity_id: int, columns: Sequence[str]
+    ) -> dict[str, Any] | None:
+        pass
+
+    @abstractmethod
+    def get_by_ids(self, pokemon_ids: list[int]) -> list[Pokemon]:
+        pass
+
+    @abstractmethod
+    def get_average_level(self) -> float:
+        """Mean level of all pokemon, 0.0 when there are none."""
+        pass
@@ -1,9 +1,27 @@
-from abc import ABC
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 
 from src.domain.repositories.base_repository import BaseRepository
+from src.domain.repositories.list_query import ListQuery
 
 from ..entities.trainer import Trainer
 
 
 class TrainerRepository(BaseRepository[Trainer], ABC):
-    pass
+    @abstractmethod
+    def get_projection(
+        self,
+        columns: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+        query: ListQuery | None = None,
+    ) -> list[dict[str, Any]]:
+        """Like ``get_all`` but selecting only ``columns``, as plain dicts."""
+        pass
+
+    @abstractmethod
+    def get_projection_by_id(
+        self, entity_id: int, columns: Sequence[str]
+    ) -> dict[str, Any] | None:
+        pass
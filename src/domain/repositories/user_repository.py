@@ -13,3 +13,12 @@ class UserRepository(BaseRepository[User], ABC):
     @abstractmethod
     def get_by_email(self, email: str) -> User | None:
         pass
+
+    @abstractmethod
+    def get_revoked_tokens(self) -> dict[int, int | None]:
+        """Users with revoked access tokens.
+
+        Maps the user id to the lowest token version still valid, or to
+        ``None`` when the account is inactive and none is.
+        """
+        pass
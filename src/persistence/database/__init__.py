@@ -1,5 +1,11 @@
-from .connection import create_tables, engine, get_database
+from .connection import (
+    TABLE_VERSIONS_SYNCED,
+    create_tables,
+    engine,
+    get_database,
+)
 from .models import BackpackModel, ItemModel, PokemonModel, TeamModel, TrainerModel
+from .table_versions import table_versions
 
 __all__ = [
     "get_database",
@@ -10,4 +16,6 @@ __all__ = [
     "TeamModel",
     "ItemModel",
     "BackpackModel",
+    "table_versions",
+    "TABLE_VERSIONS_SYNCED",
 ]
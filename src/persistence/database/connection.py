@@ -1,9 +1,15 @@
 from collections.abc import Generator
 
+from fastapi import Request
 from sqlmodel import Session, SQLModel, create_engine
 
+from src.persistence.database.table_versions import table_versions
+
 DATABASE_URL = "sqlite:///./pokemon.db"
 
+# Request state flag set by middleware that already synced the table versions.
+TABLE_VERSIONS_SYNCED = "table_versions_synced"
+
 engine = create_engine(
     DATABASE_URL, connect_args={"check_same_thread": False}, echo=False
 )
@@ -13,6 +19,8 @@ def create_tables() -> None:
     SQLModel.metadata.create_all(engine)
 
 
-def get_database() -> Generator[Session]:
+def get_database(request: Request) -> Generator[Session]:
     with Session(engine) as session:
+        if not getattr(request.state, TABLE_VERSIONS_SYNCED, False):
+            table_versions.sync(session)
         yield session
@@ -0,0 +1,149 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import orjson
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, col, select
+
+from src.persistence.database.models import IdempotencyKeyModel
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    """What an earlier request with the same idempotency key left behind."""
+
+    fingerprint: str
+    status_code: int | None
+    headers: tuple[tuple[bytes, bytes], ...]
+    body: bytes | None
+
+    @property
+    def in_progress(self) -> bool:
+        return self.status_code is None
+
+
+class IdempotencyStore:
+    """Claims on idempotency keys and the responses they produced.
+
+    The unique ``(scope, key)`` constraint makes :meth:`claim` atomic across
+    workers: exactly one concurrent request inserts the row, every other one
+    gets the existing record back. A claim holds the key for ``lease_seconds``,
+    so a worker that dies before completing it blocks retries only briefly;
+    completed rows expire after ``ttl_seconds``. Each claim deletes up to
+    ``purge_batch_size`` expired rows, so the table stays small without a
+    cleanup job.
+    """
+
+    def __init__(
+        self, ttl_seconds: int, lease_seconds: int = 60, purge_batch_size: int = 100
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.lease_seconds = lease_seconds
+        self.purge_batch_size = purge_batch_size
+
+    def claim(
+        self, db: Session, scope: str, key: str, fingerprint: str
+    ) -> StoredResponse | None:
+        """Reserve ``key`` for this request; ``None`` if it is now ours."""
+        # A claimer that lost the insert may find the winner's row already
+        # purged, so it tries once more.
+        for _ in range(2):
+            now = datetime.utcnow()
+            self._purge_expired(db, scope, key, now)
+            db.add(
+                IdempotencyKeyModel(
+                    scope=scope,
+                    key=key,
+                    fingerprint=fingerprint,
+                    expires_at=now + timedelta(seconds=self.lease_seconds),
+                )
+            )
+            try:
+                db.commit()
+                return None
+            except IntegrityError:
+                db.rollback()
+
+            existing = db.exec(
+                select(IdempotencyKeyModel).where(
+                    col(IdempotencyKeyModel.scope) == scope,
+                    col(IdempotencyKeyModel.key) == key,
+                    col(IdempotencyKeyModel.expires_at) >= now,
+                )
+            ).first()
+            if existing is not None:
+                return StoredResponse(
+                    fingerprint=existing.fingerprint,
+                    status_code=existing.status_code,
+                    headers=_decode_headers(existing.headers),
+                    body=existing.body,
+                )
+        raise RuntimeError(f"Could not claim idempotency key {key!r}")
+
+    def complete(
+        self,
+        db: Session,
+        scope: str,
+        key: str,
+        status_code: int,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+    ) -> None:
+        """Store the response that later retries of ``key`` are answered with."""
+        db.execute(
+            update(IdempotencyKeyModel)
+            .where(
+                col(IdempotencyKeyModel.scope) == scope,
+                col(IdempotencyKeyModel.key) == key,
+            )
+            .values(
+                status_code=status_code,
+                headers=_encode_headers(headers),
+                body=body,
+                expires_at=datetime.utcnow() + timedelta(seconds=self.ttl_seconds),
+            )
+        )
+        db.commit()
+
+    def release(self, db: Session, scope: str, key: str) -> None:
+        """Give up a claim so that a retry runs the request again."""
+        db.execute(
+            delete(IdempotencyKeyModel).where(
+                col(IdempotencyKeyModel.scope) == scope,
+                col(IdempotencyKeyModel.key) == key,
+            )
+        )
+        db.commit()
+
+    def _purge_expired(self, db: Session, scope: str, key: str, now: datetime) -> None:
+        expired = (
+            select(IdempotencyKeyModel.id)
+            .where(col(IdempotencyKeyModel.expires_at) < now)
+            .limit(self.purge_batch_size)
+        )
+        db.execute(
+            delete(IdempotencyKeyModel).where(
+                col(IdempotencyKeyModel.expires_at) < now,
+                col(IdempotencyKeyModel.id).in_(expired)
+                | (
+                    (col(IdempotencyKeyModel.scope) == scope)
+                    & (col(IdempotencyKeyModel.key) == key)
+                ),
+            )
+        )
+
+
+def _encode_headers(headers: list[tuple[bytes, bytes]]) -> bytes:
+    return orjson.dumps(
+        [[name.decode("latin-1"), value.decode("latin-1")] for name, value in headers]
+    )
+
+
+def _decode_headers(encoded: bytes | None) -> tuple[tuple[bytes, bytes], ...]:
+    if not encoded:
+        return ()
+    return tuple(
+        (name.encode("latin-1"), value.encode("latin-1"))
+        for name, value in orjson.loads(encoded)
+    )
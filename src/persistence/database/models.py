@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -43,6 +44,8 @@ class TrainerModel(SQLModel, table=True):
 
 class PokemonModel(SQLModel, table=True):
     __tablename__ = "pokemon"
+    # Ids are never reused, so (id, version) identifies one state of one row.
+    __table_args__ = {"sqlite_autoincrement": True}
 
     id: int | None = Field(default=None, primary_key=True)
     name: str = Field(max_length=50, index=True)
@@ -51,12 +54,24 @@ class PokemonModel(SQLModel, table=True):
     attacks: str = Field(description="JSON string of attacks")
     nature: str = Field(max_length=20, index=True)
     level: int = Field(default=1, ge=1, le=100)
+    # Incremented on every update; keys per-row caches of the encoded row.
+    version: int = Field(default=1)
 
     team_memberships: list["TeamModel"] = Relationship(back_populates="pokemon")
 
 
 class TeamModel(SQLModel, table=True):
     __tablename__ = "teams"
+    __table_args__ = (
+        Index(
+            "ux_teams_trainer_position_active",
+            "trainer_id",
+            "position",
+            unique=True,
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     trainer_id: int = Field(foreign_key="trainers.id", index=True)
@@ -75,7 +90,9 @@ class ItemModel(SQLModel, table=True):
     name: str = Field(max_length=50, index=True)
     type: str = Field(max_length=20, index=True)
     description: str | None = Field(default=None)
-    price: int = Field(default=0, ge=0, description="Price in Pokemon zenis")
+    price: int = Field(
+        default=0, ge=0, index=True, description="Price in Pokemon zenis"
+    )
 
     backpack_entries: list["BackpackModel"] = Relationship(back_populates="item")
 
@@ -103,6 +120,7 @@ class UserModel(SQLModel, table=True):
     is_superuser: bool = Field(default=False)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    token_version: int = Field(default=0)
 
     trainer_id: int | None = Field(default=None, foreign_key="trainers.id")
     trainer: Optional["TrainerModel"] = Relationship(back_populates="user")
@@ -147,3 +165,50 @@ class BattleModel(SQLModel, table=True):
         back_populates="battles_won",
         sa_relationship_kwargs={"foreign_keys": "[BattleModel.winner_trainer_id]"},
     )
+
+
+class TrainerBattleStatsModel(SQLModel, table=True):
+    """Per-trainer battle record, maintained alongside every battle write."""
+
+    __tablename__ = "trainer_battle_stats"
+    __table_args__ = (
+        Index(
+            "ix_trainer_battle_stats_ranking",
+            text("wins DESC"),
+            text("win_rate DESC"),
+            "trainer_id",
+        ),
+    )
+
+    trainer_id: int = Field(foreign_key="trainers.id", primary_key=True)
+    wins: int = Field(default=0)
+    losses: int = Field(default=0)
+    total_battles: int = Field(default=0)
+    win_rate: float = Field(default=0.0)
+    last_battle_at: datetime | None = Field(default=None)
+
+
+class TableVersionModel(SQLModel, table=True):
+    __tablename__ = "table_versions"
+
+    table_name: str = Field(primary_key=True, max_length=50)
+    version: int = Field(default=0)
+
+
+class IdempotencyKeyModel(SQLModel, table=True):
+    """Outcome of a mutation sent with an ``Idempotency-Key`` header.
+
+    ``status_code`` stays ``NULL`` while the first request is still running.
+    """
+
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (UniqueConstraint("scope", "key", name="uq_idempotency_keys"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+    scope: str = Field(max_length=64)
+    key: str = Field(max_length=255)
+    fingerprint: str = Field(max_length=64)
+    status_code: int | None = Field(default=None)
+    headers: bytes | None = Field(default=None, description="JSON [name, value] pairs")
+    body: bytes | None = Field(default=None)
+    expires_at: datetime = Field(index=True)
@@ -0,0 +1,94 @@
+from collections.abc import Callable, Iterable
+from threading import Lock
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, col, select
+
+from src.persistence.database.models import TableVersionModel
+
+
+class TableVersionTracker:
+    """Process-local view of the per-table write counters in ``table_versions``.
+
+    Every committed repository write bumps its table's counter in the same
+    transaction. Each request calls :meth:`sync` once; tables whose counter moved
+    since the last sync were written by another worker, so the listeners (the
+    in-process caches) drop what they hold for them. Writes made by this process
+    are acknowledged after commit and only notify listeners registered with
+    ``local_writes=True``, for caches no repository keeps current itself.
+    """
+
+    def __init__(self) -> None:
+        self._known: dict[str, int] = {}
+        self._synced = False
+        self._listeners: list[Callable[[str], None]] = []
+        self._local_listeners: list[Callable[[str], None]] = []
+        self._lock = Lock()
+
+    def add_listener(
+        self, listener: Callable[[str], None], *, local_writes: bool = False
+    ) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+            if local_writes:
+                self._local_listeners.append(listener)
+
+    def sync(self, db: Session) -> None:
+        """Read every counter in one query and invalidate tables that moved."""
+        rows = db.exec(
+            select(TableVersionModel.table_name, TableVersionModel.version)
+        ).all()
+        with self._lock:
+            # Nothing is cached before the first sync, so it only records state.
+            stale = [
+                table_name
+                for table_name, version in rows
+                if self._synced and self._known.get(table_name, 0) != version
+            ]
+            self._known.update(dict(rows))
+            self._synced = True
+            listeners = list(self._listeners)
+
+        for table_name in stale:
+            for listener in listeners:
+                listener(table_name)
+
+    def versions(self, table_names: Iterable[str]) -> tuple[int, ...]:
+        """Counters as of this process's last sync or acknowledged write."""
+        with self._lock:
+            return tuple(self._known.get(table_name, 0) for table_name in table_names)
+
+    def bump(self, db: Session, table_names: Iterable[str]) -> dict[str, int]:
+        """Increment the counters inside the caller's transaction."""
+        versions: dict[str, int] = {}
+        for table_name in dict.fromkeys(table_names):
+            statement = (
+                insert(TableVersionModel)
+                .values(table_name=table_name, version=1)
+                .on_conflict_do_update(
+                    index_elements=["table_name"],
+                    set_={"version": TableVersionModel.version + 1},
+                )
+                .returning(col(TableVersionModel.version))
+            )
+            versions[table_name] = db.execute(statement).scalar_one()
+        return versions
+
+    def acknowledge(self, versions: dict[str, int]) -> None:
+        """Record committed local bumps that directly follow the known version.
+
+        A gap means another worker wrote in between; the counter is left behind
+        so the next :meth:`sync` invalidates the table.
+        """
+        with self._lock:
+            for table_name, version in versions.items():
+                if self._known.get(table_name, 0) == version - 1:
+                    self._known[table_name] = version
+            listeners = list(self._local_listeners)
+
+        for table_name in versions:
+            for listener in listeners:
+                listener(table_name)
+
+
+table_versions = TableVersionTracker()
@@ -1,4 +1,17 @@
 from .base_sqlmodel_repository import BaseSqlModelRepository
+from .cached_repository import (
+    CachedRepository,
+    EntityCache,
+    entity_cache_stats,
+    with_entity_cache,
+)
+from .item_catalog import (
+    CatalogItemRepository,
+    ItemCatalog,
+    ItemCatalogSnapshot,
+    item_catalog,
+    with_item_catalog,
+)
 from .sqlmodel_backpack_repository import SqlModelBackpackRepository
 from .sqlmodel_battle_repository import SqlModelBattleRepository
 from .sqlmodel_item_repository import SqlModelItemRepository
@@ -9,6 +22,11 @@ from .sqlmodel_user_repository import SqlModelUserRepository
 
 __all__ = [
     "BaseSqlModelRepository",
+    "CachedRepository",
+    "CatalogItemRepository",
+    "EntityCache",
+    "ItemCatalog",
+    "ItemCatalogSnapshot",
     "SqlModelBackpackRepository",
     "SqlModelBattleRepository",
     "SqlModelItemRepository",
@@ -16,4 +34,8 @@ __all__ = [
     "SqlModelTeamRepository",
     "SqlModelTrainerRepository",
     "SqlModelUserRepository",
+    "entity_cache_stats",
+    "item_catalog",
+    "with_entity_cache",
+    "with_item_catalog",
 ]
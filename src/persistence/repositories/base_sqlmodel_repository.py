@@ -1,21 +1,40 @@
-from collections.abc import Callable
-from typing import TypeVar
+import sys
+from collections.abc import Callable, Iterator, Sequence
+from datetime import datetime
+from threading import Lock
+from typing import Any, ClassVar, TypeVar
 
-from sqlalchemy.orm import Session
-from sqlmodel import SQLModel, select
+from sqlalchemy import Column, ColumnElement, Select, Table, and_, func, insert, true
+from sqlmodel import Session, SQLModel, select
 
+from src.domain.exceptions import ValidationException
 from src.domain.protocols.entity_protocol import EntityProtocol
 from src.domain.repositories.base_repository import BaseRepository
+from src.domain.repositories.list_query import FieldFilter, FilterOperator, ListQuery
+from src.persistence.database.table_versions import table_versions
 
 EntityType = TypeVar("EntityType", bound=EntityProtocol)
 ModelType = TypeVar("ModelType", bound=SQLModel)
 
+# Models with this column get it incremented by every update().
+ROW_VERSION_FIELD = "version"
+
 
 class BaseSqlModelRepository[EntityType: EntityProtocol, ModelType: SQLModel](
     BaseRepository[EntityType]
 ):
     """Generic SQLModel repository implementation with full CRUD logic."""
 
+    # Approximate row counts per table, shared by every repository instance in
+    # the process and kept current by the write paths below.
+    _row_counts: ClassVar[dict[str, int]] = {}
+    _row_counts_lock: ClassVar[Lock] = Lock()
+
+    # Columns a ListQuery may filter and sort on. Only indexed columns belong
+    # here, so that a filtered page is an index range scan.
+    filter_fields: ClassVar[frozenset[str]] = frozenset({"id"})
+    sort_fields: ClassVar[frozenset[str]] = frozenset({"id"})
+
     def __init__(
         self,
         db: Session,
@@ -33,21 +52,69 @@ class BaseSqlModelRepository[EntityType: EntityProtocol, ModelType: SQLModel](
         """Create a new entity in the database."""
         db_model = self._entity_to_model(entity)
         self.db.add(db_model)
-        self.db.commit()
+        self._commit()
+        self._adjust_row_count(1)
         self.db.refresh(db_model)
         return self._model_to_entity(db_model)
 
+    def create_many(self, entities: list[EntityType]) -> list[EntityType]:
+        """Insert all entities with one batched INSERT ... RETURNING and commit."""
+        if not entities:
+            return []
+        created = self._insert_many(entities)
+        self._commit()
+        self._adjust_row_count(len(created))
+        return created
+
     def get_by_id(self, entity_id: int) -> EntityType | None:
         """Get entity by ID from database."""
         db_model = self.db.get(self.model_class, entity_id)
         return self._model_to_entity(db_model) if db_model else None
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[EntityType]:
-        """Get all entities with pagination."""
-        statement = select(self.model_class).offset(skip).limit(limit)
-        db_models = self.db.exec(statement).all()
+    def get_all(
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
+    ) -> list[EntityType]:
+        """Get all entities with pagination, filtered and sorted by ``query``."""
+        statement = self._apply_query(select(self.model_class), query)
+        db_models = self.db.exec(statement.offset(skip).limit(limit)).all()
         return [self._model_to_entity(model) for model in db_models]
 
+    def get_projection(
+        self,
+        columns: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+        query: ListQuery | None = None,
+    ) -> list[dict[str, Any]]:
+        """Page of rows reading only ``columns``, as column name -> value.
+
+        Ordered explicitly (by ID unless ``query`` says otherwise): a narrow
+        SELECT may be answered from a covering index whose order differs from
+        the table's.
+        """
+        table = self._table.c
+        statement = self._apply_query(
+            select(*(table[column] for column in columns)), query
+        )
+        statement = statement.offset(skip).limit(limit)
+        rows = self.db.execute(statement).mappings()
+        return [self._decode_columns(dict(row)) for row in rows]
+
+    def get_projection_by_id(
+        self, entity_id: int, columns: Sequence[str]
+    ) -> dict[str, Any] | None:
+        """One row's ``columns``, or ``None`` when it does not exist."""
+        table = self._table.c
+        statement = select(*(table[column] for column in columns)).where(
+            table.id == entity_id
+        )
+        row = self.db.execute(statement).mappings().first()
+        return self._decode_columns(dict(row)) if row is not None else None
+
+    def _decode_columns(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Turn stored column values into their domain form (e.g. JSON text)."""
+        return row
+
     def update(self, entity_id: int, entity: EntityType) -> EntityType | None:
         """Update an existing entity."""
         db_model = self.db.get(self.model_class, entity_id)
@@ -56,11 +123,15 @@ class BaseSqlModelRepository[EntityType: EntityProtocol, ModelType: SQLModel](
 
         updated_model = self._entity_to_model(entity)
         for field, value in updated_model.model_dump(exclude_unset=True).items():
-            if hasattr(db_model, field) and field != "id":
+            if hasattr(db_model, field) and field not in ("id", ROW_VERSION_FIELD):
                 setattr(db_model, field, value)
+        if hasattr(db_model, ROW_VERSION_FIELD):
+            setattr(
+                db_model, ROW_VERSION_FIELD, getattr(db_model, ROW_VERSION_FIELD) + 1
+            )
 
         self.db.add(db_model)
-        self.db.commit()
+        self._commit()
         self.db.refresh(db_model)
         return self._model_to_entity(db_model)
 
@@ -71,5 +142,189 @@ class BaseSqlModelRepository[EntityType: EntityProtocol, ModelType: SQLModel](
             return False
 
         self.db.delete(db_model)
-        self.db.commit()
+        self._commit()
+        self._adjust_row_count(-1)
         return True
+
+    def count(self, exact: bool = False, query: ListQuery | None = None) -> int:
+        """Count rows, served from the cached counter unless ``exact`` is set.
+
+        Filtered counts are never cached; they cost one index range scan.
+        """
+        if query is not None and query.filters:
+            statement = (
+                select(func.count())
+                .select_from(self.model_class)
+                .where(*self._filter_conditions(query))
+            )
+            return int(self.db.execute(statement).scalar_one())
+
+        table_name = self.table_name
+        if not exact:
+            with self._row_counts_lock:
+                cached = self._row_counts.get(table_name)
+            if cached is not None:
+                return cached
+
+        statement = select(func.count()).select_from(self.model_class)
+        total = int(self.db.execute(statement).scalar_one())
+        with self._row_counts_lock:
+            self._row_counts[table_name] = total
+        return total
+
+    def iter_chunks(self, chunk_size: int = 500) -> Iterator[list[EntityType]]:
+        """Walk the table in ID order, holding at most one chunk in memory."""
+        return self._iter_chunks(chunk_size)
+
+    def _iter_chunks(
+        self, chunk_size: int, *conditions: ColumnElement[bool]
+    ) -> Iterator[list[EntityType]]:
+        # Keyset pagination: each chunk is an index range scan past the last
+        # ID seen, so late chunks cost the same as the first one.
+        id_column = getattr(self.model_class, "id")
+        last_id: int | None = None
+        while True:
+            statement = select(self.model_class).where(*conditions)
+            if last_id is not None:
+                statement = statement.where(id_column > last_id)
+            statement = statement.order_by(id_column).limit(chunk_size)
+            db_models = self.db.exec(statement).all()
+            if not db_models:
+                return
+            yield [self._model_to_entity(model) for model in db_models]
+            if len(db_models) < chunk_size:
+                return
+            last_id = getattr(db_models[-1], "id")
+
+    def _apply_query[StatementT: Select[Any]](
+        self, statement: StatementT, query: ListQuery | None
+    ) -> StatementT:
+        """Add ``query``'s conditions and sort order to a SELECT."""
+        return statement.where(*self._filter_conditions(query)).order_by(
+            *self._sort_columns(query)
+        )
+
+    def _filter_conditions(self, query: ListQuery | None) -> list[ColumnElement[bool]]:
+        if query is None:
+            return []
+        return [self._filter_condition(field_filter) for field_filter in query.filters]
+
+    def _sort_columns(self, query: ListQuery | None) -> list[ColumnElement[Any]]:
+        """ORDER BY for ``query``, with the ID as tie-breaker for stable pages."""
+        table = self._table.c
+        columns: list[ColumnElement[Any]] = []
+        for key in query.order_by if query is not None else ():
+            if key.field not in self.sort_fields:
+                raise ValidationException(f"Cannot sort by {key.field}", key.field)
+            column = table[key.field]
+            columns.append(column.desc() if key.descending else column.asc())
+        if not any(key.field == "id" for key in (query.order_by if query else ())):
+            columns.append(table.id.asc())
+        return columns
+
+    def _filter_condition(self, field_filter: FieldFilter) -> ColumnElement[bool]:
+        name = field_filter.field
+        if name not in self.filter_fields:
+            raise ValidationException(f"Cannot filter by {name}", name)
+        column = self._table.c[name]
+        operator = field_filter.operator
+        if operator is FilterOperator.PREFIX and _python_type(column) is not str:
+            raise ValidationException(f"{name} is not a text field", name)
+        values = [self._coerce_value(column, value) for value in field_filter.values]
+
+        match operator:
+            case FilterOperator.EQ:
+                # Comparing with an Any value makes the operator return Any.
+                equals: ColumnElement[bool] = column == values[0]
+                return equals
+            case FilterOperator.IN:
+                return column.in_(values)
+            case FilterOperator.RANGE:
+                low, high = values
+                bounds = []
+                if low is not None:
+                    bounds.append(column >= low)
+                if high is not None:
+                    bounds.append(column <= high)
+                return and_(true(), *bounds)
+            case FilterOperator.PREFIX:
+                prefix = values[0]
+                condition = column.startswith(prefix, autoescape=True)
+                # Also bounded as a range so the index can serve it; LIKE on
+                # its own only uses the index under a case-insensitive collation.
+                if prefix and ord(prefix[-1]) < sys.maxunicode:
+                    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+                    condition = and_(column >= prefix, column < upper, condition)
+                return condition
+        raise ValidationException(f"Unsupported operator {operator}", name)
+
+    @staticmethod
+    def _coerce_value(column: Column[Any], value: Any) -> Any:
+        """Convert a filter value (usually query-string text) to the column type."""
+        python_type = _python_type(column)
+        if value is None or isinstance(value, python_type):
+            return value
+        try:
+            if python_type is datetime:
+                return datetime.fromisoformat(str(value))
+            if python_type is bool:
+                return str(value).lower() in ("1", "true", "yes")
+            return python_type(value)
+        except (TypeError, ValueError) as e:
+            raise ValidationException(
+                f"Invalid value for {column.name}: {value!r}", column.name
+            ) from e
+
+    def _insert_many(self, entities: list[EntityType]) -> list[EntityType]:
+        """Insert without committing; rows come back in parameter order."""
+        rows = [
+            self._entity_to_model(entity).model_dump(exclude={"id"})
+            for entity in entities
+        ]
+        statement = insert(self.model_class).returning(
+            self.model_class, sort_by_parameter_order=True
+        )
+        db_models = self.db.scalars(statement, rows).all()
+        return [self._model_to_entity(model) for model in db_models]
+
+    @property
+    def _table(self) -> Table:
+        return model_table(self.model_class)
+
+    @property
+    def table_name(self) -> str:
+        return str(self.model_class.__tablename__)
+
+    def _commit(self, *other_tables: str) -> None:
+        """Commit, bumping the version of this table and any ``other_tables``."""
+        versions = table_versions.bump(self.db, (self.table_name, *other_tables))
+        self.db.commit()
+        table_versions.acknowledge(versions)
+
+    @classmethod
+    def _forget_row_count(cls, table_name: str) -> None:
+        with cls._row_counts_lock:
+            cls._row_counts.pop(table_name, None)
+
+    def _adjust_row_count(self, delta: int) -> None:
+        """Apply a committed insert/delete to the cached counter, if primed."""
+        with self._row_counts_lock:
+            if self.table_name in self._row_counts:
+                self._row_counts[self.table_name] += delta
+
+
+def model_table(model_class: type[SQLModel]) -> Table:
+    """The Core table behind a table model, which SQLModel leaves untyped."""
+    table: Table = getattr(model_class, "__table__")
+    return table
+
+
+def _python_type(column: Column[Any]) -> type:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        # sqlmodel's AutoString (every ``str`` field) does not declare one.
+        return str
+
+
+table_versions.add_listener(BaseSqlModelRepository._forget_row_count)
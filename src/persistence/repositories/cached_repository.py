@@ -0,0 +1,208 @@
+from collections import OrderedDict
+from collections.abc import Iterator
+from copy import deepcopy
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from src.config import settings
+from src.domain.protocols.entity_protocol import EntityProtocol
+from src.domain.repositories.base_repository import BaseRepository
+from src.domain.repositories.list_query import ListQuery
+from src.persistence.database.table_versions import table_versions
+from src.persistence.repositories.base_sqlmodel_repository import BaseSqlModelRepository
+
+
+class EntityCache[EntityType: EntityProtocol]:
+    """Thread-safe LRU of domain entities keyed by id, with a per-entry TTL.
+
+    Entries are private snapshots: entities are copied on the way in and on the
+    way out, so callers that mutate what they read (services do, before calling
+    ``update``) can never change what the next reader sees.
+
+    Every invalidation is stamped from a counter. A loader reads
+    :meth:`generation` before going to the database and passes it to
+    :meth:`put`, which is skipped if the entity was invalidated since: a row
+    read before a concurrent write commits never lands after it.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[int, tuple[float, EntityType]] = OrderedDict()
+        self._generation = 0
+        self._invalidated_at: dict[int, int] = {}
+        self._cleared_at = 0
+        self._lock = Lock()
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, entity_id: int) -> EntityType | None:
+        with self._lock:
+            entry = self._entries.get(entity_id)
+            if entry is None or entry[0] <= monotonic():
+                if entry is not None:
+                    del self._entries[entity_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(entity_id)
+            self.hits += 1
+            return deepcopy(entry[1])
+
+    def put(self, entity: EntityType, generation: int | None = None) -> None:
+        """Store ``entity`` unless it was invalidated after ``generation``."""
+        if entity.id is None or self.max_size <= 0:
+            return
+        snapshot = deepcopy(entity)
+        with self._lock:
+            if generation is not None and (
+                self._cleared_at > generation
+                or self._invalidated_at.get(entity.id, 0) > generation
+            ):
+                return
+            self._entries[entity.id] = (monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(entity.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, entity_id: int) -> int:
+        """Drop the entry; returns the generation stamped on the invalidation."""
+        with self._lock:
+            self._entries.pop(entity_id, None)
+            self._generation += 1
+            self._invalidated_at[entity_id] = self._generation
+            if len(self._invalidated_at) > self.max_size:
+                # Forgetting the stamps only turns pending puts away.
+                self._invalidated_at.clear()
+                self._cleared_at = self._generation
+            return self._generation
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._invalidated_at.clear()
+            self._cleared_at = self._generation
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class CachedRepository[EntityType: EntityProtocol](BaseRepository[EntityType]):
+    """Write-through caching decorator for a repository.
+
+    ``get_by_id`` is served from the shared :class:`EntityCache`; ``create`` and
+    ``update`` store the persisted entity and ``delete`` evicts it. Writes
+    invalidate before and after the database call, so a concurrent miss that
+    read the old row cannot put it back. Any other
+    attribute (domain-specific queries) is delegated to the wrapped repository.
+    """
+
+    def __init__(
+        self, repository: BaseRepository[EntityType], cache: EntityCache[EntityType]
+    ):
+        self._repository = repository
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+    def create(self, entity: EntityType) -> EntityType:
+        created = self._repository.create(entity)
+        self._cache.put(created)
+        return created
+
+    def create_many(self, entities: list[EntityType]) -> list[EntityType]:
+        created = self._repository.create_many(entities)
+        for entity in created:
+            self._cache.put(entity)
+        return created
+
+    def get_by_id(self, entity_id: int) -> EntityType | None:
+        cached = self._cache.get(entity_id)
+        if cached is not None:
+            return cached
+
+        generation = self._cache.generation()
+        entity = self._repository.get_by_id(entity_id)
+        if entity is not None:
+            self._cache.put(entity, generation)
+        return entity
+
+    def get_all(
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
+    ) -> list[EntityType]:
+        return self._repository.get_all(skip, limit, query)
+
+    def iter_chunks(self, chunk_size: int = 500) -> Iterator[list[EntityType]]:
+        return self._repository.iter_chunks(chunk_size)
+
+    def update(self, entity_id: int, entity: EntityType) -> EntityType | None:
+        self._cache.invalidate(entity_id)
+        updated = self._repository.update(entity_id, entity)
+        generation = self._cache.invalidate(entity_id)
+        if updated is not None:
+            self._cache.put(updated, generation)
+        return updated
+
+    def delete(self, entity_id: int) -> bool:
+        self._cache.invalidate(entity_id)
+        deleted = self._repository.delete(entity_id)
+        self._cache.invalidate(entity_id)
+        return deleted
+
+    def count(self, exact: bool = False, query: ListQuery | None = None) -> int:
+        return self._repository.count(exact=exact, query=query)
+
+
+_entity_caches: dict[str, EntityCache[Any]] = {}
+_entity_caches_lock = Lock()
+
+
+def get_entity_cache(table_name: str) -> EntityCache[Any]:
+    """Return the process-wide cache for a table, creating it on first use."""
+    with _entity_caches_lock:
+        cache = _entity_caches.get(table_name)
+        if cache is None:
+            cache = EntityCache(
+                max_size=settings.ENTITY_CACHE_MAX_SIZE,
+                ttl_seconds=settings.ENTITY_CACHE_TTL_SECONDS,
+            )
+            _entity_caches[table_name] = cache
+        return cache
+
+
+def with_entity_cache[RepositoryType: BaseSqlModelRepository](
+    repository: RepositoryType,
+) -> RepositoryType:
+    """Wrap ``repository`` in a :class:`CachedRepository` when caching is enabled."""
+    if not settings.ENTITY_CACHE_ENABLED:
+        return repository
+    cache = get_entity_cache(repository.table_name)
+    return CachedRepository(repository, cache)  # type: ignore[return-value]
+
+
+def _clear_entity_cache(table_name: str) -> None:
+    with _entity_caches_lock:
+        cache = _entity_caches.get(table_name)
+    if cache is not None:
+        cache.clear()
+
+
+def entity_cache_stats() -> dict[str, dict[str, int]]:
+    with _entity_caches_lock:
+        caches = dict(_entity_caches)
+    return {name: cache.stats() for name, cache in caches.items()}
+
+
+table_versions.add_listener(_clear_entity_cache)
@@ -0,0 +1,195 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, replace
+from threading import Lock
+from types import MappingProxyType
+
+from src.config import settings
+from src.domain.entities.item import Item
+from src.domain.enums.item_enums import ItemType
+from src.domain.repositories.item_repository import ItemRepository
+from src.domain.repositories.list_query import ListQuery
+from src.persistence.database.models import ItemModel
+from src.persistence.database.table_versions import table_versions
+from src.persistence.repositories.sqlmodel_item_repository import (
+    SqlModelItemRepository,
+)
+
+
+@dataclass(frozen=True)
+class ItemCatalogSnapshot:
+    """Read-only view of the whole item table with its lookup indexes.
+
+    Snapshots are never modified after construction. The items they hold are
+    shared between readers, so :class:`CatalogItemRepository` only hands out
+    copies of them.
+    """
+
+    items: tuple[Item, ...]
+    by_id: Mapping[int, Item]
+    by_type: Mapping[ItemType, tuple[Item, ...]]
+    by_price: tuple[Item, ...]
+    prices: tuple[int, ...]
+
+    @classmethod
+    def build(cls, items: list[Item]) -> "ItemCatalogSnapshot":
+        ordered = tuple(sorted(items, key=lambda item: item.id or 0))
+        by_type: dict[ItemType, list[Item]] = {}
+        for item in ordered:
+            by_type.setdefault(item.type, []).append(item)
+        by_price = tuple(sorted(ordered, key=lambda item: item.price))
+        return cls(
+            items=ordered,
+            by_id=MappingProxyType(
+                {item.id: item for item in ordered if item.id is not None}
+            ),
+            by_type=MappingProxyType(
+                {item_type: tuple(group) for item_type, group in by_type.items()}
+            ),
+            by_price=by_price,
+            prices=tuple(item.price for item in by_price),
+        )
+
+    def in_price_range(self, min_price: int, max_price: int) -> tuple[Item, ...]:
+        start = bisect_left(self.prices, min_price)
+        end = bisect_right(self.prices, max_price)
+        return self.by_price[start:end]
+
+
+class ItemCatalog:
+    """Process-wide holder of the current :class:`ItemCatalogSnapshot`.
+
+    Readers take the current reference without locking. Reloads are serialized
+    so that the snapshot published last is never older than one published
+    before it. Publishing and invalidating share a short lock that is never
+    held across a database read, so an invalidation cannot slip between a
+    reload's generation check and its publish.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: ItemCatalogSnapshot | None = None
+        self._generation = 0
+        self._reload_lock = Lock()
+        self._lock = Lock()
+
+    def snapshot(self, repository: ItemRepository) -> ItemCatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._reload_lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._load(repository)
+        return snapshot
+
+    def reload(self, repository: ItemRepository) -> ItemCatalogSnapshot:
+        with self._reload_lock:
+            return self._load(repository)
+
+    def invalidate(self) -> None:
+        """Drop the snapshot after a write by another worker."""
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+
+    def _load(self, repository: ItemRepository) -> ItemCatalogSnapshot:
+        with self._lock:
+            generation = self._generation
+        total = repository.count(exact=True)
+        snapshot = ItemCatalogSnapshot.build(repository.get_all(0, total))
+        with self._lock:
+            # Not published if an invalidation raced with the load.
+            if generation == self._generation:
+                self._snapshot = snapshot
+        return snapshot
+
+
+class CatalogItemRepository(ItemRepository):
+    """Item repository serving every read from the in-memory catalog.
+
+    Writes go to the wrapped repository and then publish a fresh snapshot.
+    Every read returns copies, so callers may mutate what they get (services
+    do, before calling ``update``) without touching the shared snapshot.
+    """
+
+    def __init__(self, repository: ItemRepository, catalog: ItemCatalog):
+        self._repository = repository
+        self._catalog = catalog
+
+    def create(self, entity: Item) -> Item:
+        created = self._repository.create(entity)
+        self._catalog.reload(self._repository)
+        return created
+
+    def create_many(self, entities: list[Item]) -> list[Item]:
+        created = self._repository.create_many(entities)
+        if created:
+            self._catalog.reload(self._repository)
+        return created
+
+    def get_by_id(self, entity_id: int) -> Item | None:
+        item = self._catalog.snapshot(self._repository).by_id.get(entity_id)
+        return replace(item) if item is not None else None
+
+    def get_all(
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
+    ) -> list[Item]:
+        if query is not None:
+            # Filtered and sorted pages are index scans in the database.
+            return self._repository.get_all(skip, limit, query)
+        items = self._catalog.snapshot(self._repository).items
+        return _copies(items[skip : skip + limit])
+
+    def update(self, entity_id: int, entity: Item) -> Item | None:
+        updated = self._repository.update(entity_id, entity)
+        if updated is not None:
+            self._catalog.reload(self._repository)
+        return updated
+
+    def delete(self, entity_id: int) -> bool:
+        deleted = self._repository.delete(entity_id)
+        if deleted:
+            self._catalog.reload(self._repository)
+        return deleted
+
+    def iter_chunks(self, chunk_size: int = 500) -> Iterator[list[Item]]:
+        items = self._catalog.snapshot(self._repository).items
+        for start in range(0, len(items), chunk_size):
+            yield _copies(items[start : start + chunk_size])
+
+    def count(self, exact: bool = False, query: ListQuery | None = None) -> int:
+        if exact or query is not None:
+            return self._repository.count(exact=exact, query=query)
+        return len(self._catalog.snapshot(self._repository).items)
+
+    def get_by_type(self, item_type: str) -> list[Item]:
+        try:
+            key = ItemType(item_type)
+        except ValueError:
+            return []
+        return _copies(self._catalog.snapshot(self._repository).by_type.get(key, ()))
+
+    def get_by_price_range(self, min_price: int, max_price: int) -> list[Item]:
+        snapshot = self._catalog.snapshot(self._repository)
+        return _copies(snapshot.in_price_range(min_price, max_price))
+
+
+def _copies(items: Iterable[Item]) -> list[Item]:
+    return [replace(item) for item in items]
+
+
+item_catalog = ItemCatalog()
+
+
+def with_item_catalog(repository: SqlModelItemRepository) -> ItemRepository:
+    """Serve item reads from the shared catalog when it is enabled."""
+    if not settings.ITEM_CATALOG_ENABLED:
+        return repository
+    return CatalogItemRepository(repository, item_catalog)
+
+
+def _invalidate_item_catalog(table_name: str) -> None:
+    if table_name == ItemModel.__tablename__:
+        item_catalog.invalidate()
+
+
+table_versions.add_listener(_invalidate_item_catalog)
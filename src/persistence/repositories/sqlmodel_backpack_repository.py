@@ -1,5 +1,7 @@
+from collections.abc import Collection
+
 from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlmodel import Session, col
 
 from src.domain.entities.backpack import Backpack
 from src.domain.repositories.backpack_repository import BackpackRepository
@@ -54,12 +56,42 @@ class SqlModelBackpackRepository(
 
         if existing:
             existing.quantity += backpack.quantity
-            self.db.commit()
+            self._commit()
             self.db.refresh(existing)
             return self._model_to_entity(existing)
         else:
             return self.create(backpack)  # Use generic create
 
+    def add_items(self, backpacks: list[Backpack]) -> list[Backpack]:
+        """Add many entries in one transaction, merging quantities like add_item.
+
+        Returns the resulting entry for each input, in input order; inputs for
+        the same trainer and item share one row.
+        """
+        if not backpacks:
+            return []
+        pairs = [(backpack.trainer_id, backpack.item_id) for backpack in backpacks]
+        rows = self._find_entries(pairs)
+        inserted = 0
+        for pair, backpack in zip(pairs, backpacks, strict=True):
+            row = rows.get(pair)
+            if row is None:
+                row = BackpackModel(
+                    trainer_id=backpack.trainer_id, item_id=backpack.item_id, quantity=0
+                )
+                rows[pair] = row
+                self.db.add(row)
+                inserted += 1
+            row.quantity += backpack.quantity
+
+        # One flush batches the inserts; entities are read before the commit
+        # expires the rows.
+        self.db.flush()
+        entries = [self._model_to_entity(rows[pair]) for pair in pairs]
+        self._commit()
+        self._adjust_row_count(inserted)
+        return entries
+
     def remove_item(self, trainer_id: int, item_id: int, quantity: int) -> bool:
         """Remove item from backpack - custom logic."""
         db_backpack = (
@@ -76,12 +108,15 @@ class SqlModelBackpackRepository(
         if not db_backpack:
             return False
 
-        if db_backpack.quantity <= quantity:
+        removed_row = db_backpack.quantity <= quantity
+        if removed_row:
             self.db.delete(db_backpack)
         else:
             db_backpack.quantity -= quantity
 
-        self.db.commit()
+        self._commit()
+        if removed_row:
+            self._adjust_row_count(-1)
         return True
 
     def get_trainer_backpack(self, trainer_id: int) -> list[Backpack]:
@@ -107,6 +142,34 @@ class SqlModelBackpackRepository(
         )
         return db_backpack.quantity if db_backpack else 0
 
+    def get_item_quantities(
+        self, pairs: Collection[tuple[int, int]]
+    ) -> dict[tuple[int, int], int]:
+        """Current quantity of every pair that is in a backpack."""
+        return {pair: row.quantity for pair, row in self._find_entries(pairs).items()}
+
+    def _find_entries(
+        self, pairs: Collection[tuple[int, int]]
+    ) -> dict[tuple[int, int], BackpackModel]:
+        wanted = set(pairs)
+        if not wanted:
+            return {}
+        db_backpacks = (
+            self.db.query(BackpackModel)
+            .filter(
+                col(BackpackModel.trainer_id).in_(
+                    {trainer_id for trainer_id, _ in wanted}
+                ),
+                col(BackpackModel.item_id).in_({item_id for _, item_id in wanted}),
+            )
+            .all()
+        )
+        return {
+            (row.trainer_id, row.item_id): row
+            for row in db_backpacks
+            if (row.trainer_id, row.item_id) in wanted
+        }
+
     def update_quantity(
         self, trainer_id: int, item_id: int, new_quantity: int
     ) -> Backpack | None:
@@ -127,11 +190,12 @@ class SqlModelBackpackRepository(
 
         if new_quantity <= 0:
             self.db.delete(db_backpack)
-            self.db.commit()
+            self._commit()
+            self._adjust_row_count(-1)
             return None
         else:
             db_backpack.quantity = new_quantity
-            self.db.commit()
+            self._commit()
             self.db.refresh(db_backpack)
             return self._model_to_entity(db_backpack)
 
@@ -142,5 +206,6 @@ class SqlModelBackpackRepository(
             .filter(BackpackModel.trainer_id == trainer_id)
             .delete()
         )
-        self.db.commit()
+        self._commit()
+        self._adjust_row_count(-deleted_count)
         return bool(deleted_count > 0)
@@ -1,15 +1,39 @@
-from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session
+from collections.abc import Collection, Iterator
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, case, delete, func, insert, or_, select, union_all
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session
 
 from src.domain.entities.battle import Battle
 from src.domain.repositories.battle_repository import BattleRepository
-from src.persistence.database.models import BattleModel, TrainerModel
-from src.persistence.repositories.base_sqlmodel_repository import BaseSqlModelRepository
+from src.persistence.database.models import (
+    BattleModel,
+    TeamModel,
+    TrainerBattleStatsModel,
+    TrainerModel,
+)
+from src.persistence.repositories.base_sqlmodel_repository import (
+    BaseSqlModelRepository,
+    model_table,
+)
 
 
 class SqlModelBattleRepository(
     BaseSqlModelRepository[Battle, BattleModel], BattleRepository
 ):
+    filter_fields = frozenset(
+        {
+            "id",
+            "team1_trainer_id",
+            "team2_trainer_id",
+            "winner_trainer_id",
+            "battle_date",
+        }
+    )
+    sort_fields = frozenset({"id", "battle_date"})
+
     def __init__(self, db: Session):
         super().__init__(
             db=db,
@@ -44,8 +68,232 @@ class SqlModelBattleRepository(
             battle_details=model.battle_details,
         )
 
+    def create(self, entity: Battle) -> Battle:
+        return self.create_battle(entity)
+
     def create_battle(self, battle: Battle) -> Battle:
-        return self.create(battle)
+        """Insert a battle with RETURNING, avoiding the refresh round-trip.
+
+        Both participants' ``trainer_battle_stats`` rows are updated in the
+        same transaction.
+        """
+        db_model = self._entity_to_model(battle)
+        statement = (
+            insert(BattleModel)
+            .values(**db_model.model_dump(exclude={"id"}))
+            .returning(BattleModel)
+        )
+        created = self._model_to_entity(self.db.scalars(statement).one())
+        for trainer_id in (created.team1_trainer_id, created.team2_trainer_id):
+            self._record_battle_result(
+                trainer_id,
+                won=trainer_id == created.winner_trainer_id,
+                battle_date=created.battle_date,
+            )
+        self._commit(TrainerBattleStatsModel.__tablename__)
+        self._adjust_row_count(1)
+        return created
+
+    def create_many(self, entities: list[Battle]) -> list[Battle]:
+        return self.create_battles(entities)
+
+    def create_battles(self, battles: list[Battle]) -> list[Battle]:
+        """Insert battles in one batched statement and transaction.
+
+        The participants' stats rows are rebuilt once from the battles table
+        instead of being upserted per battle.
+        """
+        if not battles:
+            return []
+        created = self._insert_many(battles)
+        trainer_ids = {
+            trainer_id
+            for battle in created
+            for trainer_id in (battle.team1_trainer_id, battle.team2_trainer_id)
+        }
+        self._refresh_trainer_stats(trainer_ids)
+        self._commit(TrainerBattleStatsModel.__tablename__)
+        self._adjust_row_count(len(created))
+        return created
+
+    def delete(self, entity_id: int) -> bool:
+        """Delete a battle and refresh its participants' stats rows."""
+        db_model = self.db.get(BattleModel, entity_id)
+        if not db_model:
+            return False
+
+        trainer_ids = {db_model.team1_trainer_id, db_model.team2_trainer_id}
+        self.db.delete(db_model)
+        self.db.flush()
+        self._refresh_trainer_stats(trainer_ids)
+        self._commit(TrainerBattleStatsModel.__tablename__)
+        self._adjust_row_count(-1)
+        return True
+
+    def _record_battle_result(
+        self, trainer_id: int, won: bool, battle_date: datetime
+    ) -> None:
+        """Fold one battle into a trainer's stats row with a single upsert."""
+        stats = model_table(TrainerBattleStatsModel).c
+        statement = sqlite_insert(TrainerBattleStatsModel).values(
+            trainer_id=trainer_id,
+            wins=int(won),
+            losses=int(not won),
+            total_battles=1,
+            win_rate=100.0 if won else 0.0,
+            last_battle_at=battle_date,
+        )
+        new = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=[stats.trainer_id],
+            set_={
+                "wins": stats.wins + new.wins,
+                "losses": stats.losses + new.losses,
+                "total_battles": stats.total_battles + 1,
+                "win_rate": func.round(
+                    (stats.wins + new.wins) * 100.0 / (stats.total_battles + 1), 2
+                ),
+                "last_battle_at": func.max(
+                    func.coalesce(stats.last_battle_at, new.last_battle_at),
+                    new.last_battle_at,
+                ),
+            },
+        )
+        self.db.execute(statement)
+
+    def _refresh_trainer_stats(self, trainer_ids: set[int] | None = None) -> None:
+        """Recompute stats rows from the battles table.
+
+        With ``trainer_ids`` only those trainers are rebuilt (an indexed read of
+        their own battles); without it the whole table is rebuilt.
+        """
+        stats_table = model_table(TrainerBattleStatsModel)
+        battles = self._table.c
+
+        participant_selects = [
+            select(
+                battles.team1_trainer_id.label("trainer_id"),
+                battles.winner_trainer_id,
+                battles.battle_date,
+            ),
+            select(
+                battles.team2_trainer_id.label("trainer_id"),
+                battles.winner_trainer_id,
+                battles.battle_date,
+            ),
+        ]
+        if trainer_ids is not None:
+            participant_selects[0] = participant_selects[0].where(
+                battles.team1_trainer_id.in_(trainer_ids)
+            )
+            participant_selects[1] = participant_selects[1].where(
+                battles.team2_trainer_id.in_(trainer_ids)
+            )
+        participants = union_all(*participant_selects).subquery("participants")
+
+        wins = func.sum(
+            case(
+                (participants.c.winner_trainer_id == participants.c.trainer_id, 1),
+                else_=0,
+            )
+        )
+        total = func.count()
+        aggregate = select(
+            participants.c.trainer_id,
+            wins,
+            total - wins,
+            total,
+            func.round(wins * 100.0 / total, 2),
+            func.max(participants.c.battle_date),
+        ).group_by(participants.c.trainer_id)
+
+        clear = delete(stats_table)
+        if trainer_ids is not None:
+            clear = clear.where(stats_table.c.trainer_id.in_(trainer_ids))
+        self.db.execute(clear)
+        self.db.execute(
+            insert(stats_table).from_select(
+                [
+                    "trainer_id",
+                    "wins",
+                    "losses",
+                    "total_battles",
+                    "win_rate",
+                    "last_battle_at",
+                ],
+                aggregate,
+            )
+        )
+
+    def rebuild_trainer_battle_stats(self) -> int:
+        """Recompute every stats row from scratch (backfill and drift repair)."""
+        self._refresh_trainer_stats()
+        self._commit(TrainerBattleStatsModel.__tablename__)
+        statement = select(func.count()).select_from(TrainerBattleStatsModel)
+        return int(self.db.execute(statement).scalar_one())
+
+    def get_battle_validation_data(
+        self, team1_trainer_id: int, team2_trainer_id: int, winner_trainer_id: int
+    ) -> dict:
+        """Fetch participant names and active team sizes in a single query."""
+        statement = select(
+            self._trainer_name_subquery(team1_trainer_id).label("team1_trainer_name"),
+            self._trainer_name_subquery(team2_trainer_id).label("team2_trainer_name"),
+            self._trainer_name_subquery(winner_trainer_id).label("winner_trainer_name"),
+            self._active_team_size_subquery(team1_trainer_id).label("team1_size"),
+            self._active_team_size_subquery(team2_trainer_id).label("team2_size"),
+        )
+        return dict(self.db.execute(statement).one()._mapping)
+
+    def get_battle_participants(self, trainer_ids: Collection[int]) -> dict[int, dict]:
+        """Names and active team sizes of the existing trainers among ``trainer_ids``."""
+        trainers = model_table(TrainerModel).c
+        teams = model_table(TeamModel).c
+        team_sizes = (
+            select(teams.trainer_id, func.count(teams.id).label("team_size"))
+            .where(and_(teams.trainer_id.in_(trainer_ids), teams.is_active))
+            .group_by(teams.trainer_id)
+            .subquery("team_sizes")
+        )
+        statement = (
+            select(
+                trainers.id,
+                trainers.name,
+                func.coalesce(team_sizes.c.team_size, 0).label("team_size"),
+            )
+            .outerjoin(team_sizes, team_sizes.c.trainer_id == trainers.id)
+            .where(trainers.id.in_(trainer_ids))
+        )
+        return {
+            row.id: {"trainer_name": row.name, "team_size": row.team_size}
+            for row in self.db.execute(statement)
+        }
+
+    def _trainer_name_subquery(self, trainer_id: int) -> Any:
+        trainers = model_table(TrainerModel).c
+        return select(trainers.name).where(trainers.id == trainer_id).scalar_subquery()
+
+    def _active_team_size_subquery(self, trainer_id: int) -> Any:
+        teams = model_table(TeamModel).c
+        return (
+            select(func.count(teams.id))
+            .where(and_(teams.trainer_id == trainer_id, teams.is_active))
+            .scalar_subquery()
+        )
+
+    def iter_battles(
+        self,
+        chunk_size: int = 500,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> Iterator[list[Battle]]:
+        battle_date = self._table.c.battle_date
+        conditions = []
+        if date_from is not None:
+            conditions.append(battle_date >= date_from)
+        if date_to is not None:
+            conditions.append(battle_date <= date_to)
+        return self._iter_chunks(chunk_size, *conditions)
 
     def get_battles_by_trainer(self, trainer_id: int) -> list[Battle]:
         db_battles = (
@@ -62,103 +310,97 @@ class SqlModelBattleRepository(
         return [self._model_to_entity(battle) for battle in db_battles]
 
     def get_trainer_wins(self, trainer_id: int) -> int:
-        count = (
-            self.db.query(BattleModel)
-            .filter(BattleModel.winner_trainer_id == trainer_id)
-            .count()
-        )
-        return int(count)
+        return int(self.get_trainer_battle_stats(trainer_id)["wins"])
 
     def get_trainer_losses(self, trainer_id: int) -> int:
-        count = (
-            self.db.query(BattleModel)
-            .filter(
-                and_(
-                    or_(
-                        BattleModel.team1_trainer_id == trainer_id,
-                        BattleModel.team2_trainer_id == trainer_id,
-                    ),
-                    BattleModel.winner_trainer_id != trainer_id,
-                )
-            )
-            .count()
-        )
-        return int(count)
+        return int(self.get_trainer_battle_stats(trainer_id)["losses"])
 
-    def get_leaderboard_data(self) -> list[dict]:
-        subquery_wins = (
-            self.db.query(
-                BattleModel.__table__.c.winner_trainer_id.label(
-                    "trainer_id"
-                ),  # ← Cambio aquí
-                func.count(BattleModel.__table__.c.id).label("wins"),  # ← Cambio aquí
+    def get_trainer_battle_stats(self, trainer_id: int) -> dict:
+        """Aggregate a trainer's battle record in a single query."""
+        battles = self._table.c
+        won = func.sum(case((battles.winner_trainer_id == trainer_id, 1), else_=0))
+        statement = select(
+            self._trainer_name_subquery(trainer_id).label("trainer_name"),
+            func.coalesce(won, 0).label("wins"),
+            func.count(battles.id).label("total_battles"),
+            func.avg(battles.victory_margin).label("average_victory_margin"),
+            func.max(battles.battle_date).label("last_battle_date"),
+        ).where(
+            or_(
+                battles.team1_trainer_id == trainer_id,
+                battles.team2_trainer_id == trainer_id,
             )
-            .group_by(BattleModel.__table__.c.winner_trainer_id)
-            .subquery()
         )
+        row = self.db.execute(statement).one()
 
-        subquery_total = (
-            self.db.query(
-                func.coalesce(
-                    BattleModel.__table__.c.team1_trainer_id,
-                    BattleModel.__table__.c.team2_trainer_id,
-                ).label("trainer_id"),
-                func.count(BattleModel.__table__.c.id).label("total_battles"),
-            )
-            .filter(
-                or_(
-                    BattleModel.team1_trainer_id is not None,  # ← Cambio aquí
-                    BattleModel.team2_trainer_id is not None,  # ← Cambio aquí
-                )
-            )
-            .group_by(
-                func.coalesce(
-                    BattleModel.__table__.c.team1_trainer_id,
-                    BattleModel.__table__.c.team2_trainer_id,
-                )
-            )
-            .subquery()
-        )
+        wins = int(row.wins)
+        total = int(row.total_battles)
+        return {
+            "trainer_id": trainer_id,
+            "trainer_name": row.trainer_name,
+            "wins": wins,
+            "losses": total - wins,
+            "total_battles": total,
+            "win_rate": round(wins / total * 100, 2) if total > 0 else 0.0,
+            "average_victory_margin": row.average_victory_margin,
+            "last_battle_date": row.last_battle_date,
+        }
 
-        results = (
-            self.db.query(
-                TrainerModel.__table__.c.id,
-                TrainerModel.__table__.c.name,
-                func.coalesce(subquery_wins.c.wins, 0).label("wins"),
-                func.coalesce(subquery_total.c.total_battles, 0).label("total_battles"),
-            )
-            .outerjoin(
-                subquery_wins, TrainerModel.__table__.c.id == subquery_wins.c.trainer_id
+    def get_leaderboard_data(self, skip: int = 0, limit: int = 100) -> list[dict]:
+        """Read one leaderboard page from ``trainer_battle_stats``.
+
+        The ordering matches ``ix_trainer_battle_stats_ranking``, so the cost is
+        an index walk of ``skip + limit`` rows regardless of battle history.
+        """
+        stats_table = model_table(TrainerBattleStatsModel)
+        trainers_table = model_table(TrainerModel)
+        stats, trainers = stats_table.c, trainers_table.c
+        statement = (
+            select(
+                trainers.id,
+                trainers.name,
+                stats.wins,
+                stats.losses,
+                stats.total_battles,
+                stats.win_rate,
             )
-            .outerjoin(
-                subquery_total,
-                TrainerModel.__table__.c.id == subquery_total.c.trainer_id,
+            .join_from(
+                stats_table,
+                trainers_table,
+                trainers.id == stats.trainer_id,
             )
-            .filter(func.coalesce(subquery_total.c.total_battles, 0) > 0)
-            .all()
+            .order_by(stats.wins.desc(), stats.win_rate.desc(), stats.trainer_id)
+            .offset(skip)
+            .limit(limit)
         )
 
-        leaderboard_data = []
-        for result in results:
-            wins = int(result.wins)
-            total = int(result.total_battles)
-            losses = total - wins
-            win_rate = (wins / total * 100) if total > 0 else 0
-
-            leaderboard_data.append(
-                {
-                    "trainer_id": result.id,
-                    "trainer_name": result.name,
-                    "wins": wins,
-                    "losses": losses,
-                    "total_battles": total,
-                    "win_rate": round(win_rate, 2),
-                }
-            )
+        return [
+            {
+                "trainer_id": row.id,
+                "trainer_name": row.name,
+                "wins": row.wins,
+                "losses": row.losses,
+                "total_battles": row.total_battles,
+                "win_rate": row.win_rate,
+            }
+            for row in self.db.execute(statement)
+        ]
 
-        return sorted(
-            leaderboard_data, key=lambda x: (x["wins"], x["win_rate"]), reverse=True
+    def get_leaderboard_totals(self) -> dict:
+        """Ranked trainers and recorded battles, independent of the page."""
+        stats_table = model_table(TrainerBattleStatsModel)
+        trainers_table = model_table(TrainerModel)
+        stats, trainers = stats_table.c, trainers_table.c
+        statement = select(func.count()).join_from(
+            stats_table,
+            trainers_table,
+            trainers.id == stats.trainer_id,
         )
+        # The battle total is the cached row counter, not a table scan.
+        return {
+            "ranked_trainers": int(self.db.execute(statement).scalar_one()),
+            "recorded_battles": self.count(),
+        }
 
     def delete_battle(self, battle_id: int) -> bool:
         return self.delete(battle_id)
@@ -1,7 +1,6 @@
 from typing import Any
 
-from sqlalchemy.orm import Session
-from sqlmodel import select
+from sqlmodel import Session, col, select
 
 from src.domain.entities.item import Item, ItemType
 from src.domain.repositories.item_repository import ItemRepository
@@ -12,6 +11,9 @@ from src.persistence.repositories.base_sqlmodel_repository import BaseSqlModelRe
 class SqlModelItemRepository(BaseSqlModelRepository[Item, ItemModel], ItemRepository):
     """SQLModel-based Item repository with generics."""
 
+    filter_fields = frozenset({"id", "name", "type", "price"})
+    sort_fields = filter_fields
+
     def __init__(self, db: Session):
         super().__init__(
             db=db,
@@ -52,3 +54,13 @@ class SqlModelItemRepository(BaseSqlModelRepository[Item, ItemModel], ItemReposi
         statement = select(ItemModel).where(ItemModel.type == item_type)
         db_models = self.db.exec(statement).all()
         return [self._model_to_entity(model) for model in db_models]
+
+    def get_by_price_range(self, min_price: int, max_price: int) -> list[Item]:
+        """Get items priced within ``[min_price, max_price]``, cheapest first."""
+        statement = (
+            select(ItemModel)
+            .where(ItemModel.price >= min_price, ItemModel.price <= max_price)
+            .order_by(col(ItemModel.price))
+        )
+        db_models = self.db.exec(statement).all()
+        return [self._model_to_entity(model) for model in db_models]
@@ -1,9 +1,11 @@
 import json
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlmodel import Session, col, select
 
 from src.domain.entities.pokemon import Pokemon, PokemonNature, PokemonType
+from src.domain.repositories.list_query import ListQuery
 from src.domain.repositories.pokemon_repository import PokemonRepository
 from src.persistence.database.models import PokemonModel
 from src.persistence.repositories.base_sqlmodel_repository import BaseSqlModelRepository
@@ -14,6 +16,11 @@ class SqlModelPokemonRepository(
 ):
     """SQLModel-based Pokemon repository with generics."""
 
+    filter_fields = frozenset(
+        {"id", "name", "type_primary", "type_secondary", "nature"}
+    )
+    sort_fields = filter_fields
+
     def __init__(self, db: Session):
         super().__init__(
             db=db,
@@ -38,13 +45,6 @@ class SqlModelPokemonRepository(
 
     def _model_to_entity(self, model: PokemonModel) -> Pokemon:
         """Convert SQLModel to Pokemon entity."""
-        attacks_list = []
-        if model.attacks:
-            try:
-                attacks_list = json.loads(model.attacks)
-            except json.JSONDecodeError:
-                attacks_list = []
-
         return Pokemon(
             id=model.id,
             name=model.name,
@@ -52,11 +52,50 @@ class SqlModelPokemonRepository(
             type_secondary=PokemonType(model.type_secondary)
             if model.type_secondary
             else None,
-            attacks=attacks_list,
+            attacks=self._decode_attacks(model.attacks),
             nature=PokemonNature(model.nature),
             level=model.level,
         )
 
+    def _decode_columns(self, row: dict[str, Any]) -> dict[str, Any]:
+        if "attacks" in row:
+            row["attacks"] = self._decode_attacks(row["attacks"])
+        return row
+
+    @staticmethod
+    def _decode_attacks(attacks: str | None) -> list[str]:
+        if not attacks:
+            return []
+        try:
+            return list(json.loads(attacks))
+        except json.JSONDecodeError:
+            return []
+
+    def get_row_versions(
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
+    ) -> list[tuple[int, int]]:
+        """Page of (id, version) pairs, in the same order as ``get_all``."""
+        statement = self._apply_query(
+            select(PokemonModel.id, PokemonModel.version), query
+        )
+        statement = statement.offset(skip).limit(limit)
+        return [
+            (pokemon_id, version)
+            for pokemon_id, version in self.db.exec(statement).all()
+            if pokemon_id is not None
+        ]
+
+    def get_by_ids(self, pokemon_ids: list[int]) -> list[Pokemon]:
+        if not pokemon_ids:
+            return []
+        statement = select(PokemonModel).where(col(PokemonModel.id).in_(pokemon_ids))
+        return [self._model_to_entity(model) for model in self.db.exec(statement)]
+
+    def get_average_level(self) -> float:
+        statement = select(func.avg(PokemonModel.level))
+        average = self.db.exec(statement).one()
+        return float(average) if average is not None else 0.0
+
     def _get_enum_value(self, field: Any) -> str | None:
         """Get string value from enum."""
         if field is None:
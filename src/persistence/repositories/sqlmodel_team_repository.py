@@ -1,11 +1,19 @@
 from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
 
 from src.domain.entities.team import Team
+from src.domain.exceptions import BusinessRuleException
 from src.domain.repositories.team_repository import TeamRepository
 from src.persistence.database.models import TeamModel
 from src.persistence.repositories.base_sqlmodel_repository import BaseSqlModelRepository
 
+_ACTIVE_POSITION_INDEX = "ux_teams_trainer_position_active"
+# SQLite reports the indexed columns instead of the index name.
+_SQLITE_ACTIVE_POSITION_ERROR = (
+    "UNIQUE constraint failed: teams.trainer_id, teams.position"
+)
+
 
 class SqlModelTeamRepository(BaseSqlModelRepository[Team, TeamModel], TeamRepository):
     """SQLModel-based Team repository with generics."""
@@ -41,7 +49,13 @@ class SqlModelTeamRepository(BaseSqlModelRepository[Team, TeamModel], TeamReposi
     # Domain-specific methods (not covered by generics)
     def add_pokemon_to_team(self, team: Team) -> Team:
         """Add Pokemon to team - uses generic create."""
-        return self.create(team)
+        try:
+            return self.create(team)
+        except IntegrityError as e:
+            self.db.rollback()
+            if not _violates_active_position(e):
+                raise
+            raise self._position_taken(team.trainer_id, team.position) from e
 
     def remove_pokemon_from_team(self, trainer_id: int, pokemon_id: int) -> bool:
         """Remove Pokemon from team - custom logic."""
@@ -61,7 +75,7 @@ class SqlModelTeamRepository(BaseSqlModelRepository[Team, TeamModel], TeamReposi
             return False
 
         db_team.is_active = False
-        self.db.commit()
+        self._commit()
         return True
 
     def get_team_by_trainer(self, trainer_id: int) -> list[Team]:
@@ -109,7 +123,13 @@ class SqlModelTeamRepository(BaseSqlModelRepository[Team, TeamModel], TeamReposi
             return None
 
         db_team.position = new_position
-        self.db.commit()
+        try:
+            self._commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if not _violates_active_position(e):
+                raise
+            raise self._position_taken(trainer_id, new_position) from e
         self.db.refresh(db_team)
         return self._model_to_entity(db_team)
 
@@ -121,3 +141,19 @@ class SqlModelTeamRepository(BaseSqlModelRepository[Team, TeamModel], TeamReposi
             .count()
         )
         return int(count)
+
+    def _position_taken(self, trainer_id: int, position: int) -> BusinessRuleException:
+        """Translate a unique active-position violation into a domain error."""
+        return BusinessRuleException(
+            f"Position {position} is already occupied in trainer {trainer_id}'s team"
+        )
+
+
+def _violates_active_position(error: IntegrityError) -> bool:
+    """Whether ``error`` is the unique active-position index and nothing else."""
+    # PostgreSQL drivers name the constraint; SQLite only has the message.
+    constraint = getattr(getattr(error.orig, "diag", None), "constraint_name", None)
+    if constraint is not None:
+        return bool(constraint == _ACTIVE_POSITION_INDEX)
+    message = str(error.orig)
+    return _ACTIVE_POSITION_INDEX in message or message == _SQLITE_ACTIVE_POSITION_ERROR
@@ -1,8 +1,10 @@
 from typing import Any
 
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session
 
 from src.domain.entities.trainer import Gender, Region, Trainer
+from src.domain.repositories.list_query import ListQuery
 from src.domain.repositories.trainer_repository import TrainerRepository
 from src.persistence.database.models import TeamModel, TrainerModel
 from src.persistence.repositories.base_sqlmodel_repository import BaseSqlModelRepository
@@ -11,6 +13,9 @@ from src.persistence.repositories.base_sqlmodel_repository import BaseSqlModelRe
 class SqlModelTrainerRepository(
     BaseSqlModelRepository[Trainer, TrainerModel], TrainerRepository
 ):
+    filter_fields = frozenset({"id", "name", "region"})
+    sort_fields = filter_fields
+
     def __init__(self, db: Session):
         super().__init__(
             db=db,
@@ -30,12 +35,16 @@ class SqlModelTrainerRepository(
         )
         return self._model_to_entity(model) if model else None
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[Trainer]:
+    def get_all(
+        self, skip: int = 0, limit: int = 100, query: ListQuery | None = None
+    ) -> list[Trainer]:
         models = (
             self.db.query(self.model_class)
             .options(
                 selectinload(TrainerModel.team_members).joinedload(TeamModel.pokemon)
             )
+            .filter(*self._filter_conditions(query))
+            .order_by(*self._sort_columns(query))
             .offset(skip)
             .limit(limit)
             .all()
@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from sqlmodel import Session, select
+from sqlalchemy import or_
+from sqlmodel import Session, col, select
 
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import UserRepository
@@ -31,6 +32,7 @@ class SqlModelUserRepository(BaseSqlModelRepository[User, UserModel], UserReposi
             created_at=user.created_at,
             updated_at=user.updated_at,
             trainer_id=user.trainer_id,
+            token_version=user.token_version,
         )
 
     def _model_to_entity(self, model: UserModel) -> User:
@@ -45,6 +47,7 @@ class SqlModelUserRepository(BaseSqlModelRepository[User, UserModel], UserReposi
             created_at=model.created_at,
             updated_at=model.updated_at,
             trainer_id=model.trainer_id,
+            token_version=model.token_version,
         )
 
     # Domain-specific methods
@@ -60,6 +63,22 @@ class SqlModelUserRepository(BaseSqlModelRepository[User, UserModel], UserReposi
         db_user = self.db.exec(statement).first()
         return self._model_to_entity(db_user) if db_user else None
 
+    def get_revoked_tokens(self) -> dict[int, int | None]:
+        """Only reads the few users that ever revoked tokens or are inactive."""
+        statement = select(
+            UserModel.id, UserModel.token_version, UserModel.is_active
+        ).where(
+            or_(
+                col(UserModel.token_version) > 0,
+                col(UserModel.is_active).is_(False),
+            )
+        )
+        return {
+            user_id: token_version if is_active else None
+            for user_id, token_version, is_active in self.db.exec(statement)
+            if user_id is not None
+        }
+
     def update(self, user_id: int, user: User) -> User | None:
         """Update user with timestamp - custom logic."""
         db_user = self.db.get(UserModel, user_id)
@@ -72,9 +91,10 @@ class SqlModelUserRepository(BaseSqlModelRepository[User, UserModel], UserReposi
         db_user.is_active = user.is_active
         db_user.is_superuser = user.is_superuser
         db_user.trainer_id = user.trainer_id
+        db_user.token_version = user.token_version
         db_user.updated_at = datetime.utcnow()
 
         self.db.add(db_user)
-        self.db.commit()
+        self._commit()
         self.db.refresh(db_user)
         return self._model_to_entity(db_user)
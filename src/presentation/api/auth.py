@@ -1,7 +1,6 @@
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
 
 from src.application.dtos.auth_dto import (
     ChangePasswordDTO,
@@ -12,19 +11,18 @@ from src.application.dtos.auth_dto import (
     UserResponseDTO,
 )
 from src.application.services.auth_service import AuthService
+from src.application.services.password_hasher import PasswordHasherBusyError
+from src.config import settings
 from src.domain.entities.user import User
-from src.persistence.database import get_database
-from src.persistence.repositories import SqlModelUserRepository
-from src.presentation.dependencies.auth import get_current_active_user
+from src.presentation.dependencies.auth import (
+    get_auth_service,
+    get_current_active_user,
+    get_current_superuser,
+)
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
-def get_auth_service(db: Session = Depends(get_database)) -> AuthService:
-    user_repository = SqlModelUserRepository(db)
-    return AuthService(user_repository)
-
-
 @router.post(
     "/register", response_model=UserResponseDTO, status_code=HTTPStatus.CREATED
 )
@@ -33,6 +31,8 @@ def register_user(
 ) -> UserResponseDTO:
     try:
         return service.register_user(user_data)
+    except PasswordHasherBusyError as e:
+        raise _hasher_busy(e) from e
     except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
@@ -43,6 +43,8 @@ def login_user(
 ) -> LoginResponseDTO:
     try:
         return service.authenticate_user(login_data)
+    except PasswordHasherBusyError as e:
+        raise _hasher_busy(e) from e
     except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail=str(e))
 
@@ -50,18 +52,15 @@ def login_user(
 @router.get("/me", response_model=UserResponseDTO)
 def get_current_user_info(
     current_user: User = Depends(get_current_active_user),
+    service: AuthService = Depends(get_auth_service),
 ) -> UserResponseDTO:
-    from datetime import datetime
-
-    return UserResponseDTO(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        is_active=current_user.is_active,
-        is_superuser=current_user.is_superuser,
-        created_at=current_user.created_at or datetime.utcnow(),
-        trainer_id=current_user.trainer_id,
-    )
+    # The principal is built from token claims; the profile needs the row.
+    try:
+        if current_user.id is None:
+            raise ValueError("Invalid user ID")
+        return service.get_user_profile(current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(e))
 
 
 @router.put("/change-password", response_model=MessageResponseDTO)
@@ -75,5 +74,27 @@ def change_password(
             raise ValueError("Invalid user ID")
         service.change_password(current_user.id, password_data)
         return MessageResponseDTO(message="Password changed successfully")
+    except PasswordHasherBusyError as e:
+        raise _hasher_busy(e) from e
     except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+
+
+@router.post("/users/{user_id}/deactivate", response_model=UserResponseDTO)
+def deactivate_user(
+    user_id: int,
+    _: User = Depends(get_current_superuser),
+    service: AuthService = Depends(get_auth_service),
+) -> UserResponseDTO:
+    try:
+        return service.deactivate_user(user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(e))
+
+
+def _hasher_busy(error: PasswordHasherBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": str(settings.LOAD_SHEDDING_RETRY_AFTER_SECONDS)},
+    )
@@ -1,35 +1,49 @@
 from http import HTTPStatus
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
+from pydantic import TypeAdapter
+from sqlmodel import Session
 
 from src.application.dtos.backpack_dto import (
     BackpackAddItemDTO,
+    BackpackItemResponseDTO,
     BackpackRemoveItemDTO,
     BackpackResponseDTO,
     BackpackUpdateQuantityDTO,
 )
+from src.application.dtos.bulk_dto import BulkResponseDTO
 from src.application.services.backpack_service import BackpackService
+from src.config import settings
 from src.domain.exceptions import BusinessRuleException, EntityNotFoundException
 from src.persistence.database import get_database
 from src.persistence.repositories import (
     SqlModelBackpackRepository,
     SqlModelItemRepository,
     SqlModelTrainerRepository,
+    with_entity_cache,
+    with_item_catalog,
 )
+from src.presentation.dependencies.idempotency import IdempotentWrite
+from src.presentation.responses import bulk_json
 
 router = APIRouter(prefix="/backpacks", tags=["backpacks"])
 
+bulk_backpack_adapter = TypeAdapter(BulkResponseDTO[BackpackItemResponseDTO])
+
 
 def get_backpack_service(db: Session = Depends(get_database)) -> BackpackService:
     backpack_repository = SqlModelBackpackRepository(db)
-    trainer_repository = SqlModelTrainerRepository(db)
-    item_repository = SqlModelItemRepository(db)
+    trainer_repository = with_entity_cache(SqlModelTrainerRepository(db))
+    item_repository = with_item_catalog(SqlModelItemRepository(db))
     return BackpackService(backpack_repository, trainer_repository, item_repository)
 
 
 @router.post(
-    "/add-item", response_model=BackpackResponseDTO, status_code=HTTPStatus.CREATED
+    "/add-item",
+    response_model=BackpackResponseDTO,
+    status_code=HTTPStatus.CREATED,
+    dependencies=[Depends(IdempotentWrite())],
 )
 def add_item_to_backpack(
     backpack_data: BackpackAddItemDTO,
@@ -41,8 +55,25 @@ def add_item_to_backpack(
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkResponseDTO[BackpackItemResponseDTO],
+    status_code=HTTPStatus.CREATED,
+    responses={HTTPStatus.MULTI_STATUS: {"description": "Some rows failed"}},
+)
+def add_items_to_backpacks_bulk(
+    entries: Annotated[
+        list[BackpackAddItemDTO], Body(min_length=1, max_length=settings.BULK_MAX_ROWS)
+    ],
+    service: BackpackService = Depends(get_backpack_service),
+) -> Response:
+    return bulk_json(bulk_backpack_adapter, service.add_items_to_backpacks(entries))
+
+
 @router.delete(
-    "/trainers/{trainer_id}/items/{item_id}", response_model=BackpackResponseDTO
+    "/trainers/{trainer_id}/items/{item_id}",
+    response_model=BackpackResponseDTO,
+    dependencies=[Depends(IdempotentWrite())],
 )
 def remove_item_from_backpack(
     trainer_id: int,
@@ -0,0 +1,35 @@
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Body, HTTPException, Request, Response
+
+from src.application.dtos.batch_dto import BatchSubRequestDTO, BatchSubResponseDTO
+from src.config import settings
+from src.presentation.batch import execute_batch
+
+router = APIRouter(tags=["batch"])
+
+
+@router.post("/batch", response_model=list[BatchSubResponseDTO])
+async def run_batch(
+    request: Request,
+    sub_requests: Annotated[
+        list[BatchSubRequestDTO],
+        Body(min_length=1, max_length=settings.BATCH_MAX_REQUESTS),
+    ],
+) -> Response:
+    """Run several API calls in-process and return all their responses.
+
+    Sub-requests go through the whole app (middleware, auth, caching) with
+    the batch's credentials; each gets its own DB session from the pool.
+    """
+    own_path = request.scope["path"].rstrip("/")
+    for index, sub_request in enumerate(sub_requests):
+        if sub_request.path.partition("?")[0].rstrip("/") == own_path:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail=f"Sub-request {index} cannot be a batch request",
+            )
+
+    content = await execute_batch(request, sub_requests, settings.BATCH_MAX_CONCURRENCY)
+    return Response(content=content, media_type="application/json")
@@ -1,37 +1,77 @@
 from http import HTTPStatus
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlmodel import Session
 
-from persistence.repositories.sqlmodel_battle_repository import (
-    SqlModelBattleRepository,
-)
 from src.application.dtos.battle_dto import (
     BattleCreateDTO,
     BattleResponseDTO,
     LeaderboardResponseDTO,
+    TrainerBattleStatsDTO,
 )
+from src.application.dtos.bulk_dto import BulkResponseDTO
+from src.application.dtos.page_dto import PageResponseDTO
 from src.application.services.battle_service import BattleService
+from src.application.services.single_flight import SingleFlight
+from src.config import settings
 from src.domain.exceptions import BusinessRuleException, EntityNotFoundException
-from src.persistence.database import get_database
+from src.domain.repositories.list_query import ListQuery
+from src.persistence.database import get_database, table_versions
+from src.persistence.database.models import TrainerBattleStatsModel, TrainerModel
 from src.persistence.repositories import (
+    SqlModelBattleRepository,
     SqlModelTeamRepository,
     SqlModelTrainerRepository,
+    with_entity_cache,
 )
 from src.presentation.dependencies.auth import get_current_user
+from src.presentation.dependencies.conditional import ConditionalGet
+from src.presentation.dependencies.idempotency import IdempotentWrite
+from src.presentation.dependencies.list_query import get_list_query
+from src.presentation.dependencies.pagination import PaginationParams
+from src.presentation.responses import bulk_json, trusted_json
 
 router = APIRouter(prefix="/battles", tags=["battles"])
 
+battle_list_adapter = TypeAdapter(list[BattleResponseDTO])
+bulk_battle_adapter = TypeAdapter(BulkResponseDTO[BattleResponseDTO])
+
+leaderboard_flight: SingleFlight[LeaderboardResponseDTO] = SingleFlight(
+    ttl_seconds=settings.LEADERBOARD_CACHE_TTL_SECONDS,
+    stale_ttl_seconds=settings.LEADERBOARD_STALE_TTL_SECONDS,
+)
+_LEADERBOARD_TABLES = {
+    TrainerBattleStatsModel.__tablename__,
+    TrainerModel.__tablename__,
+}
+
+
+def _invalidate_leaderboard(table_name: str) -> None:
+    # A battle was recorded or a trainer renamed, by this or another worker.
+    if table_name in _LEADERBOARD_TABLES:
+        leaderboard_flight.invalidate()
+
+
+table_versions.add_listener(_invalidate_leaderboard, local_writes=True)
+
 
 def get_battle_service(db: Session = Depends(get_database)) -> BattleService:
     battle_repository = SqlModelBattleRepository(db)
-    trainer_repository = SqlModelTrainerRepository(db)
+    trainer_repository = with_entity_cache(SqlModelTrainerRepository(db))
     team_repository = SqlModelTeamRepository(db)
-    return BattleService(battle_repository, trainer_repository, team_repository)
+    return BattleService(
+        battle_repository, trainer_repository, team_repository, leaderboard_flight
+    )
 
 
-@router.post("/", response_model=BattleResponseDTO, status_code=HTTPStatus.CREATED)
+@router.post(
+    "/",
+    response_model=BattleResponseDTO,
+    status_code=HTTPStatus.CREATED,
+    dependencies=[Depends(IdempotentWrite())],
+)
 def create_battle(
     battle_data: BattleCreateDTO,
     service: BattleService = Depends(get_battle_service),
@@ -44,16 +84,40 @@ def create_battle(
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
 
 
-@router.get("/", response_model=list[BattleResponseDTO])
+@router.post(
+    "/bulk",
+    response_model=BulkResponseDTO[BattleResponseDTO],
+    status_code=HTTPStatus.CREATED,
+    responses={HTTPStatus.MULTI_STATUS: {"description": "Some rows failed"}},
+)
+def create_battles_bulk(
+    battles: Annotated[
+        list[BattleCreateDTO], Body(min_length=1, max_length=settings.BULK_MAX_ROWS)
+    ],
+    service: BattleService = Depends(get_battle_service),
+    current_user: Any = Depends(get_current_user),
+) -> Response:
+    """Record many battles (e.g. a tournament import) in one transaction."""
+    return bulk_json(bulk_battle_adapter, service.create_battles(battles))
+
+
+@router.get(
+    "/", response_model=list[BattleResponseDTO] | PageResponseDTO[BattleResponseDTO]
+)
 def get_all_battles(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    query: ListQuery | None = Depends(get_list_query),
     service: BattleService = Depends(get_battle_service),
     current_user: Any = Depends(get_current_user),
-) -> list[BattleResponseDTO]:
+) -> Response:
     """Get all battles."""
     try:
-        return service.get_all_battles(skip=skip, limit=limit)
+        battles = service.get_all_battles(
+            skip=pagination.skip, limit=pagination.limit, query=query
+        )
+        total = service.count_battles(exact=pagination.exact_count, query=query)
+        return pagination.respond_json(response, battle_list_adapter, battles, total)
     except Exception as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
 
@@ -63,24 +127,51 @@ def get_trainer_battles(
     trainer_id: int,
     service: BattleService = Depends(get_battle_service),
     current_user: Any = Depends(get_current_user),
-) -> list[BattleResponseDTO]:
+) -> Response:
     """Get battles for a specific trainer."""
     try:
-        return service.get_trainer_battles(trainer_id)
+        battles = service.get_trainer_battles(trainer_id)
     except EntityNotFoundException as e:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
+    return trusted_json(battle_list_adapter, battles)
 
 
-@router.get("/leaderboard", response_model=LeaderboardResponseDTO)
+@router.get("/trainer/{trainer_id}/stats", response_model=TrainerBattleStatsDTO)
+def get_trainer_stats(
+    trainer_id: int,
+    service: BattleService = Depends(get_battle_service),
+    current_user: Any = Depends(get_current_user),
+) -> TrainerBattleStatsDTO:
+    """Get aggregated battle statistics for a specific trainer."""
+    try:
+        return service.get_trainer_stats(trainer_id)
+    except EntityNotFoundException as e:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(e)) from e
+
+
+@router.get(
+    "/leaderboard",
+    response_model=LeaderboardResponseDTO,
+    dependencies=[
+        Depends(get_current_user),
+        Depends(
+            ConditionalGet(
+                "trainer_battle_stats", "battles", "trainers", per_principal=True
+            )
+        ),
+    ],
+)
 def get_leaderboard(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
     service: BattleService = Depends(get_battle_service),
     current_user: Any = Depends(get_current_user),
 ) -> LeaderboardResponseDTO:
     """Get battle leaderboard."""
     try:
-        return service.get_leaderboard()
+        return service.get_leaderboard(skip=skip, limit=limit)
     except Exception as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
 
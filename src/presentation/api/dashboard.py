@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends
+from sqlmodel import Session
+
+from src.application.dtos.battle_dto import LeaderboardEntryDTO
+from src.application.dtos.dashboard_dto import DashboardStatsDTO
+from src.application.services.aggregate_refresher import AggregateRefresher
+from src.application.services.battle_service import BattleService
+from src.application.services.dashboard_service import (
+    AVERAGE_LEVEL,
+    COUNTS,
+    TOP_TRAINERS,
+    DashboardService,
+)
+from src.config import settings
+from src.persistence.database import engine, table_versions
+from src.persistence.repositories import (
+    SqlModelBattleRepository,
+    SqlModelItemRepository,
+    SqlModelPokemonRepository,
+    SqlModelTeamRepository,
+    SqlModelTrainerRepository,
+)
+from src.presentation.dependencies.auth import get_current_user
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+dashboard_refresher = AggregateRefresher(
+    interval_seconds=settings.DASHBOARD_REFRESH_INTERVAL_SECONDS,
+    min_interval_seconds=settings.DASHBOARD_MIN_REFRESH_SECONDS,
+)
+
+
+def _dashboard_service(db: Session) -> DashboardService:
+    return DashboardService(
+        SqlModelTrainerRepository(db),
+        SqlModelPokemonRepository(db),
+        SqlModelItemRepository(db),
+    )
+
+
+def _compute_counts() -> dict[str, int]:
+    with Session(engine) as db:
+        return _dashboard_service(db).compute_counts()
+
+
+def _compute_average_level() -> float:
+    with Session(engine) as db:
+        return _dashboard_service(db).compute_average_level()
+
+
+def _compute_top_trainers() -> list[LeaderboardEntryDTO]:
+    with Session(engine) as db:
+        service = BattleService(
+            SqlModelBattleRepository(db),
+            SqlModelTrainerRepository(db),
+            SqlModelTeamRepository(db),
+        )
+        return service.get_leaderboard(
+            limit=settings.DASHBOARD_TOP_TRAINERS
+        ).leaderboard
+
+
+def _versions_of(*table_names: str) -> tuple[int, ...]:
+    return table_versions.versions(table_names)
+
+
+dashboard_refresher.register(
+    COUNTS, _compute_counts, lambda: _versions_of("trainers", "pokemon", "items")
+)
+dashboard_refresher.register(
+    AVERAGE_LEVEL, _compute_average_level, lambda: _versions_of("pokemon")
+)
+dashboard_refresher.register(
+    TOP_TRAINERS,
+    _compute_top_trainers,
+    lambda: _versions_of("trainer_battle_stats", "trainers"),
+)
+
+
+@router.get(
+    "/", response_model=DashboardStatsDTO, dependencies=[Depends(get_current_user)]
+)
+def get_dashboard_stats() -> DashboardStatsDTO:
+    """Latest precomputed dashboard figures; never waits on aggregation."""
+    return DashboardService.read(dashboard_refresher)
@@ -0,0 +1,84 @@
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from src.application.services.battle_service import BattleService
+from src.application.services.pokemon_service import PokemonService
+from src.application.services.trainer_service import TrainerService
+from src.config import settings
+from src.domain.exceptions import BusinessRuleException
+from src.persistence.database import get_database
+from src.persistence.repositories import (
+    SqlModelBattleRepository,
+    SqlModelPokemonRepository,
+    SqlModelTeamRepository,
+    SqlModelTrainerRepository,
+    with_entity_cache,
+)
+from src.presentation.dependencies.auth import get_current_user
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+router = APIRouter(
+    prefix="/export", tags=["export"], dependencies=[Depends(get_current_user)]
+)
+
+
+def _ndjson_response(
+    chunks: Iterator[Sequence[BaseModel]], filename: str
+) -> StreamingResponse:
+    """Stream one JSON document per line, encoding a chunk at a time."""
+
+    def lines() -> Iterator[bytes]:
+        for chunk in chunks:
+            if chunk:
+                yield b"".join(dto.model_dump_json().encode() + b"\n" for dto in chunk)
+
+    return StreamingResponse(
+        lines(),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/pokemon.ndjson", response_class=StreamingResponse)
+def export_pokemon(db: Session = Depends(get_database)) -> StreamingResponse:
+    service = PokemonService(SqlModelPokemonRepository(db))
+    return _ndjson_response(
+        service.iter_all(settings.EXPORT_CHUNK_SIZE), "pokemon.ndjson"
+    )
+
+
+@router.get("/trainers.ndjson", response_class=StreamingResponse)
+def export_trainers(db: Session = Depends(get_database)) -> StreamingResponse:
+    service = TrainerService(
+        SqlModelTrainerRepository(db),
+        SqlModelTeamRepository(db),
+        with_entity_cache(SqlModelPokemonRepository(db)),
+    )
+    return _ndjson_response(
+        service.iter_all(settings.EXPORT_CHUNK_SIZE), "trainers.ndjson"
+    )
+
+
+@router.get("/battles.ndjson", response_class=StreamingResponse)
+def export_battles(
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    db: Session = Depends(get_database),
+) -> StreamingResponse:
+    service = BattleService(
+        SqlModelBattleRepository(db),
+        with_entity_cache(SqlModelTrainerRepository(db)),
+        SqlModelTeamRepository(db),
+    )
+    try:
+        chunks = service.iter_battles(settings.EXPORT_CHUNK_SIZE, date_from, date_to)
+    except BusinessRuleException as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
+    return _ndjson_response(chunks, "battles.ndjson")
@@ -1,18 +1,32 @@
 from http import HTTPStatus
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
+from pydantic import TypeAdapter
+from sqlmodel import Session
 
+from src.application.dtos.bulk_dto import BulkResponseDTO
 from src.application.dtos.item_dto import ItemCreateDTO, ItemResponseDTO, ItemUpdateDTO
+from src.application.dtos.page_dto import PageResponseDTO
 from src.application.services.item_service import ItemService
+from src.config import settings
+from src.domain.exceptions import BusinessRuleException, ValidationException
+from src.domain.repositories.list_query import ListQuery
 from src.persistence.database import get_database
-from src.persistence.repositories import SqlModelItemRepository
+from src.persistence.repositories import SqlModelItemRepository, with_item_catalog
+from src.presentation.dependencies.conditional import ConditionalGet
+from src.presentation.dependencies.list_query import get_list_query
+from src.presentation.dependencies.pagination import PaginationParams
+from src.presentation.responses import bulk_json, trusted_json
 
 router = APIRouter(prefix="/items", tags=["items"])
 
+item_list_adapter = TypeAdapter(list[ItemResponseDTO])
+bulk_item_adapter = TypeAdapter(BulkResponseDTO[ItemResponseDTO])
+
 
 def get_item_service(db: Session = Depends(get_database)) -> ItemService:
-    item_repository = SqlModelItemRepository(db)
+    item_repository = with_item_catalog(SqlModelItemRepository(db))
     return ItemService(item_repository)
 
 
@@ -23,6 +37,34 @@ def create_item(
     return service.create_item(item)
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkResponseDTO[ItemResponseDTO],
+    status_code=HTTPStatus.CREATED,
+    responses={HTTPStatus.MULTI_STATUS: {"description": "Some rows failed"}},
+)
+def create_items_bulk(
+    items: Annotated[
+        list[ItemCreateDTO], Body(min_length=1, max_length=settings.BULK_MAX_ROWS)
+    ],
+    service: ItemService = Depends(get_item_service),
+) -> Response:
+    return bulk_json(bulk_item_adapter, service.create_many(items))
+
+
+@router.get("/price-range", response_model=list[ItemResponseDTO])
+def get_items_by_price_range(
+    min_price: int = 0,
+    max_price: int = 1_000_000,
+    service: ItemService = Depends(get_item_service),
+) -> Response:
+    try:
+        items = service.get_items_by_price_range(min_price, max_price)
+    except BusinessRuleException as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
+    return trusted_json(item_list_adapter, items)
+
+
 @router.get("/{item_id}", response_model=ItemResponseDTO)
 def get_item(
     item_id: int, service: ItemService = Depends(get_item_service)
@@ -35,11 +77,23 @@ def get_item(
     return item
 
 
-@router.get("/", response_model=list[ItemResponseDTO])
+@router.get(
+    "/",
+    response_model=list[ItemResponseDTO] | PageResponseDTO[ItemResponseDTO],
+    dependencies=[Depends(ConditionalGet("items"))],
+)
 def get_items(
-    skip: int = 0, limit: int = 100, service: ItemService = Depends(get_item_service)
-) -> list[ItemResponseDTO]:
-    return service.get_all_items(skip, limit)
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    query: ListQuery | None = Depends(get_list_query),
+    service: ItemService = Depends(get_item_service),
+) -> Response:
+    try:
+        items = service.get_all_items(pagination.skip, pagination.limit, query)
+        total = service.count(exact=pagination.exact_count, query=query)
+    except ValidationException as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
+    return pagination.respond_json(response, item_list_adapter, items, total)
 
 
 @router.put("/{item_id}", response_model=ItemResponseDTO)
@@ -66,5 +120,5 @@ def delete_item(item_id: int, service: ItemService = Depends(get_item_service))
 @router.get("/type/{item_type}", response_model=list[ItemResponseDTO])
 def get_items_by_type(
     item_type: str, service: ItemService = Depends(get_item_service)
-) -> list[ItemResponseDTO]:
-    return service.get_items_by_type(item_type)
+) -> Response:
+    return trusted_json(item_list_adapter, service.get_items_by_type(item_type))
@@ -1,22 +1,42 @@
 from http import HTTPStatus
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
+from pydantic import TypeAdapter
+from sqlmodel import Session
 
+from src.application.dtos.bulk_dto import BulkResponseDTO
+from src.application.dtos.page_dto import PageResponseDTO
 from src.application.dtos.pokemon_dto import (
     PokemonCreateDTO,
     PokemonResponseDTO,
     PokemonUpdateDTO,
 )
 from src.application.services.pokemon_service import PokemonService
+from src.config import settings
+from src.domain.exceptions import ValidationException
+from src.domain.repositories.list_query import ListQuery
 from src.persistence.database import get_database
-from src.persistence.repositories import SqlModelPokemonRepository
+from src.persistence.repositories import SqlModelPokemonRepository, with_entity_cache
+from src.presentation.dependencies.conditional import ConditionalGet
+from src.presentation.dependencies.fields import SparseFields
+from src.presentation.dependencies.list_query import get_list_query
+from src.presentation.dependencies.pagination import PaginationParams
+from src.presentation.fragment_cache import FragmentCache
+from src.presentation.responses import bulk_json
 
 router = APIRouter(prefix="/pokemon", tags=["pokemon"])
 
+pokemon_fragments = FragmentCache(max_entries=settings.FRAGMENT_CACHE_MAX_ENTRIES)
+
+bulk_pokemon_adapter = TypeAdapter(BulkResponseDTO[PokemonResponseDTO])
+
+pokemon_fields = SparseFields(PokemonResponseDTO)
+
 
 def get_pokemon_service(db: Session = Depends(get_database)) -> PokemonService:
-    pokemon_repository = SqlModelPokemonRepository(db)
+    pokemon_repository = with_entity_cache(SqlModelPokemonRepository(db))
     return PokemonService(pokemon_repository)
 
 
@@ -27,10 +47,36 @@ def create_pokemon(
     return service.create_pokemon(pokemon)
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkResponseDTO[PokemonResponseDTO],
+    status_code=HTTPStatus.CREATED,
+    responses={HTTPStatus.MULTI_STATUS: {"description": "Some rows failed"}},
+)
+def create_pokemon_bulk(
+    pokemon: Annotated[
+        list[PokemonCreateDTO], Body(min_length=1, max_length=settings.BULK_MAX_ROWS)
+    ],
+    service: PokemonService = Depends(get_pokemon_service),
+) -> Response:
+    return bulk_json(bulk_pokemon_adapter, service.create_many(pokemon))
+
+
 @router.get("/{pokemon_id}", response_model=PokemonResponseDTO)
 def get_pokemon(
-    pokemon_id: int, service: PokemonService = Depends(get_pokemon_service)
-) -> PokemonResponseDTO:
+    pokemon_id: int,
+    fields: frozenset[str] | None = Depends(pokemon_fields),
+    service: PokemonService = Depends(get_pokemon_service),
+) -> PokemonResponseDTO | Response:
+    if fields:
+        row = service.get_pokemon_fields_by_id(pokemon_id, fields)
+        if row is None:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail=f"Pokemon with id {pokemon_id} not found",
+            )
+        return Response(content=orjson.dumps(row), media_type="application/json")
+
     pokemon = service.get_pokemon(pokemon_id)
     if not pokemon:
         raise HTTPException(
@@ -40,13 +86,33 @@ def get_pokemon(
     return pokemon
 
 
-@router.get("/", response_model=list[PokemonResponseDTO])
+@router.get(
+    "/",
+    response_model=list[PokemonResponseDTO] | PageResponseDTO[PokemonResponseDTO],
+    dependencies=[Depends(ConditionalGet("pokemon"))],
+)
 def get_pokemon_list(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    fields: frozenset[str] | None = Depends(pokemon_fields),
+    query: ListQuery | None = Depends(get_list_query),
     service: PokemonService = Depends(get_pokemon_service),
-) -> list[PokemonResponseDTO]:
-    return service.get_all_pokemon(skip, limit)
+) -> Response:
+    skip, limit = pagination.skip, pagination.limit
+    try:
+        total = service.count(exact=pagination.exact_count, query=query)
+        if fields:
+            # Projections are cheap to encode and not worth a fragment per fieldset.
+            rows = service.get_pokemon_fields(fields, skip, limit, query)
+            return pagination.respond_encoded(response, orjson.dumps(rows), total)
+        versions = service.get_pokemon_versions(skip, limit, query)
+    except ValidationException as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
+
+    page = pokemon_fragments.encode_page(
+        "pokemon", versions, service.get_pokemon_by_ids
+    )
+    return pagination.respond_encoded(response, page, total)
 
 
 @router.put("/{pokemon_id}", response_model=PokemonResponseDTO)
@@ -74,6 +140,7 @@ def delete_pokemon(
             status_code=HTTPStatus.NOT_FOUND,
             detail=f"Pokemon with id {pokemon_id} not found",
         )
+    pokemon_fragments.evict("pokemon", pokemon_id)
 
 
 @router.post("/{pokemon_id}/level-up", response_model=PokemonResponseDTO)
@@ -1,7 +1,7 @@
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlmodel import Session
 
 from src.application.dtos.team_dto import (
     TeamAddPokemonDTO,
@@ -15,15 +15,17 @@ from src.persistence.repositories import (
     SqlModelPokemonRepository,
     SqlModelTeamRepository,
     SqlModelTrainerRepository,
+    with_entity_cache,
 )
+from src.presentation.dependencies.conditional import ConditionalGet
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
 
 def get_team_service(db: Session = Depends(get_database)) -> TeamService:
     team_repository = SqlModelTeamRepository(db)
-    trainer_repository = SqlModelTrainerRepository(db)
-    pokemon_repository = SqlModelPokemonRepository(db)
+    trainer_repository = with_entity_cache(SqlModelTrainerRepository(db))
+    pokemon_repository = with_entity_cache(SqlModelPokemonRepository(db))
     return TeamService(team_repository, trainer_repository, pokemon_repository)
 
 
@@ -67,7 +69,11 @@ def update_pokemon_position(
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
 
-@router.get("/trainers/{trainer_id}", response_model=TeamResponseDTO)
+@router.get(
+    "/trainers/{trainer_id}",
+    response_model=TeamResponseDTO,
+    dependencies=[Depends(ConditionalGet("teams", "trainers", "pokemon"))],
+)
 def get_trainer_team(
     trainer_id: int, service: TeamService = Depends(get_team_service)
 ) -> TeamResponseDTO:
@@ -1,24 +1,37 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import TypeAdapter
+from sqlmodel import Session
 
+from src.application.dtos.page_dto import PageResponseDTO
 from src.application.dtos.trainer_dto import (
     TrainerCreateDTO,
     TrainerResponseDTO,
     TrainerUpdateDTO,
 )
 from src.application.services.trainer_service import TrainerService
+from src.domain.exceptions import ValidationException
+from src.domain.repositories.list_query import ListQuery
 from src.persistence.database import get_database
 from src.persistence.database.models import UserModel
-from src.persistence.repositories import SqlModelTrainerRepository
+from src.persistence.repositories import SqlModelTrainerRepository, with_entity_cache
 from src.presentation.dependencies.auth import (
     get_current_active_user,
+    get_current_privileged_user,
     get_current_user_optional,
 )
+from src.presentation.dependencies.fields import SparseFields
+from src.presentation.dependencies.list_query import get_list_query
+from src.presentation.dependencies.pagination import PaginationParams
 
 router = APIRouter(prefix="/trainers", tags=["trainers"])
 
+trainer_list_adapter = TypeAdapter(list[TrainerResponseDTO])
+
+trainer_fields = SparseFields(TrainerResponseDTO)
+
 
 def get_trainer_service(db: Session = Depends(get_database)) -> TrainerService:
     from src.persistence.repositories.sqlmodel_pokemon_repository import (
@@ -28,9 +41,9 @@ def get_trainer_service(db: Session = Depends(get_database)) -> TrainerService:
         SqlModelTeamRepository,
     )
 
-    trainer_repository = SqlModelTrainerRepository(db)
+    trainer_repository = with_entity_cache(SqlModelTrainerRepository(db))
     team_repository = SqlModelTeamRepository(db)
-    pokemon_repository = SqlModelPokemonRepository(db)
+    pokemon_repository = with_entity_cache(SqlModelPokemonRepository(db))
 
     return TrainerService(trainer_repository, team_repository, pokemon_repository)
 
@@ -47,9 +60,19 @@ def create_trainer(
 @router.get("/{trainer_id}", response_model=TrainerResponseDTO)
 def get_trainer(
     trainer_id: int,
+    fields: frozenset[str] | None = Depends(trainer_fields),
     service: TrainerService = Depends(get_trainer_service),
     current_user: UserModel | None = Depends(get_current_user_optional),
-) -> TrainerResponseDTO:
+) -> TrainerResponseDTO | Response:
+    if fields:
+        row = service.get_trainer_fields_by_id(trainer_id, fields)
+        if row is None:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail=f"Trainer with id {trainer_id} not found",
+            )
+        return Response(content=orjson.dumps(row), media_type="application/json")
+
     trainer = service.get_trainer(trainer_id)
     if not trainer:
         raise HTTPException(
@@ -59,20 +82,34 @@ def get_trainer(
     return trainer
 
 
-@router.get("/", response_model=list[TrainerResponseDTO])
+@router.get(
+    "/",
+    response_model=list[TrainerResponseDTO] | PageResponseDTO[TrainerResponseDTO],
+)
 def get_trainers(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    fields: frozenset[str] | None = Depends(trainer_fields),
+    query: ListQuery | None = Depends(get_list_query),
     service: TrainerService = Depends(get_trainer_service),
     current_user: UserModel | None = Depends(get_current_user_optional),
-) -> list[TrainerResponseDTO]:
-    return service.get_all_trainers(skip, limit)
+) -> Response:
+    skip, limit = pagination.skip, pagination.limit
+    try:
+        total = service.count(exact=pagination.exact_count, query=query)
+        if fields:
+            rows = service.get_trainers_fields(fields, skip, limit, query)
+            return pagination.respond_encoded(response, orjson.dumps(rows), total)
+        trainers = service.get_all_trainers(skip, limit, query)
+    except ValidationException as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
+    return pagination.respond_json(response, trainer_list_adapter, trainers, total)
 
 
 @router.get("/me/trainer", response_model=TrainerResponseDTO)
 def get_my_trainer(
     service: TrainerService = Depends(get_trainer_service),
-    current_user: UserModel = Depends(get_current_active_user),
+    current_user: UserModel = Depends(get_current_privileged_user),
 ) -> TrainerResponseDTO:
     if not current_user.trainer_id:
         raise HTTPException(
@@ -93,7 +130,7 @@ def update_trainer(
     trainer_id: int,
     trainer: TrainerUpdateDTO,
     service: TrainerService = Depends(get_trainer_service),
-    current_user: UserModel = Depends(get_current_active_user),
+    current_user: UserModel = Depends(get_current_privileged_user),
 ) -> TrainerResponseDTO:
     if current_user.trainer_id != trainer_id and not current_user.is_superuser:
         raise HTTPException(
@@ -114,7 +151,7 @@ def update_trainer(
 def delete_trainer(
     trainer_id: int,
     service: TrainerService = Depends(get_trainer_service),
-    current_user: UserModel = Depends(get_current_active_user),
+    current_user: UserModel = Depends(get_current_privileged_user),
 ) -> None:
     if not current_user.is_superuser:
         raise HTTPException(
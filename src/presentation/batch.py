@@ -0,0 +1,139 @@
+import asyncio
+from collections.abc import Sequence
+from http import HTTPStatus
+
+import orjson
+from fastapi import Request
+from starlette.types import Message
+
+from src.application.dtos.batch_dto import BatchSubRequestDTO
+
+# Sub-requests with these methods do not write, so consecutive ones run
+# concurrently; any other method waits for them and runs on its own.
+READ_METHODS = frozenset({"GET"})
+
+# Forwarded from the batch request unless the sub-request sets them itself.
+_INHERITED_HEADERS = (b"authorization", b"accept-language")
+
+_INTERNAL_ERROR = b'{"detail":"Internal Server Error"}'
+
+
+async def execute_batch(
+    request: Request, sub_requests: Sequence[BatchSubRequestDTO], max_concurrency: int
+) -> bytes:
+    """Run ``sub_requests`` against ``request.app``; returns a JSON array.
+
+    Consecutive reads run concurrently (at most ``max_concurrency`` at a
+    time), writes run in order, so a read listed after a write sees its
+    effect. Results are in request order.
+    """
+    limiter = asyncio.Semaphore(max_concurrency)
+    results: list[bytes] = [b""] * len(sub_requests)
+    pending_reads: list[int] = []
+
+    async def run(index: int) -> None:
+        async with limiter:
+            results[index] = await _dispatch(request, sub_requests[index])
+
+    async def flush_reads() -> None:
+        await asyncio.gather(*(run(index) for index in pending_reads))
+        pending_reads.clear()
+
+    for index, sub_request in enumerate(sub_requests):
+        if sub_request.method in READ_METHODS:
+            pending_reads.append(index)
+            continue
+        await flush_reads()
+        await run(index)
+    await flush_reads()
+
+    return b"[" + b",".join(results) + b"]"
+
+
+async def _dispatch(request: Request, sub_request: BatchSubRequestDTO) -> bytes:
+    """Call the app with ``sub_request`` and encode its response as JSON."""
+    path, _, query = sub_request.path.partition("?")
+    body = b"" if sub_request.body is None else orjson.dumps(sub_request.body)
+
+    headers = {
+        name.lower().encode("latin-1"): value.encode("latin-1")
+        for name, value in sub_request.headers.items()
+    }
+    for name in _INHERITED_HEADERS:
+        value = request.headers.get(name.decode())
+        if value is not None:
+            headers.setdefault(name, value.encode("latin-1"))
+    if body:
+        headers.setdefault(b"content-type", b"application/json")
+    headers[b"content-length"] = str(len(body)).encode()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": sub_request.method,
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": list(headers.items()),
+        "state": dict(request.scope.get("state", {})),
+    }
+
+    request_sent = False
+    response_done = asyncio.Event()
+    status: int = HTTPStatus.INTERNAL_SERVER_ERROR
+    response_headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Only report a disconnect once the response is complete, otherwise
+        # streaming responses would stop early.
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update(
+                (name.decode("latin-1"), value.decode("latin-1"))
+                for name, value in message.get("headers", [])
+            )
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # The app already logged it; report it as this sub-request's 500.
+        if not response_done.is_set():
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+            response_headers = {"content-type": "application/json"}
+            chunks = [_INTERNAL_ERROR]
+    finally:
+        response_done.set()
+
+    return b'{"status":%d,"headers":%b,"body":%b}' % (
+        status,
+        orjson.dumps(response_headers),
+        _encode_body(response_headers.get("content-type", ""), b"".join(chunks)),
+    )
+
+
+def _encode_body(content_type: str, content: bytes) -> bytes:
+    """Embed JSON bodies as-is; anything else as a string, empty as ``null``."""
+    if not content:
+        return b"null"
+    if content_type.startswith("application/json"):
+        return content
+    return orjson.dumps(content.decode("utf-8", errors="replace"))
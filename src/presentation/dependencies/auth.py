@@ -5,16 +5,46 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlmodel import Session
 
 from src.application.services.auth_service import AuthService
+from src.application.services.password_hasher import PasswordHasher
+from src.application.services.principal_cache import PrincipalCache
+from src.application.services.token_revocations import TokenRevocationList
+from src.config import settings
 from src.domain.entities.user import User
-from src.persistence.database import get_database
+from src.persistence.database import get_database, table_versions
+from src.persistence.database.models import UserModel
 from src.persistence.repositories import SqlModelUserRepository
 
 security = HTTPBearer()
 
+principal_cache = PrincipalCache(ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS)
+password_hasher = PasswordHasher(
+    rounds=settings.BCRYPT_ROUNDS,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+token_revocations = TokenRevocationList(
+    refresh_interval_seconds=settings.TOKEN_REVOCATION_REFRESH_SECONDS
+)
+
+
+def _clear_principals_on_user_writes(table_name: str) -> None:
+    # Another worker changed a user (password, deactivation, ...).
+    if table_name == UserModel.__tablename__:
+        principal_cache.clear()
+        token_revocations.mark_stale()
+
+
+table_versions.add_listener(_clear_principals_on_user_writes)
+
 
 def get_auth_service(db: Session = Depends(get_database)) -> AuthService:
     user_repository = SqlModelUserRepository(db)
-    return AuthService(user_repository)
+    return AuthService(
+        user_repository,
+        principal_cache,
+        password_hasher,
+        token_revocations if settings.JWT_STATELESS_PRINCIPAL else None,
+    )
 
 
 async def get_current_user(
@@ -44,7 +74,26 @@ async def get_current_active_user(
     return current_user
 
 
-async def get_current_superuser(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_privileged_user(
+    current_user: User = Depends(get_current_active_user),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> User:
+    # Superuser rights and the trainer link are never taken from token claims.
+    user = auth_service.get_privileged_user(current_user)
+    if user is None:
+        raise HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not user.is_active:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Inactive user")
+    return user
+
+
+async def get_current_superuser(
+    current_user: User = Depends(get_current_privileged_user),
+) -> User:
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=HTTPStatus.FORBIDDEN, detail="Not enough permissions"
@@ -0,0 +1,61 @@
+from hashlib import blake2b
+from http import HTTPStatus
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlmodel import Session
+
+from src.config import settings
+from src.persistence.database import get_database, table_versions
+
+
+class ConditionalGet:
+    """Route dependency answering ``If-None-Match`` from table version counters.
+
+    The ETag is derived from the request URL and the current versions of the
+    tables the response is built from, so it changes whenever any of them is
+    written by any worker. A matching ``If-None-Match`` short-circuits with
+    ``304 Not Modified`` before the route's service dependencies are resolved.
+
+    Routes whose response requires or depends on the caller's credentials set
+    ``per_principal``, so that cached responses are kept per caller.
+    """
+
+    def __init__(self, *table_names: str, per_principal: bool = False):
+        self.table_names = table_names
+        self.per_principal = per_principal
+
+    def __call__(
+        self,
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_database),
+    ) -> None:
+        etag = self._etag(request)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": (
+                f"private, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}, "
+                "must-revalidate"
+            ),
+        }
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    def _etag(self, request: Request) -> str:
+        versions = table_versions.versions(self.table_names)
+        key = f"{request.url.path}?{request.url.query}|{versions}"
+        return f'W/"{blake2b(key.encode(), digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
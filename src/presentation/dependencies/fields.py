@@ -0,0 +1,37 @@
+from http import HTTPStatus
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+
+
+class SparseFields:
+    """Route dependency parsing ``?fields=id,name`` against a response DTO.
+
+    Resolves to the requested field names, or ``None`` when the parameter is
+    absent or empty so the route serves full DTOs. Unknown names are a
+    ``400``.
+    """
+
+    def __init__(self, dto_class: type[BaseModel]):
+        self.dto_class = dto_class
+
+    def __call__(
+        self,
+        fields: str | None = Query(
+            default=None,
+            description="Comma-separated response fields to return",
+            examples=["id,name"],
+        ),
+    ) -> frozenset[str] | None:
+        names = frozenset(
+            name.strip() for name in (fields or "").split(",") if name.strip()
+        )
+        if not names:
+            return None
+        unknown = names - self.dto_class.model_fields.keys()
+        if unknown:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        return names
@@ -0,0 +1,28 @@
+from fastapi import Header
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+class IdempotentWrite:
+    """Route dependency marking a mutation as safe to retry.
+
+    A client that sends the same ``Idempotency-Key`` again gets the stored
+    response of the first request instead of a second write. The key is
+    handled by ``IdempotencyMiddleware`` before the route runs; this only
+    opts the route in and documents the header.
+    """
+
+    def __call__(
+        self,
+        idempotency_key: str | None = Header(
+            default=None,
+            alias=IDEMPOTENCY_KEY_HEADER,
+            max_length=IDEMPOTENCY_KEY_MAX_LENGTH,
+            description=(
+                "Unique value per logical operation; retries with the same key "
+                "replay the first response"
+            ),
+        ),
+    ) -> None:
+        return None
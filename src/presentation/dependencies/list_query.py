@@ -0,0 +1,84 @@
+from http import HTTPStatus
+from typing import Any
+
+from fastapi import HTTPException, Query
+
+from src.domain.repositories.list_query import (
+    FieldFilter,
+    FilterOperator,
+    ListQuery,
+    SortKey,
+)
+
+RANGE_SEPARATOR = ".."
+
+
+def get_list_query(
+    filters: list[str] = Query(
+        default=[],
+        alias="filter",
+        description=(
+            "Repeatable `field:operator:value`. Operators: `eq`, `in` "
+            "(comma-separated values), `range` (`low..high`, either end may be "
+            "omitted) and `prefix`."
+        ),
+        examples=[["region:eq:kanto", "name:prefix:As"]],
+    ),
+    order_by: str | None = Query(
+        default=None,
+        description="Comma-separated fields; prefix one with `-` to sort descending",
+        examples=["-battle_date,id"],
+    ),
+) -> ListQuery | None:
+    """Parse the filter/sort grammar of list endpoints.
+
+    Only the syntax is checked here; which fields may be filtered or sorted on
+    is up to the repository. Resolves to ``None`` when neither is given.
+    """
+    if not filters and not order_by:
+        return None
+    return ListQuery(
+        filters=tuple(_parse_filter(raw) for raw in filters),
+        order_by=tuple(
+            _parse_sort_key(raw) for raw in (order_by.split(",") if order_by else ())
+        ),
+    )
+
+
+def _parse_filter(raw: str) -> FieldFilter:
+    field, _, rest = raw.partition(":")
+    operator_name, _, value = rest.partition(":")
+    try:
+        operator = FilterOperator(operator_name)
+    except ValueError:
+        raise _bad_request(
+            f"Invalid filter {raw!r}: expected field:operator:value"
+        ) from None
+
+    values: tuple[Any, ...]
+    match operator:
+        case FilterOperator.IN:
+            values = tuple(item for item in value.split(",") if item)
+        case FilterOperator.RANGE:
+            low, separator, high = value.partition(RANGE_SEPARATOR)
+            if not separator:
+                raise _bad_request(f"Invalid range {raw!r}: expected low..high")
+            values = (low or None, high or None)
+        case _:
+            values = (value,)
+    if not field or not values:
+        raise _bad_request(f"Invalid filter {raw!r}: expected field:operator:value")
+    return FieldFilter(field=field, operator=operator, values=values)
+
+
+def _parse_sort_key(raw: str) -> SortKey:
+    field = raw.strip()
+    descending = field.startswith("-")
+    field = field.removeprefix("-")
+    if not field:
+        raise _bad_request("Invalid order_by: empty field name")
+    return SortKey(field=field, descending=descending)
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=detail)
@@ -0,0 +1,59 @@
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from src.application.dtos.page_dto import PageResponseDTO
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+class PaginationParams:
+    """Common query parameters for paginated list endpoints."""
+
+    def __init__(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        exact_count: bool = False,
+        envelope: bool = False,
+    ):
+        self.skip = skip
+        self.limit = limit
+        self.exact_count = exact_count
+        self.envelope = envelope
+
+    def respond[ItemT](
+        self, response: Response, items: list[ItemT], total: int
+    ) -> list[ItemT] | PageResponseDTO[ItemT]:
+        """Attach the total count header and wrap the page if requested."""
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+        if self.envelope:
+            return PageResponseDTO(
+                items=items, total=total, skip=self.skip, limit=self.limit
+            )
+        return items
+
+    def respond_json[ItemT](
+        self,
+        response: Response,
+        adapter: TypeAdapter[list[ItemT]],
+        items: list[ItemT],
+        total: int,
+    ) -> Response:
+        """Like :meth:`respond`, encoding the page with a prebuilt adapter."""
+        return self.respond_encoded(response, adapter.dump_json(items), total)
+
+    def respond_encoded(self, response: Response, items: bytes, total: int) -> Response:
+        """Like :meth:`respond` for a page already encoded as a JSON array."""
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+        content = items
+        if self.envelope:
+            content = b'{"items":%b,"total":%d,"skip":%d,"limit":%d}' % (
+                items,
+                total,
+                self.skip,
+                self.limit,
+            )
+        encoded = Response(content=content, media_type="application/json")
+        # A returned Response bypasses the injected one, so carry its headers.
+        encoded.headers.raw.extend(response.headers.raw)
+        return encoded
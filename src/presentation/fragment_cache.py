@@ -0,0 +1,91 @@
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from threading import Lock
+from typing import Protocol
+
+
+class EncodableDTO(Protocol):
+    id: int | None
+
+    def model_dump_json(self) -> str: ...
+
+
+class FragmentCache:
+    """LRU of encoded JSON objects keyed by (entity type, id, row version).
+
+    A row's version changes on every update and ids are never reused, so an
+    entry never has to be invalidated: the next page simply asks for the new
+    version and the old fragment ages out. Deletes still :meth:`evict` the
+    row's entries to free them early. List responses are assembled from these fragments and
+    only rows that changed since they were last served are re-encoded.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+        self._lock = Lock()
+
+    def encode_page(
+        self,
+        entity_type: str,
+        rows: list[tuple[int, int]],
+        load: Callable[[list[int]], Sequence[EncodableDTO]],
+    ) -> bytes:
+        """Encode ``rows`` as a JSON array, loading only uncached rows.
+
+        ``rows`` are (id, version) pairs in response order and ``load`` returns
+        the response DTOs for the given ids. Rows deleted between the two
+        queries are left out.
+        """
+        fragments: dict[int, bytes] = {}
+        with self._lock:
+            for entity_id, version in rows:
+                fragment = self._entries.get((entity_type, entity_id, version))
+                if fragment is not None:
+                    self._entries.move_to_end((entity_type, entity_id, version))
+                    fragments[entity_id] = fragment
+            self.hits += len(fragments)
+            self.misses += len(rows) - len(fragments)
+
+        missing = [entity_id for entity_id, _ in rows if entity_id not in fragments]
+        if missing:
+            versions = dict(rows)
+            encoded = {
+                dto.id: dto.model_dump_json().encode()
+                for dto in load(missing)
+                if dto.id is not None
+            }
+            fragments.update(encoded)
+            with self._lock:
+                for entity_id, fragment in encoded.items():
+                    key = (entity_type, entity_id, versions[entity_id])
+                    self._entries[key] = fragment
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        ordered = (
+            fragments[entity_id] for entity_id, _ in rows if entity_id in fragments
+        )
+        return b"[" + b",".join(ordered) + b"]"
+
+    def evict(self, entity_type: str, entity_id: int) -> None:
+        """Drop every cached version of one row."""
+        with self._lock:
+            for key in [
+                key for key in self._entries if key[:2] == (entity_type, entity_id)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,20 @@
+from .idempotency import IdempotencyMiddleware, idempotency_store
+from .load_shedding import (
+    LoadShedder,
+    LoadSheddingMiddleware,
+    RouteClass,
+    load_shedder,
+)
+from .response_cache import ResponseCache, ResponseCacheMiddleware, response_cache
+
+__all__ = [
+    "IdempotencyMiddleware",
+    "idempotency_store",
+    "LoadShedder",
+    "LoadSheddingMiddleware",
+    "RouteClass",
+    "load_shedder",
+    "ResponseCache",
+    "ResponseCacheMiddleware",
+    "response_cache",
+]
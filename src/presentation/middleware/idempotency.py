@@ -0,0 +1,227 @@
+from collections.abc import Callable
+from hashlib import blake2b
+from http import HTTPStatus
+
+import orjson
+from jose import JWTError, jwt
+from sqlalchemy import Engine
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+from src.persistence.database.idempotency import IdempotencyStore, StoredResponse
+from src.presentation.dependencies.idempotency import (
+    IDEMPOTENCY_KEY_MAX_LENGTH,
+    IdempotentWrite,
+)
+from src.presentation.middleware.routing import route_dependency
+
+_WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+_REPLAYED_HEADER = (b"idempotent-replayed", b"true")
+# Recomputed for the replayed body instead of stored.
+_UNSTORED_HEADERS = {b"content-length"}
+
+
+class IdempotencyMiddleware:
+    """Answer retried mutations from :class:`IdempotencyStore`.
+
+    A route opts in by declaring an :class:`IdempotentWrite` dependency. The
+    first request with a given ``Idempotency-Key`` claims it and runs; its
+    ``2xx`` status, headers and body are stored and replayed to every retry
+    until the key expires. Any other outcome made no change, so the claim is
+    released and a retry runs again. Keys are scoped to method, path and the
+    verified ``sub`` claim of the bearer token, so a retry with a refreshed
+    token still matches, and a retry must carry the same query string and
+    body: reusing a key for a different request is a ``422``, retrying while
+    the first request is still running a ``409``.
+    """
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore, engine: Engine):
+        self.app = app
+        self.store = store
+        self.engine = engine
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in _WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        key = request_headers.get("idempotency-key")
+        # Over-long keys are left to the route's header validation.
+        if (
+            not key
+            or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH
+            or route_dependency(scope, IdempotentWrite) is None
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        key_scope = _digest(
+            scope["method"].encode(),
+            scope["path"].encode(),
+            _principal(request_headers),
+        )
+        fingerprint = _digest(scope["query_string"], body)
+
+        existing = await run_in_threadpool(
+            self._run, self.store.claim, key_scope, key, fingerprint
+        )
+        if existing is not None:
+            await self._answer_existing(existing, fingerprint, send)
+            return
+
+        start: Message | None = None
+        chunks: list[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, _replay_body(body, receive), capture)
+        except BaseException:
+            await run_in_threadpool(self._run, self.store.release, key_scope, key)
+            raise
+
+        if start is None or not 200 <= start["status"] < 300:
+            await run_in_threadpool(self._run, self.store.release, key_scope, key)
+            return
+        headers = [
+            (bytes(name), bytes(value))
+            for name, value in start["headers"]
+            if bytes(name).lower() not in _UNSTORED_HEADERS
+        ]
+        await run_in_threadpool(
+            self._run,
+            self.store.complete,
+            key_scope,
+            key,
+            start["status"],
+            headers,
+            b"".join(chunks),
+        )
+
+    def _run[T](self, operation: Callable[..., T], *args: object) -> T:
+        with Session(self.engine) as db:
+            return operation(db, *args)
+
+    @staticmethod
+    async def _answer_existing(
+        existing: StoredResponse, fingerprint: str, send: Send
+    ) -> None:
+        if existing.fingerprint != fingerprint:
+            await _send_error(
+                send,
+                HTTPStatus.UNPROCESSABLE_ENTITY,
+                "Idempotency-Key was already used for a different request",
+            )
+            return
+        if existing.in_progress:
+            await _send_error(
+                send,
+                HTTPStatus.CONFLICT,
+                "A request with this Idempotency-Key is still in progress",
+                [(b"retry-after", b"1")],
+            )
+            return
+
+        body = existing.body or b""
+        headers = [
+            *existing.headers,
+            (b"content-length", str(len(body)).encode()),
+            _REPLAYED_HEADER,
+        ]
+        await send(
+            {
+                "type": "http.response.start",
+                "status": existing.status_code,
+                "headers": headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """``receive`` that yields the already read body, then defers to the client."""
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+
+def _principal(headers: Headers) -> bytes:
+    """The ``sub`` claim of a valid bearer token; empty for anyone else."""
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return b""
+    try:
+        payload = jwt.decode(
+            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+        )
+    except JWTError:
+        # Anonymous scope: routes that need a principal reject the request,
+        # and a rejected request releases its claim.
+        return b""
+    return str(payload.get("sub", "")).encode()
+
+
+def _digest(*parts: bytes) -> str:
+    digest = blake2b(digest_size=16)
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+async def _send_error(
+    send: Send,
+    status: HTTPStatus,
+    detail: str,
+    extra_headers: list[tuple[bytes, bytes]] | None = None,
+) -> None:
+    body = orjson.dumps({"detail": detail})
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *(extra_headers or []),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+idempotency_store = IdempotencyStore(
+    ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+    lease_seconds=settings.IDEMPOTENCY_LEASE_SECONDS,
+    purge_batch_size=settings.IDEMPOTENCY_PURGE_BATCH_SIZE,
+)
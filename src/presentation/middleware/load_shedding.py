@@ -0,0 +1,228 @@
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+from http import HTTPStatus
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config import settings
+
+_WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+_AGGREGATE_PREFIXES = ("/api/v1/dashboard", "/api/v1/export/")
+_AGGREGATE_SUFFIXES = ("/battles/leaderboard", "/stats")
+_AUTH_PREFIX = "/api/v1/auth/"
+# Never limited: health checks and metrics must answer under overload, and a
+# batch holds no slot itself since every sub-request takes its own.
+_EXEMPT_PATHS = {"/health", "/metrics", "/api/v1/batch"}
+
+
+class RouteClass(str, Enum):
+    READ = "read"
+    AGGREGATE = "aggregate"
+    WRITE = "write"
+    AUTH = "auth"
+
+
+class ConcurrencyLimit:
+    """At most ``limit`` requests in flight, ``max_queue`` more waiting.
+
+    Waiters are admitted in arrival order and give up after
+    ``queue_timeout_seconds``. A request that finds the queue full is
+    rejected at once. Only used from the event loop, so it needs no lock.
+    """
+
+    def __init__(self, limit: int, max_queue: int, queue_timeout_seconds: float):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.active = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting for one if needed; ``False`` if shed."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout_seconds)
+        except TimeoutError:
+            pass
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+        # A slot handed over just as the deadline passed is still taken.
+        if waiter.done() and not waiter.cancelled():
+            self.admitted += 1
+            return True
+        self._abandon(waiter)
+        self.timed_out += 1
+        return False
+
+    def release(self) -> None:
+        """Hand the slot to the oldest live waiter, or free it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+    def _abandon(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.done() and not waiter.cancelled():
+            # Given a slot while going away: pass it on.
+            self.release()
+            return
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+
+class LoadShedder:
+    """One :class:`ConcurrencyLimit` per :class:`RouteClass`.
+
+    Separate limits keep a flood of one kind of request (e.g. bcrypt-bound
+    logins or dashboard aggregates) from queueing every other endpoint
+    behind it in the shared threadpool.
+    """
+
+    def __init__(
+        self,
+        limits: dict[RouteClass, int],
+        max_queues: dict[RouteClass, int],
+        queue_timeout_seconds: float,
+        retry_after_seconds: int,
+    ):
+        self.retry_after_seconds = retry_after_seconds
+        self.limits = {
+            route_class: ConcurrencyLimit(
+                limit, max_queues[route_class], queue_timeout_seconds
+            )
+            for route_class, limit in limits.items()
+        }
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            route_class.value: limit.stats()
+            for route_class, limit in self.limits.items()
+        }
+
+
+def classify_request(scope: Scope) -> RouteClass | None:
+    """Route class of an HTTP request, ``None`` for exempt paths."""
+    path = scope["path"].rstrip("/") or "/"
+    if path in _EXEMPT_PATHS:
+        return None
+    is_write = scope["method"] in _WRITE_METHODS
+    if path.startswith(_AUTH_PREFIX) and is_write:
+        return RouteClass.AUTH
+    if is_write:
+        return RouteClass.WRITE
+    if path.startswith(_AGGREGATE_PREFIXES) or path.endswith(_AGGREGATE_SUFFIXES):
+        return RouteClass.AGGREGATE
+    return RouteClass.READ
+
+
+class LoadSheddingMiddleware:
+    """Admit requests through the :class:`LoadShedder` of their route class.
+
+    A request that cannot get a slot within the queue deadline, or finds the
+    queue full, gets ``503`` with ``Retry-After`` instead of waiting for the
+    client to time out. The slot is held until the response (including a
+    streamed body) has been sent.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        shedder: LoadShedder,
+        classify: Callable[[Scope], RouteClass | None] = classify_request,
+    ):
+        self.app = app
+        self.shedder = shedder
+        self.classify = classify
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self.classify(scope)
+        if (
+            route_class is None
+            or (limit := self.shedder.limits.get(route_class)) is None
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not await limit.acquire():
+            await self._reject(route_class, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limit.release()
+
+    async def _reject(self, route_class: RouteClass, send: Send) -> None:
+        body = orjson.dumps(
+            {"detail": f"Server is overloaded ({route_class.value}), retry later"}
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": HTTPStatus.SERVICE_UNAVAILABLE,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(self.shedder.retry_after_seconds).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+load_shedder = LoadShedder(
+    limits={
+        RouteClass.READ: settings.LOAD_SHEDDING_READ_LIMIT,
+        RouteClass.AGGREGATE: settings.LOAD_SHEDDING_AGGREGATE_LIMIT,
+        RouteClass.WRITE: settings.LOAD_SHEDDING_WRITE_LIMIT,
+        RouteClass.AUTH: settings.LOAD_SHEDDING_AUTH_LIMIT,
+    },
+    max_queues={
+        RouteClass.READ: settings.LOAD_SHEDDING_READ_QUEUE,
+        RouteClass.AGGREGATE: settings.LOAD_SHEDDING_AGGREGATE_QUEUE,
+        RouteClass.WRITE: settings.LOAD_SHEDDING_WRITE_QUEUE,
+        RouteClass.AUTH: settings.LOAD_SHEDDING_AUTH_QUEUE,
+    },
+    queue_timeout_seconds=settings.LOAD_SHEDDING_QUEUE_TIMEOUT_SECONDS,
+    retry_after_seconds=settings.LOAD_SHEDDING_RETRY_AFTER_SECONDS,
+)
@@ -0,0 +1,235 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from hashlib import blake2b
+from threading import Lock
+from time import monotonic
+
+from sqlalchemy import Engine
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+from src.persistence.database import TABLE_VERSIONS_SYNCED, table_versions
+from src.persistence.database.models import UserModel
+from src.presentation.dependencies.conditional import ConditionalGet, etag_matches
+from src.presentation.middleware.routing import route_dependency
+
+_CACHE_HEADER = (b"x-cache", b"HIT")
+_REPLAYED_ON_304 = {b"etag", b"cache-control"}
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    versions: tuple[int, ...]
+    expires_at: float
+    status: int
+    headers: tuple[tuple[bytes, bytes], ...]
+    body: bytes
+
+    @property
+    def etag(self) -> str | None:
+        for name, value in self.headers:
+            if name == b"etag":
+                return value.decode("latin-1")
+        return None
+
+
+class ResponseCache:
+    """Byte-bounded LRU of fully encoded responses.
+
+    An entry is only served while the table versions it was stored under are
+    still current, so any write to those tables (by any worker) turns it into
+    a miss. ``ttl_seconds`` bounds how long a response outlives nothing but
+    the clock, e.g. the bearer token it was authorized with.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, versions: tuple[int, ...]) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.versions != versions or entry.expires_at <= monotonic()
+            ):
+                self._discard(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        key: Hashable,
+        versions: tuple[int, ...],
+        status: int,
+        headers: tuple[tuple[bytes, bytes], ...],
+        body: bytes,
+    ) -> bool:
+        if len(body) > self.max_entry_bytes:
+            return False
+        entry = CachedResponse(
+            versions=versions,
+            expires_at=monotonic() + self.ttl_seconds,
+            status=status,
+            headers=headers,
+            body=body,
+        )
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
+
+
+class ResponseCacheMiddleware:
+    """Serve repeated GETs of version-tagged routes from :class:`ResponseCache`.
+
+    A route opts in by declaring a :class:`ConditionalGet` dependency; its
+    table names are the cache tags. Entries are keyed by path and raw query
+    string. For ``per_principal`` routes the key also holds a digest of the
+    ``Authorization`` header and the entry is tagged with the users table, so
+    deactivating an account stops its cached responses. Only complete ``200``
+    responses without cookies are stored.
+    """
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache, engine: Engine):
+        self.app = app
+        self.cache = cache
+        self.engine = engine
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        conditional = route_dependency(scope, ConditionalGet)
+        table_names = conditional.table_names if conditional is not None else ()
+        if not table_names:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        authorization = None
+        if conditional is not None and conditional.per_principal:
+            authorization = request_headers.get("authorization")
+            table_names += (UserModel.__tablename__,)
+
+        await run_in_threadpool(self._sync_versions)
+        # The request's database dependency need not sync a second time.
+        scope.setdefault("state", {})[TABLE_VERSIONS_SYNCED] = True
+        versions = table_versions.versions(table_names)
+        key = (scope["path"], scope["query_string"], _auth_scope(authorization))
+
+        cached = self.cache.get(key, versions)
+        if cached is not None:
+            await self._replay(cached, request_headers.get("if-none-match"), send)
+            return
+
+        start: Message | None = None
+        chunks: list[bytes] = []
+        size = 0
+
+        async def capture(message: Message) -> None:
+            nonlocal start, size
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body" and size >= 0:
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                # Past the entry limit there is no point buffering the rest.
+                if size > self.cache.max_entry_bytes:
+                    chunks.clear()
+                    size = -1
+                else:
+                    chunks.append(chunk)
+            await send(message)
+
+        await self.app(scope, receive, capture)
+
+        if start is None or start["status"] != 200 or size < 0:
+            return
+        headers = tuple((bytes(name), bytes(value)) for name, value in start["headers"])
+        if any(name.lower() == b"set-cookie" for name, _ in headers):
+            return
+        self.cache.put(key, versions, start["status"], headers, b"".join(chunks))
+
+    def _sync_versions(self) -> None:
+        with Session(self.engine) as db:
+            table_versions.sync(db)
+
+    @staticmethod
+    async def _replay(
+        cached: CachedResponse, if_none_match: str | None, send: Send
+    ) -> None:
+        etag = cached.etag
+        if etag is not None and etag_matches(if_none_match, etag):
+            headers = [
+                (name, value)
+                for name, value in cached.headers
+                if name in _REPLAYED_ON_304
+            ]
+            await send(
+                {"type": "http.response.start", "status": 304, "headers": headers}
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": cached.status,
+                "headers": [*cached.headers, _CACHE_HEADER],
+            }
+        )
+        await send({"type": "http.response.body", "body": cached.body})
+
+
+def _auth_scope(authorization: str | None) -> str:
+    if not authorization:
+        return ""
+    return blake2b(authorization.encode(), digest_size=16).hexdigest()
+
+
+response_cache = ResponseCache(
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    max_entry_bytes=settings.RESPONSE_CACHE_MAX_ENTRY_BYTES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,21 @@
+from fastapi.routing import APIRoute
+from starlette.routing import Match
+from starlette.types import Scope
+
+
+def route_dependency[T](scope: Scope, dependency_type: type[T]) -> T | None:
+    """The ``dependency_type`` instance the route matching ``scope`` declares.
+
+    Lets middleware find out what a route opted into before it runs.
+    """
+    for route in scope["app"].router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        match, _ = route.matches(scope)
+        if match != Match.FULL:
+            continue
+        for dependency in route.dependencies:
+            if isinstance(dependency.dependency, dependency_type):
+                return dependency.dependency
+        return None
+    return None
@@ -1,6 +1,13 @@
+from collections.abc import Generator
 from unittest.mock import Mock
 
 import pytest
+from sqlalchemy import Engine
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+# Registers every table on SQLModel.metadata.
+import src.persistence.database.models  # noqa: F401
 
 
 @pytest.fixture
@@ -32,6 +39,26 @@ def mock_battle_repository() -> Mock:
 def mock_user_repository() -> Mock:
     return Mock()
 
+
 @pytest.fixture
 def mock_backpack_repository() -> Mock:
     return Mock()
+
+
+@pytest.fixture
+def engine() -> Generator[Engine]:
+    """In-memory SQLite database with every table created."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine: Engine) -> Generator[Session]:
+    with Session(engine) as session:
+        yield session
@@ -17,6 +17,8 @@ from src.domain.entities.user import User
 class UserFactory(DataclassFactory[User]):
     __model__ = User
 
+    token_version = 0
+
     @classmethod
     def ash_user(cls) -> User:
         return cls.build(
@@ -0,0 +1,56 @@
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from src.application.dtos.batch_dto import BatchSubRequestDTO
+from src.presentation.batch import execute_batch
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    notes: list[str] = []
+
+    @app.get("/notes")
+    def list_notes(request: Request) -> dict:
+        return {"notes": list(notes), "auth": request.headers.get("authorization")}
+
+    @app.post("/notes", status_code=201)
+    def add_note(note: dict) -> dict:
+        notes.append(note["text"])
+        return {"count": len(notes)}
+
+    @app.get("/plain")
+    def plain() -> PlainTextResponse:
+        return PlainTextResponse("a\nb")
+
+    @app.post("/batch")
+    async def batch(
+        request: Request, sub_requests: list[BatchSubRequestDTO]
+    ) -> Response:
+        content = await execute_batch(request, sub_requests, max_concurrency=2)
+        return Response(content=content, media_type="application/json")
+
+    return TestClient(app)
+
+
+class TestExecuteBatch:
+    def test_sub_responses_come_back_in_request_order(self) -> None:
+        response = _client().post(
+            "/batch",
+            json=[
+                {"path": "/notes"},
+                {"method": "POST", "path": "/notes", "body": {"text": "hi"}},
+                {"path": "/notes"},
+                {"path": "/plain"},
+                {"path": "/missing"},
+            ],
+            headers={"Authorization": "Bearer token"},
+        )
+
+        results = response.json()
+        assert [result["status"] for result in results] == [200, 201, 200, 200, 404]
+        # The read listed after the write sees it; credentials are forwarded.
+        assert results[0]["body"] == {"notes": [], "auth": "Bearer token"}
+        assert results[2]["body"]["notes"] == ["hi"]
+        assert results[3]["body"] == "a\nb"
+        assert results[4]["body"] == {"detail": "Not Found"}
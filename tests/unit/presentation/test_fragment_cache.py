@@ -0,0 +1,61 @@
+import json
+from unittest.mock import Mock
+
+from src.application.dtos.pokemon_dto import PokemonResponseDTO
+from src.presentation.fragment_cache import FragmentCache
+
+
+def _dto(pokemon_id: int, level: int = 5) -> PokemonResponseDTO:
+    return PokemonResponseDTO(
+        id=pokemon_id,
+        name=f"Pokemon {pokemon_id}",
+        type_primary="fire",
+        attacks=["Ember"],
+        nature="bold",
+        level=level,
+    )
+
+
+class TestFragmentCache:
+    def test_page_is_encoded_in_row_order(self) -> None:
+        cache = FragmentCache(max_entries=10)
+        load = Mock(return_value=[_dto(2), _dto(1)])
+
+        page = cache.encode_page("pokemon", [(1, 1), (2, 1)], load)
+
+        assert [row["id"] for row in json.loads(page)] == [1, 2]
+        load.assert_called_once_with([1, 2])
+
+    def test_only_changed_rows_are_reloaded(self) -> None:
+        cache = FragmentCache(max_entries=10)
+        cache.encode_page("pokemon", [(1, 1), (2, 1)], lambda ids: [_dto(1), _dto(2)])
+        load = Mock(return_value=[_dto(2, level=6)])
+
+        page = cache.encode_page("pokemon", [(1, 1), (2, 2)], load)
+
+        assert [row["level"] for row in json.loads(page)] == [5, 6]
+        load.assert_called_once_with([2])
+        assert cache.stats()["hits"] == 1
+
+    def test_rows_deleted_between_queries_are_skipped(self) -> None:
+        cache = FragmentCache(max_entries=10)
+
+        page = cache.encode_page("pokemon", [(1, 1), (2, 1)], lambda ids: [_dto(1)])
+
+        assert json.loads(page) == [json.loads(_dto(1).model_dump_json())]
+
+    def test_entries_are_bounded(self) -> None:
+        cache = FragmentCache(max_entries=1)
+
+        cache.encode_page("pokemon", [(1, 1), (2, 1)], lambda ids: [_dto(1), _dto(2)])
+
+        assert cache.stats()["size"] == 1
+
+    def test_evict_drops_every_version_of_a_row(self) -> None:
+        cache = FragmentCache(max_entries=10)
+        cache.encode_page("pokemon", [(1, 1), (2, 1)], lambda ids: [_dto(1), _dto(2)])
+        cache.encode_page("pokemon", [(1, 2)], lambda ids: [_dto(1, level=6)])
+
+        cache.evict("pokemon", 1)
+
+        assert cache.stats()["size"] == 1
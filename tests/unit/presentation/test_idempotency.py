@@ -0,0 +1,119 @@
+from collections.abc import Generator
+
+import pytest
+from fastapi import Body, Depends, FastAPI, HTTPException, Response
+from fastapi.testclient import TestClient
+from jose import jwt
+from sqlalchemy import Engine
+
+from src.config import settings
+from src.persistence.database.idempotency import IdempotencyStore
+from src.presentation.dependencies.idempotency import IdempotentWrite
+from src.presentation.middleware.idempotency import IdempotencyMiddleware
+
+
+class TestIdempotencyMiddleware:
+    @pytest.fixture
+    def client(self, engine: Engine) -> Generator[TestClient]:
+        app = FastAPI()
+        app.state.writes = 0
+
+        @app.post(
+            "/battles", status_code=201, dependencies=[Depends(IdempotentWrite())]
+        )
+        def create(response: Response, payload: dict = Body()) -> dict:
+            if payload.get("fail"):
+                raise HTTPException(status_code=400, detail="rejected")
+            app.state.writes += 1
+            response.headers["Location"] = f"/battles/{app.state.writes}"
+            response.headers["ETag"] = f'"{app.state.writes}"'
+            return {"id": app.state.writes}
+
+        @app.post("/unmarked")
+        def unmarked() -> dict:
+            app.state.writes += 1
+            return {"id": app.state.writes}
+
+        app.add_middleware(
+            IdempotencyMiddleware, store=IdempotencyStore(ttl_seconds=60), engine=engine
+        )
+        with TestClient(app) as client:
+            yield client
+
+    def test_retry_replays_the_first_response(self, client: TestClient) -> None:
+        headers = {"Idempotency-Key": "abc"}
+        first = client.post("/battles", json={"a": 1}, headers=headers)
+        retry = client.post("/battles", json={"a": 1}, headers=headers)
+
+        assert first.status_code == retry.status_code == 201
+        assert first.json() == retry.json() == {"id": 1}
+        assert retry.headers["idempotent-replayed"] == "true"
+        assert client.app.state.writes == 1
+
+    def test_retry_replays_the_stored_headers(self, client: TestClient) -> None:
+        headers = {"Idempotency-Key": "abc"}
+        first = client.post("/battles", json={"a": 1}, headers=headers)
+        retry = client.post("/battles", json={"a": 1}, headers=headers)
+
+        for name in ("location", "etag", "content-type", "content-length"):
+            assert retry.headers[name] == first.headers[name]
+
+    def test_key_reused_for_another_body_is_rejected(self, client: TestClient) -> None:
+        client.post("/battles", json={"a": 1}, headers={"Idempotency-Key": "abc"})
+
+        response = client.post(
+            "/battles", json={"a": 2}, headers={"Idempotency-Key": "abc"}
+        )
+
+        assert response.status_code == 422
+        assert client.app.state.writes == 1
+
+    @staticmethod
+    def _bearer(sub: str, issued_at: int = 0) -> str:
+        claims = {"sub": sub, "iat": issued_at}
+        token = jwt.encode(claims, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+        return f"Bearer {token}"
+
+    def test_keys_are_scoped_to_the_caller(self, client: TestClient) -> None:
+        for sub in ("1", "2"):
+            client.post(
+                "/battles",
+                json={"a": 1},
+                headers={"Idempotency-Key": "abc", "Authorization": self._bearer(sub)},
+            )
+
+        assert client.app.state.writes == 2
+
+    def test_retry_with_a_refreshed_token_is_replayed(self, client: TestClient) -> None:
+        for issued_at in (0, 60):
+            response = client.post(
+                "/battles",
+                json={"a": 1},
+                headers={
+                    "Idempotency-Key": "abc",
+                    "Authorization": self._bearer("1", issued_at),
+                },
+            )
+
+        assert response.headers["idempotent-replayed"] == "true"
+        assert client.app.state.writes == 1
+
+    def test_failed_request_releases_the_key(self, client: TestClient) -> None:
+        headers = {"Idempotency-Key": "abc"}
+        failed = client.post("/battles", json={"fail": True}, headers=headers)
+        assert failed.status_code == 400
+
+        retried = client.post("/battles", json={"fail": True}, headers=headers)
+
+        assert retried.status_code == 400
+        assert "idempotent-replayed" not in retried.headers
+
+    def test_routes_without_the_dependency_are_not_deduplicated(
+        self, client: TestClient
+    ) -> None:
+        for _ in range(2):
+            client.post("/unmarked", headers={"Idempotency-Key": "abc"})
+        client.post("/battles", json={"a": 1})
+        client.post("/battles", json={"a": 1})
+
+        assert client.app.state.writes == 4
@@ -0,0 +1,59 @@
+import pytest
+from fastapi import HTTPException
+
+from src.domain.repositories.list_query import (
+    FieldFilter,
+    FilterOperator,
+    ListQuery,
+    SortKey,
+)
+from src.presentation.dependencies.list_query import get_list_query
+
+
+class TestGetListQuery:
+    def test_no_parameters_means_no_query(self) -> None:
+        assert get_list_query(filters=[], order_by=None) is None
+
+    def test_parses_every_operator_and_sort_direction(self) -> None:
+        query = get_list_query(
+            filters=[
+                "region:eq:kanto",
+                "type:in:potion,berry",
+                "price:range:..500",
+                "name:prefix:Ash",
+                "battle_date:range:2026-01-01T00:00:00..",
+            ],
+            order_by="-battle_date,id",
+        )
+
+        assert query == ListQuery(
+            filters=(
+                FieldFilter("region", FilterOperator.EQ, ("kanto",)),
+                FieldFilter("type", FilterOperator.IN, ("potion", "berry")),
+                FieldFilter("price", FilterOperator.RANGE, (None, "500")),
+                FieldFilter("name", FilterOperator.PREFIX, ("Ash",)),
+                FieldFilter(
+                    "battle_date", FilterOperator.RANGE, ("2026-01-01T00:00:00", None)
+                ),
+            ),
+            order_by=(SortKey("battle_date", descending=True), SortKey("id")),
+        )
+
+    @pytest.mark.parametrize(
+        ("filters", "order_by"),
+        [
+            (["region=kanto"], None),
+            (["region:like:kan"], None),
+            (["price:range:500"], None),
+            ([":eq:x"], None),
+            (["type:in:"], None),
+            ([], "name,"),
+        ],
+    )
+    def test_malformed_parameters_are_bad_requests(
+        self, filters: list[str], order_by: str | None
+    ) -> None:
+        with pytest.raises(HTTPException) as exc_info:
+            get_list_query(filters=filters, order_by=order_by)
+
+        assert exc_info.value.status_code == 400
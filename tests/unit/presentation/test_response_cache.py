@@ -0,0 +1,195 @@
+from collections.abc import Generator
+from importlib import import_module
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from src.persistence.database.table_versions import TableVersionTracker
+from src.presentation.dependencies.conditional import ConditionalGet
+from src.presentation.middleware.response_cache import (
+    ResponseCache,
+    ResponseCacheMiddleware,
+)
+
+MONOTONIC = "src.presentation.middleware.response_cache.monotonic"
+HEADERS = ((b"content-type", b"application/json"), (b"etag", b'W/"abc"'))
+
+
+class TestResponseCache:
+    def test_entry_is_served_while_versions_match(self) -> None:
+        cache = ResponseCache(max_bytes=1024, max_entry_bytes=1024, ttl_seconds=30)
+        cache.put(("/pokemon/", b"", ""), (1,), 200, HEADERS, b"[]")
+
+        cached = cache.get(("/pokemon/", b"", ""), (1,))
+
+        assert cached is not None
+        assert cached.body == b"[]"
+        assert cached.etag == 'W/"abc"'
+        assert cache.get(("/pokemon/", b"", ""), (2,)) is None
+        assert cache.get(("/pokemon/", b"", ""), (1,)) is None
+        assert cache.stats()["hits"] == 1
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        cache = ResponseCache(max_bytes=1024, max_entry_bytes=1024, ttl_seconds=30)
+        with patch(MONOTONIC, return_value=0.0):
+            cache.put("key", (1,), 200, HEADERS, b"[]")
+        with patch(MONOTONIC, return_value=31.0):
+            assert cache.get("key", (1,)) is None
+
+    def test_total_bytes_are_bounded(self) -> None:
+        cache = ResponseCache(max_bytes=10, max_entry_bytes=8, ttl_seconds=30)
+
+        assert cache.put("first", (1,), 200, HEADERS, b"12345")
+        assert cache.put("second", (1,), 200, HEADERS, b"12345")
+        assert cache.put("third", (1,), 200, HEADERS, b"12")
+        assert not cache.put("too-big", (1,), 200, HEADERS, b"123456789")
+
+        assert cache.get("first", (1,)) is None
+        assert cache.get("second", (1,)) is not None
+        assert cache.stats()["bytes"] == 7
+        assert cache.stats()["evictions"] == 1
+
+
+class TestResponseCacheMiddleware:
+    @pytest.fixture
+    def tracker(
+        self, engine: Engine, monkeypatch: pytest.MonkeyPatch
+    ) -> TableVersionTracker:
+        tracker = TableVersionTracker()
+        monkeypatch.setattr(tracker, "sync", Mock(wraps=tracker.sync))
+        for module in (
+            "src.persistence.database.connection",
+            "src.presentation.dependencies.conditional",
+            "src.presentation.middleware.response_cache",
+        ):
+            # The middleware package re-exports a same-named cache instance.
+            monkeypatch.setattr(import_module(module), "table_versions", tracker)
+        monkeypatch.setattr("src.persistence.database.connection.engine", engine)
+        return tracker
+
+    @pytest.fixture
+    def client(
+        self, engine: Engine, tracker: TableVersionTracker
+    ) -> Generator[TestClient]:
+        app = FastAPI()
+        app.state.calls = 0
+        cached_route = {"dependencies": [Depends(ConditionalGet("pokemon"))]}
+
+        @app.get("/pokemon", **cached_route)
+        def listing() -> dict:
+            app.state.calls += 1
+            return {"pokemon": []}
+
+        @app.get(
+            "/me",
+            dependencies=[Depends(ConditionalGet("pokemon", per_principal=True))],
+        )
+        def me(request: Request) -> dict:
+            app.state.calls += 1
+            return {"viewer": request.headers.get("authorization", "")}
+
+        @app.get("/missing", **cached_route)
+        def missing() -> dict:
+            app.state.calls += 1
+            raise HTTPException(status_code=404, detail="gone")
+
+        @app.get("/cookie", **cached_route)
+        def cookie(response: Response) -> dict:
+            app.state.calls += 1
+            response.set_cookie("session", "abc")
+            return {}
+
+        @app.get("/big", **cached_route)
+        def big() -> dict:
+            app.state.calls += 1
+            return {"data": "x" * 512}
+
+        cache = ResponseCache(max_bytes=4096, max_entry_bytes=256, ttl_seconds=30)
+        app.add_middleware(ResponseCacheMiddleware, cache=cache, engine=engine)
+        with TestClient(app) as client:
+            yield client
+
+    def test_repeat_is_served_from_cache_with_one_sync_per_request(
+        self, client: TestClient, tracker: TableVersionTracker
+    ) -> None:
+        first = client.get("/pokemon")
+        second = client.get("/pokemon")
+
+        assert first.json() == second.json()
+        assert "x-cache" not in first.headers
+        assert second.headers["x-cache"] == "HIT"
+        assert client.app.state.calls == 1
+        assert tracker.sync.call_count == 2  # type: ignore[attr-defined]
+
+    def test_per_principal_responses_are_scoped_to_the_authorization_header(
+        self, client: TestClient
+    ) -> None:
+        client.get("/me", headers={"Authorization": "Bearer a"})
+
+        other = client.get("/me", headers={"Authorization": "Bearer b"})
+        again = client.get("/me", headers={"Authorization": "Bearer a"})
+
+        assert other.json() == {"viewer": "Bearer b"}
+        assert "x-cache" not in other.headers
+        assert again.json() == {"viewer": "Bearer a"}
+        assert again.headers["x-cache"] == "HIT"
+
+    def test_public_responses_are_shared_and_survive_user_writes(
+        self, client: TestClient, session: Session
+    ) -> None:
+        client.get("/pokemon", headers={"Authorization": "Bearer a"})
+        TableVersionTracker().bump(session, ["users"])
+        session.commit()
+
+        response = client.get("/pokemon", headers={"Authorization": "Bearer b"})
+
+        assert response.headers["x-cache"] == "HIT"
+        assert client.app.state.calls == 1
+
+    def test_user_write_is_a_miss_for_per_principal_responses(
+        self, client: TestClient, session: Session
+    ) -> None:
+        client.get("/me", headers={"Authorization": "Bearer a"})
+        TableVersionTracker().bump(session, ["users"])
+        session.commit()
+
+        response = client.get("/me", headers={"Authorization": "Bearer a"})
+
+        assert "x-cache" not in response.headers
+        assert client.app.state.calls == 2
+
+    def test_matching_if_none_match_replays_a_304(self, client: TestClient) -> None:
+        etag = client.get("/pokemon").headers["etag"]
+
+        response = client.get("/pokemon", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert client.app.state.calls == 1
+
+    def test_write_by_another_worker_is_a_miss(
+        self, client: TestClient, session: Session
+    ) -> None:
+        client.get("/pokemon")
+        TableVersionTracker().bump(session, ["pokemon"])
+        session.commit()
+
+        response = client.get("/pokemon")
+
+        assert "x-cache" not in response.headers
+        assert client.app.state.calls == 2
+
+    @pytest.mark.parametrize("path", ["/missing", "/cookie", "/big"])
+    def test_errors_cookies_and_oversized_bodies_are_not_stored(
+        self, client: TestClient, path: str
+    ) -> None:
+        client.get(path)
+
+        response = client.get(path)
+
+        assert "x-cache" not in response.headers
+        assert client.app.state.calls == 2
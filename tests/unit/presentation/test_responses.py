@@ -0,0 +1,34 @@
+import json
+
+from pydantic import TypeAdapter
+
+from src.application.dtos.item_dto import ItemResponseDTO
+from src.presentation.responses import FastJSONResponse, trusted_json
+
+
+class TestResponses:
+    def test_fast_json_response_matches_stdlib_encoding(self) -> None:
+        content = {"name": "Pikachu", "level": 25, "attacks": ["Thunder Shock"]}
+
+        response = FastJSONResponse(content)
+
+        assert json.loads(response.body) == content
+        assert response.media_type == "application/json"
+
+    def test_trusted_json_encodes_constructed_dtos(self) -> None:
+        item = ItemResponseDTO.model_construct(
+            id=1, name="Potion", type="potion", description="Heals 20 HP", price=200
+        )
+
+        response = trusted_json(TypeAdapter(list[ItemResponseDTO]), [item])
+
+        assert response.status_code == 200
+        assert json.loads(response.body) == [
+            {
+                "id": 1,
+                "name": "Potion",
+                "type": "potion",
+                "description": "Heals 20 HP",
+                "price": 200,
+            }
+        ]
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session
+
+from src.domain.entities.battle import Battle
+from src.persistence.database.models import TrainerModel
+from src.persistence.repositories.sqlmodel_battle_repository import (
+    SqlModelBattleRepository,
+)
+
+
+class TestLeaderboard:
+    @pytest.fixture
+    def repository(self, session: Session) -> SqlModelBattleRepository:
+        session.add_all(
+            TrainerModel(id=trainer_id, name=name, gender="male", region="kanto")
+            for trainer_id, name in [(1, "Ash"), (2, "Gary"), (3, "Brock")]
+        )
+        session.commit()
+        repository = SqlModelBattleRepository(session)
+        for team1, team2, winner in [(1, 2, 1), (1, 3, 1), (2, 3, 3), (2, 1, 1)]:
+            repository.create_battle(
+                Battle(
+                    id=None,
+                    team1_trainer_id=team1,
+                    team2_trainer_id=team2,
+                    winner_trainer_id=winner,
+                    team1_strength=100.0,
+                    team2_strength=90.0,
+                    victory_margin=10.0,
+                    battle_date=datetime(2026, 1, 1),
+                )
+            )
+        return repository
+
+    def test_ranks_trainers_from_both_participant_columns(
+        self, repository: SqlModelBattleRepository
+    ) -> None:
+        leaderboard = repository.get_leaderboard_data()
+
+        assert [
+            (row["trainer_name"], row["wins"], row["total_battles"])
+            for row in leaderboard
+        ] == [("Ash", 3, 3), ("Brock", 1, 2), ("Gary", 0, 3)]
+
+    def test_totals_count_battles_not_wins(
+        self, repository: SqlModelBattleRepository
+    ) -> None:
+        assert repository.get_leaderboard_totals() == {
+            "ranked_trainers": 3,
+            "recorded_battles": 4,
+        }
@@ -0,0 +1,139 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.persistence.repositories.cached_repository import (
+    CachedRepository,
+    EntityCache,
+)
+from tests.factories.item_factories import ItemFactory
+from tests.factories.pokemon_factories import PokemonFactory
+
+
+class TestCachedRepository:
+    @pytest.fixture
+    def cache(self) -> EntityCache:
+        return EntityCache(max_size=2, ttl_seconds=60)
+
+    @pytest.fixture
+    def cached_repository(
+        self, mock_item_repository: Mock, cache: EntityCache
+    ) -> CachedRepository:
+        return CachedRepository(mock_item_repository, cache)
+
+    def test_get_by_id_hit_skips_repository(
+        self,
+        cached_repository: CachedRepository,
+        mock_item_repository: Mock,
+        cache: EntityCache,
+    ) -> None:
+        mock_item_repository.get_by_id.return_value = ItemFactory.potion()
+
+        first = cached_repository.get_by_id(1)
+        second = cached_repository.get_by_id(1)
+
+        assert first == second
+        mock_item_repository.get_by_id.assert_called_once_with(1)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_cached_entity_is_isolated_from_callers(
+        self, mock_pokemon_repository: Mock, cache: EntityCache
+    ) -> None:
+        repository = CachedRepository(mock_pokemon_repository, cache)
+        mock_pokemon_repository.get_by_id.return_value = PokemonFactory.pikachu()
+
+        pokemon = repository.get_by_id(1)
+        pokemon.level = 99
+        pokemon.attacks.append("Surf")
+
+        cached = repository.get_by_id(1)
+        assert cached.level != 99
+        assert "Surf" not in cached.attacks
+
+    def test_update_replaces_cached_entity(
+        self, cached_repository: CachedRepository, mock_item_repository: Mock
+    ) -> None:
+        potion = ItemFactory.potion()
+        mock_item_repository.get_by_id.return_value = potion
+        cached_repository.get_by_id(1)
+
+        updated = ItemFactory.potion()
+        updated.price = 300
+        mock_item_repository.update.return_value = updated
+
+        cached_repository.update(1, updated)
+
+        assert cached_repository.get_by_id(1).price == 300
+        mock_item_repository.get_by_id.assert_called_once_with(1)
+
+    def test_delete_invalidates(
+        self, cached_repository: CachedRepository, mock_item_repository: Mock
+    ) -> None:
+        mock_item_repository.get_by_id.return_value = ItemFactory.potion()
+        cached_repository.get_by_id(1)
+        mock_item_repository.delete.return_value = True
+
+        assert cached_repository.delete(1) is True
+
+        mock_item_repository.get_by_id.return_value = None
+        assert cached_repository.get_by_id(1) is None
+
+    def test_row_read_before_a_delete_is_not_cached(
+        self, cached_repository: CachedRepository, mock_item_repository: Mock
+    ) -> None:
+        potion = ItemFactory.potion()
+        mock_item_repository.delete.return_value = True
+
+        def read_then_delete(entity_id: int):
+            # The delete commits while this reader still holds the old row.
+            cached_repository.delete(entity_id)
+            return potion
+
+        mock_item_repository.get_by_id.side_effect = read_then_delete
+        assert cached_repository.get_by_id(1) == potion
+
+        mock_item_repository.get_by_id.side_effect = None
+        mock_item_repository.get_by_id.return_value = None
+        assert cached_repository.get_by_id(1) is None
+
+    def test_older_update_does_not_overwrite_a_newer_one(
+        self, cache: EntityCache
+    ) -> None:
+        older_write = cache.invalidate(1)
+        newer_write = cache.invalidate(1)
+        newer = ItemFactory.potion()
+        newer.price = 300
+        cache.put(newer, newer_write)
+
+        cache.put(ItemFactory.potion(), older_write)
+
+        assert cache.get(1).price == 300
+
+    def test_least_recently_used_entry_is_evicted(self, cache: EntityCache) -> None:
+        cache.put(ItemFactory.potion())
+        cache.put(ItemFactory.master_ball())
+        cache.get(1)
+        cache.put(ItemFactory.build(id=3))
+
+        assert cache.get(2) is None
+        assert cache.get(1) is not None
+        assert cache.stats()["size"] == 2
+
+    def test_expired_entry_is_a_miss(self, cache: EntityCache) -> None:
+        with patch(
+            "src.persistence.repositories.cached_repository.monotonic",
+            side_effect=[0.0, 61.0],
+        ):
+            cache.put(ItemFactory.potion())
+            assert cache.get(1) is None
+
+    def test_domain_methods_are_delegated(
+        self, cached_repository: CachedRepository, mock_item_repository: Mock
+    ) -> None:
+        mock_item_repository.get_by_type.return_value = [ItemFactory.potion()]
+
+        result = cached_repository.get_by_type("potion")
+
+        assert len(result) == 1
+        mock_item_repository.get_by_type.assert_called_once_with("potion")
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from sqlmodel import Session
+
+from src.persistence.database.models import BattleModel, PokemonModel, TrainerModel
+from src.persistence.repositories.sqlmodel_battle_repository import (
+    SqlModelBattleRepository,
+)
+from src.persistence.repositories.sqlmodel_pokemon_repository import (
+    SqlModelPokemonRepository,
+)
+
+
+class TestChunkedIteration:
+    def test_iter_chunks_walks_the_table_in_id_order(self, session: Session) -> None:
+        session.add_all(
+            PokemonModel(
+                name=f"Pokemon {index}",
+                type_primary="fire",
+                attacks="[]",
+                nature="bold",
+            )
+            for index in range(5)
+        )
+        session.commit()
+
+        chunks = list(SqlModelPokemonRepository(session).iter_chunks(chunk_size=2))
+
+        assert [[pokemon.id for pokemon in chunk] for chunk in chunks] == [
+            [1, 2],
+            [3, 4],
+            [5],
+        ]
+
+    def test_iter_battles_filters_by_date_range(self, session: Session) -> None:
+        session.add_all(
+            [
+                TrainerModel(id=1, name="Ash", gender="male", region="kanto"),
+                TrainerModel(id=2, name="Gary", gender="male", region="kanto"),
+            ]
+        )
+        session.add_all(
+            BattleModel(
+                team1_trainer_id=1,
+                team2_trainer_id=2,
+                winner_trainer_id=1,
+                team1_strength=100.0,
+                team2_strength=90.0,
+                victory_margin=10.0,
+                battle_date=datetime(2026, month, 1),
+            )
+            for month in (1, 2, 3, 4)
+        )
+        session.commit()
+
+        chunks = SqlModelBattleRepository(session).iter_battles(
+            chunk_size=1,
+            date_from=datetime(2026, 2, 1),
+            date_to=datetime(2026, 3, 1),
+        )
+
+        assert [[battle.battle_date.month for battle in chunk] for chunk in chunks] == [
+            [2],
+            [3],
+        ]
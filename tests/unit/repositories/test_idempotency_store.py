@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+from sqlmodel import Session, select
+
+from src.persistence.database.idempotency import IdempotencyStore
+from src.persistence.database.models import IdempotencyKeyModel
+
+
+class TestIdempotencyStore:
+    def test_second_claim_sees_the_first_in_progress(self, session: Session) -> None:
+        store = IdempotencyStore(ttl_seconds=60)
+
+        assert store.claim(session, "scope", "key", "fp") is None
+        existing = store.claim(session, "scope", "key", "fp")
+
+        assert existing is not None
+        assert existing.in_progress
+        assert store.claim(session, "other-scope", "key", "fp") is None
+
+    def test_completed_claim_returns_the_stored_response(
+        self, session: Session
+    ) -> None:
+        store = IdempotencyStore(ttl_seconds=60)
+        store.claim(session, "scope", "key", "fp")
+        headers = [(b"content-type", b"application/json"), (b"location", b"/1")]
+        store.complete(session, "scope", "key", 201, headers, b'{"id":1}')
+
+        existing = store.claim(session, "scope", "key", "fp")
+
+        assert existing is not None
+        assert not existing.in_progress
+        assert (existing.status_code, existing.body) == (201, b'{"id":1}')
+        assert existing.headers == tuple(headers)
+
+    def test_claim_is_a_short_lease_until_completed(self, session: Session) -> None:
+        store = IdempotencyStore(ttl_seconds=3600, lease_seconds=30)
+        before = datetime.utcnow()
+        store.claim(session, "scope", "key", "fp")
+
+        row = session.exec(select(IdempotencyKeyModel)).one()
+        assert row.expires_at < before + timedelta(seconds=60)
+
+        store.complete(session, "scope", "key", 201, [], b"{}")
+        session.refresh(row)
+        assert row.expires_at > before + timedelta(seconds=3000)
+
+    def test_abandoned_claim_is_taken_over_after_its_lease(
+        self, session: Session
+    ) -> None:
+        store = IdempotencyStore(ttl_seconds=3600, lease_seconds=0)
+        store.claim(session, "scope", "key", "fp")
+
+        assert store.claim(session, "scope", "key", "fp") is None
+
+    def test_released_claim_can_be_taken_again(self, session: Session) -> None:
+        store = IdempotencyStore(ttl_seconds=60)
+        store.claim(session, "scope", "key", "fp")
+        store.release(session, "scope", "key")
+
+        assert store.claim(session, "scope", "key", "fp") is None
+
+    def test_expired_rows_are_purged_on_claim(self, session: Session) -> None:
+        store = IdempotencyStore(ttl_seconds=60, purge_batch_size=2)
+        expired_at = datetime.utcnow() - timedelta(seconds=1)
+        for index in range(3):
+            session.add(
+                IdempotencyKeyModel(
+                    scope="scope",
+                    key=f"old-{index}",
+                    fingerprint="fp",
+                    status_code=201,
+                    expires_at=expired_at,
+                )
+            )
+        session.commit()
+
+        # The expired row of the key itself always goes, the rest in batches.
+        assert store.claim(session, "scope", "old-2", "new-fp") is None
+
+        keys = session.exec(select(IdempotencyKeyModel.key)).all()
+        assert sorted(keys) == ["old-2"]
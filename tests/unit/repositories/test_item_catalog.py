@@ -0,0 +1,70 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.enums.item_enums import ItemType
+from src.persistence.repositories.item_catalog import (
+    CatalogItemRepository,
+    ItemCatalog,
+)
+from tests.factories.item_factories import ItemFactory
+
+
+class TestCatalogItemRepository:
+    @pytest.fixture
+    def catalog_repository(self, mock_item_repository: Mock) -> CatalogItemRepository:
+        items = [
+            ItemFactory.master_ball(),
+            ItemFactory.potion(),
+            ItemFactory.antidote(),
+        ]
+        mock_item_repository.count.return_value = len(items)
+        mock_item_repository.get_all.return_value = items
+        return CatalogItemRepository(mock_item_repository, ItemCatalog())
+
+    def test_reads_load_the_catalog_once(
+        self, catalog_repository: CatalogItemRepository, mock_item_repository: Mock
+    ) -> None:
+        assert catalog_repository.get_by_id(1).name == "Potion"
+        assert catalog_repository.get_by_id(99) is None
+        assert [item.id for item in catalog_repository.get_all(0, 2)] == [1, 2]
+        assert catalog_repository.count() == 3
+
+        mock_item_repository.get_all.assert_called_once_with(0, 3)
+        mock_item_repository.get_by_id.assert_not_called()
+
+    def test_type_and_price_indexes(
+        self, catalog_repository: CatalogItemRepository
+    ) -> None:
+        potions = catalog_repository.get_by_type(ItemType.POTION.value)
+        affordable = catalog_repository.get_by_price_range(0, 200)
+
+        assert [item.name for item in potions] == ["Potion"]
+        assert catalog_repository.get_by_type("not-a-type") == []
+        assert [item.price for item in affordable] == [100, 200]
+
+    def test_reads_are_isolated_from_the_snapshot(
+        self, catalog_repository: CatalogItemRepository
+    ) -> None:
+        catalog_repository.get_by_id(1).price = 1
+        catalog_repository.get_all()[0].name = "Changed"
+        catalog_repository.get_by_type(ItemType.POTION.value)[0].price = 2
+
+        assert catalog_repository.get_by_id(1).name == "Potion"
+        assert catalog_repository.get_by_id(1).price == 200
+        assert catalog_repository.get_by_price_range(0, 200)[0].price == 100
+
+    def test_write_publishes_a_new_snapshot(
+        self, catalog_repository: CatalogItemRepository, mock_item_repository: Mock
+    ) -> None:
+        catalog_repository.get_by_id(1)
+        cheaper = ItemFactory.potion()
+        cheaper.price = 50
+        mock_item_repository.update.return_value = cheaper
+        mock_item_repository.get_all.return_value = [cheaper]
+        mock_item_repository.count.return_value = 1
+
+        catalog_repository.update(1, cheaper)
+
+        assert catalog_repository.get_by_id(1).price == 50
+        assert catalog_repository.get_by_id(2) is None
@@ -0,0 +1,154 @@
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session
+
+from src.domain.exceptions import ValidationException
+from src.domain.repositories.list_query import (
+    FieldFilter,
+    FilterOperator,
+    ListQuery,
+    SortKey,
+)
+from src.persistence.database.models import BattleModel, PokemonModel, TrainerModel
+from src.persistence.repositories.sqlmodel_battle_repository import (
+    SqlModelBattleRepository,
+)
+from src.persistence.repositories.sqlmodel_pokemon_repository import (
+    SqlModelPokemonRepository,
+)
+
+
+def where(field: str, operator: FilterOperator, *values: object) -> ListQuery:
+    return ListQuery(filters=(FieldFilter(field, operator, values),))
+
+
+class TestListQuery:
+    @pytest.fixture
+    def session(self, session: Session) -> Session:
+        session.add_all(
+            PokemonModel(
+                name=name,
+                type_primary=type_primary,
+                attacks="[]",
+                nature="bold",
+            )
+            for name, type_primary in [
+                ("Pikachu", "electric"),
+                ("Charmander", "fire"),
+                ("Pichu", "electric"),
+                ("Ponyta", "fire"),
+                ("Pi%", "normal"),
+            ]
+        )
+        session.commit()
+        return session
+
+    @pytest.fixture
+    def repository(self, session: Session) -> SqlModelPokemonRepository:
+        return SqlModelPokemonRepository(session)
+
+    def names(self, repository: SqlModelPokemonRepository, query: ListQuery) -> list:
+        return [pokemon.name for pokemon in repository.get_all(0, 100, query)]
+
+    def test_eq_and_in(self, repository: SqlModelPokemonRepository) -> None:
+        assert self.names(
+            repository, where("type_primary", FilterOperator.EQ, "fire")
+        ) == ["Charmander", "Ponyta"]
+        assert self.names(
+            repository, where("type_primary", FilterOperator.IN, "fire", "normal")
+        ) == ["Charmander", "Ponyta", "Pi%"]
+
+    def test_range_with_open_end_coerces_values(
+        self, repository: SqlModelPokemonRepository
+    ) -> None:
+        query = where("id", FilterOperator.RANGE, "3", None)
+
+        assert self.names(repository, query) == ["Pichu", "Ponyta", "Pi%"]
+
+    def test_prefix_is_case_sensitive_and_escapes_wildcards(
+        self, repository: SqlModelPokemonRepository
+    ) -> None:
+        assert self.names(repository, where("name", FilterOperator.PREFIX, "Pi")) == [
+            "Pikachu",
+            "Pichu",
+            "Pi%",
+        ]
+        assert self.names(repository, where("name", FilterOperator.PREFIX, "pi")) == []
+        assert self.names(repository, where("name", FilterOperator.PREFIX, "Pi%")) == [
+            "Pi%"
+        ]
+
+    def test_order_by_breaks_ties_by_id(
+        self, repository: SqlModelPokemonRepository
+    ) -> None:
+        query = ListQuery(
+            order_by=(SortKey("type_primary", descending=True),),
+        )
+
+        assert self.names(repository, query) == [
+            "Pi%",
+            "Charmander",
+            "Ponyta",
+            "Pikachu",
+            "Pichu",
+        ]
+
+    def test_filtered_count_and_row_versions(
+        self, repository: SqlModelPokemonRepository
+    ) -> None:
+        query = where("type_primary", FilterOperator.EQ, "electric")
+
+        assert repository.count(query=query) == 2
+        assert repository.get_row_versions(0, 100, query) == [(1, 1), (3, 1)]
+        assert repository.count() == 5
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            where("level", FilterOperator.EQ, 5),
+            where("id", FilterOperator.EQ, "five"),
+            where("id", FilterOperator.PREFIX, "1"),
+            ListQuery(order_by=(SortKey("attacks"),)),
+        ],
+    )
+    def test_rejects_unindexed_fields_and_bad_values(
+        self, repository: SqlModelPokemonRepository, query: ListQuery
+    ) -> None:
+        with pytest.raises(ValidationException):
+            repository.get_all(0, 100, query)
+
+    def test_datetime_range_on_battles(self, session: Session) -> None:
+        session.add_all(
+            [
+                TrainerModel(id=1, name="Ash", gender="male", region="kanto"),
+                TrainerModel(id=2, name="Gary", gender="male", region="kanto"),
+            ]
+        )
+        session.add_all(
+            BattleModel(
+                team1_trainer_id=1,
+                team2_trainer_id=2,
+                winner_trainer_id=1,
+                team1_strength=1.0,
+                team2_strength=0.5,
+                victory_margin=0.5,
+                battle_date=datetime(2026, 1, day),
+            )
+            for day in (1, 2, 3)
+        )
+        session.commit()
+        query = ListQuery(
+            filters=(
+                FieldFilter(
+                    "battle_date",
+                    FilterOperator.RANGE,
+                    ("2026-01-02T00:00:00", None),
+                ),
+            ),
+            order_by=(SortKey("battle_date", descending=True),),
+        )
+
+        battles = SqlModelBattleRepository(session).get_all(0, 100, query)
+
+        assert [battle.battle_date.day for battle in battles] == [3, 2]
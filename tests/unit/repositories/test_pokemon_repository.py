@@ -0,0 +1,33 @@
+from sqlmodel import Session
+
+from src.domain.entities.pokemon import Pokemon
+from src.domain.enums.pokemon_enums import PokemonNature, PokemonType
+from src.persistence.repositories.sqlmodel_pokemon_repository import (
+    SqlModelPokemonRepository,
+)
+
+
+def _pokemon(name: str) -> Pokemon:
+    return Pokemon(
+        id=None,
+        name=name,
+        type_primary=PokemonType.FIRE,
+        type_secondary=None,
+        attacks=["Ember"],
+        nature=PokemonNature.HARDY,
+    )
+
+
+class TestRowVersions:
+    def test_recreated_row_never_repeats_an_id_and_version(
+        self, session: Session
+    ) -> None:
+        repository = SqlModelPokemonRepository(session)
+        deleted = repository.create(_pokemon("Charmander"))
+        assert deleted.id is not None
+        repository.delete(deleted.id)
+
+        created = repository.create(_pokemon("Ponyta"))
+
+        assert created.id != deleted.id
+        assert repository.get_row_versions() == [(created.id, 1)]
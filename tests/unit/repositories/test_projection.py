@@ -0,0 +1,43 @@
+import pytest
+from sqlmodel import Session
+
+from src.persistence.database.models import PokemonModel
+from src.persistence.repositories.sqlmodel_pokemon_repository import (
+    SqlModelPokemonRepository,
+)
+
+
+class TestProjection:
+    @pytest.fixture
+    def session(self, session: Session) -> Session:
+        session.add_all(
+            PokemonModel(
+                name=f"Pokemon {index}",
+                type_primary="fire",
+                attacks='["Ember"]',
+                nature="bold",
+            )
+            for index in range(3)
+        )
+        session.commit()
+        return session
+
+    def test_get_projection_returns_only_requested_columns(
+        self, session: Session
+    ) -> None:
+        rows = SqlModelPokemonRepository(session).get_projection(["id", "name"], 1, 5)
+
+        assert rows == [
+            {"id": 2, "name": "Pokemon 1"},
+            {"id": 3, "name": "Pokemon 2"},
+        ]
+
+    def test_get_projection_decodes_attacks(self, session: Session) -> None:
+        row = SqlModelPokemonRepository(session).get_projection_by_id(1, ["attacks"])
+
+        assert row == {"attacks": ["Ember"]}
+
+    def test_get_projection_by_id_missing(self, session: Session) -> None:
+        repository = SqlModelPokemonRepository(session)
+
+        assert repository.get_projection_by_id(99, ["name"]) is None
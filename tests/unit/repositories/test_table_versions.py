@@ -0,0 +1,60 @@
+from sqlmodel import Session
+
+from src.persistence.database.table_versions import TableVersionTracker
+
+
+class TestTableVersionTracker:
+    @staticmethod
+    def _write(tracker: TableVersionTracker, session: Session, table: str) -> None:
+        versions = tracker.bump(session, [table])
+        session.commit()
+        tracker.acknowledge(versions)
+
+    def test_write_from_another_worker_invalidates(self, session: Session) -> None:
+        local, remote = TableVersionTracker(), TableVersionTracker()
+        invalidated: list[str] = []
+        local.add_listener(invalidated.append)
+        local.sync(session)
+        remote.sync(session)
+
+        self._write(remote, session, "pokemon")
+        local.sync(session)
+
+        assert invalidated == ["pokemon"]
+
+    def test_own_write_does_not_invalidate(self, session: Session) -> None:
+        tracker = TableVersionTracker()
+        invalidated: list[str] = []
+        tracker.add_listener(invalidated.append)
+        tracker.sync(session)
+
+        self._write(tracker, session, "items")
+        self._write(tracker, session, "items")
+        tracker.sync(session)
+
+        assert invalidated == []
+
+    def test_own_write_notifies_local_write_listeners(self, session: Session) -> None:
+        tracker = TableVersionTracker()
+        remote_only: list[str] = []
+        every_write: list[str] = []
+        tracker.add_listener(remote_only.append)
+        tracker.add_listener(every_write.append, local_writes=True)
+        tracker.sync(session)
+
+        self._write(tracker, session, "trainers")
+
+        assert remote_only == []
+        assert every_write == ["trainers"]
+
+    def test_interleaved_write_is_detected_on_next_sync(self, session: Session) -> None:
+        local, remote = TableVersionTracker(), TableVersionTracker()
+        invalidated: list[str] = []
+        local.add_listener(invalidated.append)
+        local.sync(session)
+
+        self._write(remote, session, "teams")
+        self._write(local, session, "teams")
+        local.sync(session)
+
+        assert invalidated == ["teams"]
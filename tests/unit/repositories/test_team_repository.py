@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from src.domain.entities.team import Team
+from src.domain.exceptions import BusinessRuleException
+from src.persistence.database.models import PokemonModel, TrainerModel
+from src.persistence.repositories.sqlmodel_team_repository import (
+    SqlModelTeamRepository,
+)
+
+
+class TestTeamConstraints:
+    @pytest.fixture
+    def session(self, engine: Engine, session: Session) -> Session:
+        # The in-memory database shares one connection, so this sticks.
+        with engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+        session.add(TrainerModel(id=1, name="Ash", gender="male", region="kanto"))
+        session.add_all(
+            PokemonModel(
+                id=pokemon_id,
+                name=name,
+                type_primary="fire",
+                attacks="[]",
+                nature="bold",
+            )
+            for pokemon_id, name in [(1, "Charmander"), (2, "Ponyta")]
+        )
+        session.commit()
+        return session
+
+    def test_duplicate_active_position_is_a_business_rule(
+        self, session: Session
+    ) -> None:
+        repository = SqlModelTeamRepository(session)
+        repository.add_pokemon_to_team(
+            Team(id=None, trainer_id=1, pokemon_id=1, position=1)
+        )
+
+        with pytest.raises(BusinessRuleException, match="Position 1"):
+            repository.add_pokemon_to_team(
+                Team(id=None, trainer_id=1, pokemon_id=2, position=1)
+            )
+
+    def test_moving_onto_an_occupied_position_is_a_business_rule(
+        self, session: Session
+    ) -> None:
+        repository = SqlModelTeamRepository(session)
+        repository.add_pokemon_to_team(
+            Team(id=None, trainer_id=1, pokemon_id=1, position=1)
+        )
+        repository.add_pokemon_to_team(
+            Team(id=None, trainer_id=1, pokemon_id=2, position=2)
+        )
+
+        with pytest.raises(BusinessRuleException):
+            repository.update_position(1, 2, 1)
+
+    def test_other_integrity_errors_propagate(self, session: Session) -> None:
+        repository = SqlModelTeamRepository(session)
+
+        with pytest.raises(IntegrityError, match="FOREIGN KEY"):
+            repository.add_pokemon_to_team(
+                Team(id=None, trainer_id=1, pokemon_id=99, position=1)
+            )
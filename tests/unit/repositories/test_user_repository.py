@@ -0,0 +1,29 @@
+from sqlmodel import Session
+
+from src.persistence.database.models import UserModel
+from src.persistence.repositories.sqlmodel_user_repository import (
+    SqlModelUserRepository,
+)
+
+
+class TestRevokedTokens:
+    def test_only_revoking_or_inactive_users_are_listed(self, session: Session) -> None:
+        for name, token_version, is_active in [
+            ("ash", 0, True),
+            ("misty", 2, True),
+            ("brock", 0, False),
+        ]:
+            session.add(
+                UserModel(
+                    username=name,
+                    email=f"{name}@pokemon.com",
+                    hashed_password="hash",
+                    token_version=token_version,
+                    is_active=is_active,
+                )
+            )
+        session.commit()
+
+        revoked = SqlModelUserRepository(session).get_revoked_tokens()
+
+        assert revoked == {2: 2, 3: None}
@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+from src.application.services.aggregate_refresher import AggregateRefresher
+
+MONOTONIC = "src.application.services.aggregate_refresher.monotonic"
+
+
+class TestAggregateRefresher:
+    def test_nothing_is_served_before_the_first_refresh(self) -> None:
+        refresher = AggregateRefresher(interval_seconds=60, min_interval_seconds=2)
+        refresher.register("counts", lambda: 1)
+
+        assert refresher.get("counts") is None
+
+        refresher.refresh_due()
+
+        assert refresher.get("counts").value == 1
+
+    def test_stamp_change_triggers_a_refresh_after_the_min_interval(self) -> None:
+        refresher = AggregateRefresher(interval_seconds=60, min_interval_seconds=2)
+        values = iter([1, 2])
+        stamp = [(1,)]
+        refresher.register("counts", lambda: next(values), lambda: stamp[0])
+
+        with patch(MONOTONIC, return_value=0.0):
+            refresher.refresh_due()
+        stamp[0] = (2,)
+        with patch(MONOTONIC, return_value=1.0):
+            refresher.refresh_due()
+            assert refresher.get("counts").value == 1
+        with patch(MONOTONIC, return_value=3.0):
+            refresher.refresh_due()
+            assert refresher.get("counts").value == 2
+
+    def test_unchanged_aggregate_is_refreshed_on_the_interval(self) -> None:
+        refresher = AggregateRefresher(interval_seconds=60, min_interval_seconds=2)
+        values = iter([1, 2])
+        refresher.register("counts", lambda: next(values), lambda: (1,))
+
+        with patch(MONOTONIC, return_value=0.0):
+            refresher.refresh_due()
+        with patch(MONOTONIC, return_value=30.0):
+            refresher.refresh_due()
+            assert refresher.get("counts").value == 1
+        with patch(MONOTONIC, return_value=61.0):
+            refresher.refresh_due()
+            assert refresher.get("counts").value == 2
+
+    def test_failed_refresh_keeps_the_previous_value(self) -> None:
+        refresher = AggregateRefresher(interval_seconds=0, min_interval_seconds=0)
+        results = iter([1])
+
+        def compute() -> int:
+            return next(results)
+
+        refresher.register("counts", compute)
+        refresher.refresh_due()
+        refresher.refresh_due()
+
+        assert refresher.get("counts").value == 1
+        assert refresher.stats()["errors"] == 1
@@ -3,15 +3,18 @@ import pytest
 import sys
 from datetime import datetime
 
+from tests.factories.auth_factories import UserFactory, UserLoginDTOFactory
+
 
 class MockSettings:
     JWT_SECRET_KEY = "test_secret_key"
     JWT_ALGORITHM = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 30
+    BCRYPT_ROUNDS = 12
 
 
 class MockCryptContext:
-    def __init__(self, schemes, deprecated):
+    def __init__(self, schemes, deprecated, **kwargs):
         pass
 
     def hash(self, password):
@@ -20,6 +23,13 @@ class MockCryptContext:
     def verify(self, plain_password, hashed_password):
         return plain_password in hashed_password
 
+    def verify_and_update(self, plain_password, hashed_password):
+        if not self.verify(plain_password, hashed_password):
+            return False, None
+        if hashed_password.startswith("$2b$12$"):
+            return True, None
+        return True, self.hash(plain_password)
+
 
 class MockJWT:
     @staticmethod
@@ -30,6 +40,15 @@ class MockJWT:
     def decode(token, secret, algorithms):
         if token == "invalid_token":
             raise MockJWTError("Invalid token")
+        if token == "versioned_token":
+            return {
+                "sub": "1",
+                "username": "ash_ketchum",
+                "email": "ash@pokemon.com",
+                "is_superuser": True,
+                "trainer_id": 1,
+                "ver": 1,
+            }
         return {"sub": "1", "username": "test_user"}
 
 
@@ -152,6 +171,29 @@ class TestAuthService:
         assert result.tokens.access_token is not None
         assert result.tokens.token_type == "bearer"
 
+    def test_authenticate_user_rehashes_outdated_hash(self, auth_service, mock_user_repository):
+        login_dto = UserLoginDTOFactory.ash_login()
+        user = UserFactory.ash_user()
+        user.hashed_password = "$2b$10$hashed_pikachu123"
+
+        mock_user_repository.get_by_username.return_value = user
+
+        auth_service.authenticate_user(login_dto)
+
+        assert user.hashed_password == "$2b$12$hashed_pikachu123"
+        mock_user_repository.update.assert_called_once_with(user.id, user)
+
+    def test_authenticate_user_keeps_current_hash(self, auth_service, mock_user_repository):
+        login_dto = UserLoginDTOFactory.ash_login()
+        user = UserFactory.ash_user()
+        user.hashed_password = auth_service._hash_password("pikachu123")
+
+        mock_user_repository.get_by_username.return_value = user
+
+        auth_service.authenticate_user(login_dto)
+
+        mock_user_repository.update.assert_not_called()
+
     def test_authenticate_user_invalid_credentials(self, auth_service, mock_user_repository):
         from tests.factories.auth_factories import UserLoginDTOFactory, UserFactory
 
@@ -243,3 +285,137 @@ class TestAuthService:
 
         with pytest.raises(ValueError, match="Current password is incorrect"):
             auth_service.change_password(user_id, change_dto)
+
+    @pytest.fixture
+    def cached_auth_service(self, mock_user_repository):
+        with patch('src.application.services.auth_service.settings', MockSettings):
+            from src.application.services.auth_service import AuthService
+            from src.application.services.principal_cache import PrincipalCache
+            return AuthService(
+                user_repository=mock_user_repository,
+                principal_cache=PrincipalCache(ttl_seconds=30),
+            )
+
+    def test_get_current_user_from_token_is_cached(self, cached_auth_service, mock_user_repository):
+        from tests.factories.auth_factories import UserFactory
+
+        mock_user_repository.get_by_id.return_value = UserFactory.ash_user()
+
+        first = cached_auth_service.get_current_user_from_token("valid_token")
+        second = cached_auth_service.get_current_user_from_token("valid_token")
+
+        assert first == second
+        mock_user_repository.get_by_id.assert_called_once_with(1)
+
+    def test_change_password_invalidates_cached_principal(self, cached_auth_service, mock_user_repository):
+        from tests.factories.auth_factories import ChangePasswordDTOFactory, UserFactory
+
+        user = UserFactory.ash_user()
+        user.hashed_password = cached_auth_service._hash_password("pikachu123")
+        mock_user_repository.get_by_id.return_value = user
+        mock_user_repository.update.return_value = user
+
+        cached_auth_service.get_current_user_from_token("valid_token")
+        cached_auth_service.change_password(1, ChangePasswordDTOFactory.valid_change())
+        cached_auth_service.get_current_user_from_token("valid_token")
+
+        assert mock_user_repository.get_by_id.call_count == 3
+
+    def test_deactivate_user_invalidates_cached_principal(self, cached_auth_service, mock_user_repository):
+        from tests.factories.auth_factories import UserFactory
+
+        user = UserFactory.ash_user()
+        mock_user_repository.get_by_id.return_value = user
+        mock_user_repository.update.return_value = user
+
+        cached_auth_service.get_current_user_from_token("valid_token")
+        result = cached_auth_service.deactivate_user(1)
+        cached_auth_service.get_current_user_from_token("valid_token")
+
+        assert result.is_active is False
+        assert mock_user_repository.get_by_id.call_count == 3
+
+    def test_deactivate_user_not_found(self, cached_auth_service, mock_user_repository):
+        mock_user_repository.get_by_id.return_value = None
+
+        with pytest.raises(ValueError, match="User not found"):
+            cached_auth_service.deactivate_user(999)
+
+    @pytest.fixture
+    def stateless_auth_service(self, mock_user_repository):
+        with patch('src.application.services.auth_service.settings', MockSettings):
+            from src.application.services.auth_service import AuthService
+            from src.application.services.token_revocations import TokenRevocationList
+            return AuthService(
+                user_repository=mock_user_repository,
+                token_revocations=TokenRevocationList(refresh_interval_seconds=30),
+            )
+
+    def test_stateless_principal_is_built_from_claims(self, stateless_auth_service, mock_user_repository):
+        mock_user_repository.get_revoked_tokens.return_value = {}
+
+        first = stateless_auth_service.get_current_user_from_token("versioned_token")
+        second = stateless_auth_service.get_current_user_from_token("versioned_token")
+
+        assert first is not None and second is not None
+        assert (first.id, first.username) == (1, "ash_ketchum")
+        mock_user_repository.get_by_id.assert_not_called()
+        mock_user_repository.get_revoked_tokens.assert_called_once()
+
+    def test_stateless_principal_ignores_privilege_claims(self, stateless_auth_service, mock_user_repository):
+        mock_user_repository.get_revoked_tokens.return_value = {}
+
+        principal = stateless_auth_service.get_current_user_from_token("versioned_token")
+
+        assert principal is not None
+        assert not principal.is_superuser
+        assert principal.trainer_id is None
+
+    def test_privileged_user_is_loaded_from_the_database(self, stateless_auth_service, mock_user_repository):
+        user = UserFactory.ash_user()
+        user.trainer_id = 2
+        mock_user_repository.get_by_id.return_value = user
+        mock_user_repository.get_revoked_tokens.return_value = {}
+        principal = stateless_auth_service.get_current_user_from_token("versioned_token")
+
+        result = stateless_auth_service.get_privileged_user(principal)
+
+        assert result is user
+        mock_user_repository.get_by_id.assert_called_once_with(1)
+
+    def test_privileged_user_reuses_db_principal(self, auth_service, mock_user_repository):
+        user = UserFactory.ash_user()
+
+        assert auth_service.get_privileged_user(user) is user
+        mock_user_repository.get_by_id.assert_not_called()
+
+    def test_stateless_principal_rejects_revoked_token(self, stateless_auth_service, mock_user_repository):
+        mock_user_repository.get_revoked_tokens.return_value = {1: 2}
+
+        result = stateless_auth_service.get_current_user_from_token("versioned_token")
+
+        assert result is None
+
+    def test_change_password_revokes_issued_tokens(self, stateless_auth_service, mock_user_repository):
+        from tests.factories.auth_factories import ChangePasswordDTOFactory, UserFactory
+
+        user = UserFactory.ash_user()
+        user.token_version = 1
+        user.hashed_password = stateless_auth_service._hash_password("pikachu123")
+        mock_user_repository.get_by_id.return_value = user
+        mock_user_repository.get_revoked_tokens.return_value = {}
+        assert stateless_auth_service.get_current_user_from_token("versioned_token")
+
+        stateless_auth_service.change_password(1, ChangePasswordDTOFactory.valid_change())
+
+        assert user.token_version == 2
+        assert stateless_auth_service.get_current_user_from_token("versioned_token") is None
+
+    def test_outdated_token_is_rejected_by_db_lookup(self, auth_service, mock_user_repository):
+        from tests.factories.auth_factories import UserFactory
+
+        user = UserFactory.ash_user()
+        user.token_version = 1
+        mock_user_repository.get_by_id.return_value = user
+
+        assert auth_service.get_current_user_from_token("valid_token") is None
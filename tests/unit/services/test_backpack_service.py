@@ -297,3 +297,30 @@ class TestBackpackService:
     def test_backpack_entity_zero_quantity_allowed(self) -> None:
         backpack_item = BackpackFactory.zero_quantity_entry()
         assert backpack_item.quantity == 0
+
+    def test_add_items_to_backpacks_counts_earlier_rows_of_the_batch(
+        self,
+        backpack_service: BackpackService,
+        mock_backpack_repository: Mock,
+        mock_trainer_repository: Mock,
+        mock_item_repository: Mock,
+    ) -> None:
+        mock_trainer_repository.get_by_id.return_value = TrainerFactory.ash_ketchum()
+        mock_item_repository.get_by_id.return_value = ItemFactory.potion()
+        mock_backpack_repository.get_item_quantities.return_value = {(1, 1): 500}
+        merged = BackpackFactory.ash_potion_entry()
+        merged.quantity = 900
+        mock_backpack_repository.add_items.return_value = [merged]
+
+        result = backpack_service.add_items_to_backpacks(
+            [
+                BackpackAddItemDTOFactory.build(trainer_id=1, item_id=1, quantity=400),
+                BackpackAddItemDTOFactory.build(trainer_id=1, item_id=1, quantity=100),
+            ]
+        )
+
+        assert (result.created, result.failed) == (1, 1)
+        assert result.results[0].data.quantity == 900
+        assert "Current: 900" in result.results[1].error
+        mock_backpack_repository.add_items.assert_called_once()
+        mock_backpack_repository.add_item.assert_not_called()
@@ -1,8 +1,10 @@
+from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
 
 from src.application.services.battle_service import BattleService
+from src.application.services.single_flight import SingleFlight
 from src.domain.exceptions import BusinessRuleException, EntityNotFoundException
 from tests.factories.battle_factories import (
     BattleCreateDTOFactory,
@@ -33,12 +35,15 @@ class TestBattleService:
         mock_team_repository: Mock,
     ) -> None:
         create_dto = BattleCreateDTOFactory.ash_vs_gary_ash_wins()
-        ash = TrainerFactory.ash_ketchum()
-        gary = TrainerFactory.gary_oak()
         battle = BattleFactory.ash_vs_gary_ash_wins()
 
-        mock_trainer_repository.get_by_id.side_effect = [ash, gary, ash]
-        mock_team_repository.get_trainer_team_size.side_effect = [3, 4]
+        mock_battle_repository.get_battle_validation_data.return_value = {
+            "team1_trainer_name": "Ash Ketchum",
+            "team2_trainer_name": "Gary Oak",
+            "winner_trainer_name": "Ash Ketchum",
+            "team1_size": 3,
+            "team2_size": 4,
+        }
         mock_battle_repository.create_battle.return_value = battle
 
         result = battle_service.create_battle(create_dto)
@@ -49,70 +54,86 @@ class TestBattleService:
         assert result.team1_trainer_name == "Ash Ketchum"
         assert result.team2_trainer_name == "Gary Oak"
         assert result.winner_trainer_name == "Ash Ketchum"
+        mock_battle_repository.get_battle_validation_data.assert_called_once_with(
+            1, 2, 1
+        )
         mock_battle_repository.create_battle.assert_called_once()
+        mock_trainer_repository.get_by_id.assert_not_called()
+        mock_team_repository.get_trainer_team_size.assert_not_called()
 
     def test_create_battle_team1_trainer_not_found(
-        self, battle_service: BattleService, mock_trainer_repository: Mock
+        self, battle_service: BattleService, mock_battle_repository: Mock
     ) -> None:
         create_dto = BattleCreateDTOFactory.nonexistent_team1_trainer()
-        mock_trainer_repository.get_by_id.return_value = None
+        mock_battle_repository.get_battle_validation_data.return_value = {
+            "team1_trainer_name": None,
+            "team2_trainer_name": "Gary Oak",
+            "winner_trainer_name": "Gary Oak",
+            "team1_size": 0,
+            "team2_size": 4,
+        }
 
         with pytest.raises(EntityNotFoundException, match="Trainer.*999"):
             battle_service.create_battle(create_dto)
 
+        mock_battle_repository.create_battle.assert_not_called()
+
     def test_create_battle_team2_trainer_not_found(
-        self,
-        battle_service: BattleService,
-        mock_trainer_repository: Mock,
+        self, battle_service: BattleService, mock_battle_repository: Mock
     ) -> None:
         create_dto = BattleCreateDTOFactory.nonexistent_team2_trainer()
-        ash = TrainerFactory.ash_ketchum()
-        mock_trainer_repository.get_by_id.side_effect = [ash, None]
+        mock_battle_repository.get_battle_validation_data.return_value = {
+            "team1_trainer_name": "Ash Ketchum",
+            "team2_trainer_name": None,
+            "winner_trainer_name": "Ash Ketchum",
+            "team1_size": 3,
+            "team2_size": 0,
+        }
 
         with pytest.raises(EntityNotFoundException, match="Trainer.*999"):
             battle_service.create_battle(create_dto)
 
     def test_create_battle_winner_trainer_not_found(
-        self,
-        battle_service: BattleService,
-        mock_trainer_repository: Mock,
+        self, battle_service: BattleService, mock_battle_repository: Mock
     ) -> None:
         create_dto = BattleCreateDTOFactory.nonexistent_winner_trainer()
-        ash = TrainerFactory.ash_ketchum()
-        gary = TrainerFactory.gary_oak()
-        mock_trainer_repository.get_by_id.side_effect = [ash, gary, None]
+        mock_battle_repository.get_battle_validation_data.return_value = {
+            "team1_trainer_name": "Ash Ketchum",
+            "team2_trainer_name": "Gary Oak",
+            "winner_trainer_name": None,
+            "team1_size": 3,
+            "team2_size": 4,
+        }
 
         with pytest.raises(EntityNotFoundException, match="Trainer.*999"):
             battle_service.create_battle(create_dto)
 
     def test_create_battle_team1_empty(
-        self,
-        battle_service: BattleService,
-        mock_trainer_repository: Mock,
-        mock_team_repository: Mock,
+        self, battle_service: BattleService, mock_battle_repository: Mock
     ) -> None:
         create_dto = BattleCreateDTOFactory.empty_team1()
-        ash = TrainerFactory.ash_ketchum()
-        gary = TrainerFactory.gary_oak()
-
-        mock_trainer_repository.get_by_id.side_effect = [ash, gary, gary]
-        mock_team_repository.get_trainer_team_size.side_effect = [0, 4]
+        mock_battle_repository.get_battle_validation_data.return_value = {
+            "team1_trainer_name": "Ash Ketchum",
+            "team2_trainer_name": "Gary Oak",
+            "winner_trainer_name": "Gary Oak",
+            "team1_size": 0,
+            "team2_size": 4,
+        }
 
         with pytest.raises(BusinessRuleException, match="Ash Ketchum.*has no Pokemon"):
             battle_service.create_battle(create_dto)
 
     def test_create_battle_team2_empty(
-        self,
-        battle_service: BattleService,
-        mock_trainer_repository: Mock,
-        mock_team_repository: Mock,
+        self, battle_service: BattleService, mock_battle_repository: Mock
     ) -> None:
         create_dto = BattleCreateDTOFactory.empty_team2()
-        ash = TrainerFactory.ash_ketchum()
-        gary = TrainerFactory.gary_oak()
-
-        mock_trainer_repository.get_by_id.side_effect = [ash, gary, ash]
-        mock_team_repository.get_trainer_team_size.side_effect = [3, 0]
+        mock_battle_repository.get_battle_validation_data.return_value = {
+            "team1_trainer_name": "Ash Ketchum",
+            "team2_trainer_name": "Gary Oak",
+            "winner_trainer_name": "Ash Ketchum",
+            "team1_size": 3,
+            "team2_size": 0,
+        }
 
         with pytest.raises(BusinessRuleException, match="Gary Oak.*has no Pokemon"):
             battle_service.create_battle(create_dto)
@@ -133,8 +154,12 @@ class TestBattleService:
 
         mock_battle_repository.get_all.return_value = battles
         mock_trainer_repository.get_by_id.side_effect = [
-            ash, gary, ash,
-            gary, misty, gary,
+            ash,
+            gary,
+            ash,
+            gary,
+            misty,
+            gary,
         ]
 
         result = battle_service.get_all_battles(skip=0, limit=10)
@@ -142,7 +167,9 @@ class TestBattleService:
         assert len(result) == 2
         assert result[0].team1_trainer_name == "Ash Ketchum"
         assert result[1].team1_trainer_name == "Gary Oak"
-        mock_battle_repository.get_all.assert_called_once_with(skip=0, limit=10)
+        mock_battle_repository.get_all.assert_called_once_with(
+            skip=0, limit=10, query=None
+        )
 
     def test_get_all_battles_empty(
         self, battle_service: BattleService, mock_battle_repository: Mock
@@ -152,7 +179,29 @@ class TestBattleService:
         result = battle_service.get_all_battles()
 
         assert len(result) == 0
-        mock_battle_repository.get_all.assert_called_once_with(skip=0, limit=100)
+        mock_battle_repository.get_all.assert_called_once_with(
+            skip=0, limit=100, query=None
+        )
+
+    def test_count_battles_uses_cached_count_by_default(
+        self, battle_service: BattleService, mock_battle_repository: Mock
+    ) -> None:
+        mock_battle_repository.count.return_value = 42
+
+        result = battle_service.count_battles()
+
+        assert result == 42
+        mock_battle_repository.count.assert_called_once_with(exact=False, query=None)
+
+    def test_count_battles_exact(
+        self, battle_service: BattleService, mock_battle_repository: Mock
+    ) -> None:
+        mock_battle_repository.count.return_value = 7
+
+        result = battle_service.count_battles(exact=True)
+
+        assert result == 7
+        mock_battle_repository.count.assert_called_once_with(exact=True, query=None)
 
     def test_get_trainer_battles_success(
         self,
@@ -172,7 +221,9 @@ class TestBattleService:
 
         assert len(result) == 1
         assert result[0].team1_trainer_name == "Ash Ketchum"
-        mock_battle_repository.get_battles_by_trainer.assert_called_once_with(trainer_id)
+        mock_battle_repository.get_battles_by_trainer.assert_called_once_with(
+            trainer_id
+        )
 
     def test_get_trainer_battles_trainer_not_found(
         self, battle_service: BattleService, mock_trainer_repository: Mock
@@ -182,6 +233,46 @@ class TestBattleService:
         with pytest.raises(EntityNotFoundException, match="Trainer.*999"):
             battle_service.get_trainer_battles(999)
 
+    def test_get_trainer_stats_success(
+        self, battle_service: BattleService, mock_battle_repository: Mock
+    ) -> None:
+        mock_battle_repository.get_trainer_battle_stats.return_value = {
+            "trainer_id": 1,
+            "trainer_name": "Ash Ketchum",
+            "wins": 15,
+            "losses": 8,
+            "total_battles": 23,
+            "win_rate": 65.22,
+            "average_victory_margin": 7.3,
+            "last_battle_date": datetime(2024, 1, 25, 10, 15),
+        }
+
+        result = battle_service.get_trainer_stats(1)
+
+        assert result.trainer_name == "Ash Ketchum"
+        assert result.wins == 15
+        assert result.losses == 8
+        assert result.win_rate == 65.22
+        assert result.last_battle_date == datetime(2024, 1, 25, 10, 15)
+        mock_battle_repository.get_trainer_battle_stats.assert_called_once_with(1)
+
+    def test_get_trainer_stats_trainer_not_found(
+        self, battle_service: BattleService, mock_battle_repository: Mock
+    ) -> None:
+        mock_battle_repository.get_trainer_battle_stats.return_value = {
+            "trainer_id": 999,
+            "trainer_name": None,
+            "wins": 0,
+            "losses": 0,
+            "total_battles": 0,
+            "win_rate": 0.0,
+            "average_victory_margin": None,
+            "last_battle_date": None,
+        }
+
+        with pytest.raises(EntityNotFoundException, match="Trainer.*999"):
+            battle_service.get_trainer_stats(999)
+
     def test_get_leaderboard_success(
         self, battle_service: BattleService, mock_battle_repository: Mock
     ) -> None:
@@ -205,6 +296,10 @@ class TestBattleService:
         ]
 
         mock_battle_repository.get_leaderboard_data.return_value = leaderboard_data
+        mock_battle_repository.get_leaderboard_totals.return_value = {
+            "ranked_trainers": 2,
+            "recorded_battles": 23,
+        }
 
         result = battle_service.get_leaderboard()
 
@@ -213,11 +308,18 @@ class TestBattleService:
         assert result.leaderboard[0].win_rate == 0.783
         assert result.total_trainers == 2
         assert result.total_battles == 23
+        mock_battle_repository.get_leaderboard_data.assert_called_once_with(
+            skip=0, limit=100
+        )
 
     def test_get_leaderboard_empty(
         self, battle_service: BattleService, mock_battle_repository: Mock
     ) -> None:
         mock_battle_repository.get_leaderboard_data.return_value = []
+        mock_battle_repository.get_leaderboard_totals.return_value = {
+            "ranked_trainers": 0,
+            "recorded_battles": 0,
+        }
 
         result = battle_service.get_leaderboard()
 
@@ -225,6 +327,50 @@ class TestBattleService:
         assert result.total_trainers == 0
         assert result.total_battles == 0
 
+    def test_get_leaderboard_page_past_end_keeps_totals(
+        self, battle_service: BattleService, mock_battle_repository: Mock
+    ) -> None:
+        mock_battle_repository.get_leaderboard_data.return_value = []
+        mock_battle_repository.get_leaderboard_totals.return_value = {
+            "ranked_trainers": 2,
+            "recorded_battles": 23,
+        }
+
+        result = battle_service.get_leaderboard(skip=50, limit=10)
+
+        assert result.leaderboard == []
+        assert result.total_trainers == 2
+        assert result.total_battles == 23
+
+    def test_get_leaderboard_is_cached_and_invalidated_by_new_battles(
+        self,
+        mock_battle_repository: Mock,
+        mock_trainer_repository: Mock,
+        mock_team_repository: Mock,
+    ) -> None:
+        battle_service = BattleService(
+            battle_repository=mock_battle_repository,
+            trainer_repository=mock_trainer_repository,
+            team_repository=mock_team_repository,
+            leaderboard_flight=SingleFlight(ttl_seconds=60),
+        )
+        mock_battle_repository.get_leaderboard_data.return_value = []
+        mock_battle_repository.get_leaderboard_totals.return_value = {
+            "ranked_trainers": 0,
+            "recorded_battles": 0,
+        }
+        mock_battle_repository.get_by_id.return_value = (
+            BattleFactory.ash_vs_gary_ash_wins()
+        )
+        mock_battle_repository.delete_battle.return_value = True
+
+        battle_service.get_leaderboard()
+        battle_service.get_leaderboard()
+        battle_service.delete_battle(1)
+        battle_service.get_leaderboard()
+
+        assert mock_battle_repository.get_leaderboard_data.call_count == 2
+
     def test_delete_battle_success(
         self,
         battle_service: BattleService,
@@ -252,7 +398,9 @@ class TestBattleService:
             BattleFactory.same_trainer_battle()
 
     def test_battle_entity_invalid_winner_validation(self) -> None:
-        with pytest.raises(ValueError, match="Winner must be one of the battling trainers"):
+        with pytest.raises(
+            ValueError, match="Winner must be one of the battling trainers"
+        ):
             BattleFactory.invalid_winner_battle()
 
     def test_battle_entity_negative_strength_validation(self) -> None:
@@ -262,3 +410,58 @@ class TestBattleService:
     def test_battle_entity_negative_margin_validation(self) -> None:
         with pytest.raises(ValueError, match="Victory margin cannot be negative"):
             BattleFactory.negative_margin_battle()
+
+    def test_iter_battles_maps_each_chunk(
+        self,
+        battle_service: BattleService,
+        mock_battle_repository: Mock,
+        mock_trainer_repository: Mock,
+    ) -> None:
+        date_from = datetime(2026, 1, 1)
+        mock_battle_repository.iter_battles.return_value = iter(
+            [[BattleFactory.ash_vs_gary_ash_wins()]]
+        )
+        mock_trainer_repository.get_by_id.return_value = TrainerFactory.ash_ketchum()
+
+        chunks = list(battle_service.iter_battles(2, date_from=date_from))
+
+        assert [len(chunk) for chunk in chunks] == [1]
+        assert chunks[0][0].winner_trainer_name == "Ash Ketchum"
+        mock_battle_repository.iter_battles.assert_called_once_with(2, date_from, None)
+
+    def test_iter_battles_rejects_inverted_date_range(
+        self, battle_service: BattleService, mock_battle_repository: Mock
+    ) -> None:
+        with pytest.raises(BusinessRuleException, match="date_from cannot be after"):
+            battle_service.iter_battles(
+                date_from=datetime(2026, 2, 1), date_to=datetime(2026, 1, 1)
+            )
+
+        mock_battle_repository.iter_battles.assert_not_called()
+
+    def test_create_battles_validates_rows_against_one_participant_lookup(
+        self, battle_service: BattleService, mock_battle_repository: Mock
+    ) -> None:
+        mock_battle_repository.get_battle_participants.return_value = {
+            1: {"trainer_name": "Ash Ketchum", "team_size": 3},
+            2: {"trainer_name": "Gary Oak", "team_size": 4},
+        }
+        mock_battle_repository.create_battles.return_value = [
+            BattleFactory.ash_vs_gary_ash_wins()
+        ]
+
+        result = battle_service.create_battles(
+            [
+                BattleCreateDTOFactory.nonexistent_team1_trainer(),
+                BattleCreateDTOFactory.ash_vs_gary_ash_wins(),
+            ]
+        )
+
+        assert (result.created, result.failed) == (1, 1)
+        assert "999" in result.results[0].error
+        assert result.results[1].data.winner_trainer_name == "Ash Ketchum"
+        mock_battle_repository.get_battle_participants.assert_called_once_with(
+            {1, 2, 999}
+        )
+        mock_battle_repository.get_battle_validation_data.assert_not_called()
+        assert len(mock_battle_repository.create_battles.call_args.args[0]) == 1
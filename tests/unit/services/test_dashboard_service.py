@@ -0,0 +1,67 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.services.aggregate_refresher import AggregateRefresher
+from src.application.services.dashboard_service import (
+    AVERAGE_LEVEL,
+    COUNTS,
+    TOP_TRAINERS,
+    DashboardService,
+)
+
+
+class TestDashboardService:
+    @pytest.fixture
+    def dashboard_service(
+        self,
+        mock_trainer_repository: Mock,
+        mock_pokemon_repository: Mock,
+        mock_item_repository: Mock,
+    ) -> DashboardService:
+        return DashboardService(
+            mock_trainer_repository, mock_pokemon_repository, mock_item_repository
+        )
+
+    def test_compute_counts_uses_exact_counts(
+        self,
+        dashboard_service: DashboardService,
+        mock_trainer_repository: Mock,
+        mock_pokemon_repository: Mock,
+        mock_item_repository: Mock,
+    ) -> None:
+        mock_trainer_repository.count.return_value = 3
+        mock_pokemon_repository.count.return_value = 12
+        mock_item_repository.count.return_value = 7
+
+        result = dashboard_service.compute_counts()
+
+        assert result == {"trainers_count": 3, "pokemon_count": 12, "items_count": 7}
+        mock_pokemon_repository.count.assert_called_once_with(exact=True)
+
+    def test_read_before_first_refresh(self) -> None:
+        refresher = AggregateRefresher(interval_seconds=60, min_interval_seconds=2)
+        refresher.register(COUNTS, lambda: {})
+        refresher.register(AVERAGE_LEVEL, lambda: 0.0)
+        refresher.register(TOP_TRAINERS, lambda: [])
+
+        result = DashboardService.read(refresher)
+
+        assert result.trainers_count is None
+        assert result.age_seconds is None
+
+    def test_read_assembles_snapshots(self) -> None:
+        refresher = AggregateRefresher(interval_seconds=60, min_interval_seconds=2)
+        refresher.register(
+            COUNTS,
+            lambda: {"trainers_count": 3, "pokemon_count": 12, "items_count": 7},
+        )
+        refresher.register(AVERAGE_LEVEL, lambda: 24.5)
+        refresher.register(TOP_TRAINERS, lambda: [])
+        refresher.refresh_due()
+
+        result = DashboardService.read(refresher)
+
+        assert result.pokemon_count == 12
+        assert result.average_level == 24.5
+        assert result.age_seconds is not None
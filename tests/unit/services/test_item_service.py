@@ -107,7 +107,7 @@ class TestItemService:
         for i, item_dto in enumerate(result):
             assert item_dto.name == item_list[i].name
             assert item_dto.type == item_list[i].type.value
-        mock_item_repository.get_all.assert_called_once_with(0, 10)
+        mock_item_repository.get_all.assert_called_once_with(0, 10, None)
 
     def test_get_all_items_empty_list(
         self, item_service: ItemService, mock_item_repository: Mock
@@ -117,7 +117,7 @@ class TestItemService:
         result = item_service.get_all_items()
 
         assert len(result) == 0
-        mock_item_repository.get_all.assert_called_once_with(0, 100)
+        mock_item_repository.get_all.assert_called_once_with(0, 100, None)
 
     def test_get_all_items_with_pagination(
         self, item_service: ItemService, mock_item_repository: Mock
@@ -128,7 +128,7 @@ class TestItemService:
         result = item_service.get_all_items(skip=5, limit=15)
 
         assert len(result) == 2
-        mock_item_repository.get_all.assert_called_once_with(5, 15)
+        mock_item_repository.get_all.assert_called_once_with(5, 15, None)
 
     def test_update_item_success(
         self, item_service: ItemService, mock_item_repository: Mock
@@ -261,3 +261,21 @@ class TestItemService:
 
         assert len(result) == 0
         mock_item_repository.get_by_type.assert_called_once_with("nonexistent")
+
+    def test_get_items_by_price_range(
+        self, item_service: ItemService, mock_item_repository: Mock
+    ) -> None:
+        mock_item_repository.get_by_price_range.return_value = [ItemFactory.potion()]
+
+        result = item_service.get_items_by_price_range(100, 300)
+
+        assert [item.name for item in result] == ["Potion"]
+        mock_item_repository.get_by_price_range.assert_called_once_with(100, 300)
+
+    def test_get_items_by_price_range_inverted_bounds(
+        self, item_service: ItemService, mock_item_repository: Mock
+    ) -> None:
+        with pytest.raises(BusinessRuleException, match="min_price"):
+            item_service.get_items_by_price_range(500, 100)
+
+        mock_item_repository.get_by_price_range.assert_not_called()
@@ -0,0 +1,70 @@
+from concurrent.futures import ProcessPoolExecutor  # noqa: F401
+from threading import Event, Thread
+
+import pytest
+
+# The hasher is imported inside the tests: test_auth_service swaps passlib out
+# of sys.modules and needs to import it itself. ProcessPoolExecutor is imported
+# here so that its module is loaded before that swap and survives it.
+
+
+class TestPasswordHasher:
+    def test_hash_and_verify_inline(self) -> None:
+        from src.application.services.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(rounds=4)
+
+        hashed = hasher.hash("pikachu123")
+
+        assert hashed.startswith("$2b$04$")
+        assert hasher.verify("pikachu123", hashed)
+        assert not hasher.verify("wrong", hashed)
+
+    def test_outdated_rounds_are_rehashed_on_verify(self) -> None:
+        from src.application.services.password_hasher import PasswordHasher
+
+        old_hash = PasswordHasher(rounds=4).hash("pikachu123")
+        hasher = PasswordHasher(rounds=5)
+
+        verified, new_hash = hasher.verify_and_update("pikachu123", old_hash)
+
+        assert verified
+        assert new_hash is not None and new_hash.startswith("$2b$05$")
+        assert hasher.verify_and_update("pikachu123", new_hash) == (True, None)
+        assert hasher.verify_and_update("wrong", old_hash) == (False, None)
+
+    def test_runs_in_worker_processes(self) -> None:
+        from src.application.services.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(rounds=4, max_workers=1)
+        try:
+            hashed = hasher.hash("pikachu123")
+            assert hasher.verify("pikachu123", hashed)
+        finally:
+            hasher.shutdown()
+
+    def test_rejects_when_every_slot_is_taken(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.application.services import password_hasher as module
+
+        started, finish = Event(), Event()
+
+        def slow_hash(password: str, rounds: int) -> str:
+            started.set()
+            finish.wait(5)
+            return "hashed"
+
+        monkeypatch.setattr(module, "_hash", slow_hash)
+        hasher = module.PasswordHasher(rounds=4, max_queue=0)
+        worker = Thread(target=hasher.hash, args=("first",))
+        worker.start()
+        started.wait(5)
+
+        with pytest.raises(module.PasswordHasherBusyError):
+            hasher.hash("second")
+        finish.set()
+        worker.join()
+
+        assert hasher.stats()["rejected"] == 1
+        assert hasher.hash("third") == "hashed"
@@ -111,7 +111,7 @@ class TestPokemonService:
         result = pokemon_service.get_all_pokemon(skip=0, limit=10)
 
         assert len(result) == 3
-        mock_pokemon_repository.get_all.assert_called_once_with(0, 10)
+        mock_pokemon_repository.get_all.assert_called_once_with(0, 10, None)
 
     def test_get_all_pokemon_empty_list(
         self, pokemon_service: PokemonService, mock_pokemon_repository: Mock
@@ -121,7 +121,7 @@ class TestPokemonService:
         result = pokemon_service.get_all_pokemon()
 
         assert len(result) == 0
-        mock_pokemon_repository.get_all.assert_called_once_with(0, 100)
+        mock_pokemon_repository.get_all.assert_called_once_with(0, 100, None)
 
     def test_update_pokemon_success(
         self, pokemon_service: PokemonService, mock_pokemon_repository: Mock
@@ -266,3 +266,54 @@ class TestPokemonService:
 
         assert result is None
         mock_pokemon_repository.get_by_id.assert_called_once_with(999)
+
+    def test_get_pokemon_by_ids(
+        self, pokemon_service: PokemonService, mock_pokemon_repository: Mock
+    ) -> None:
+        mock_pokemon_repository.get_by_ids.return_value = [PokemonFactory.pikachu()]
+
+        result = pokemon_service.get_pokemon_by_ids([1])
+
+        assert [pokemon.name for pokemon in result] == ["Pikachu"]
+        mock_pokemon_repository.get_by_ids.assert_called_once_with([1])
+
+    def test_create_many_inserts_valid_rows_and_reports_the_rest(
+        self, pokemon_service: PokemonService, mock_pokemon_repository: Mock
+    ) -> None:
+        mock_pokemon_repository.create_many.return_value = [PokemonFactory.charizard()]
+
+        result = pokemon_service.create_many(
+            [
+                PokemonCreateDTOFactory.invalid_level_high(),
+                PokemonCreateDTOFactory.charizard(),
+            ]
+        )
+
+        assert (result.created, result.failed) == (1, 1)
+        assert [row.index for row in result.results] == [0, 1]
+        assert "level must be between" in result.results[0].error
+        assert result.results[1].data.name == "Charizard"
+        (entities,) = mock_pokemon_repository.create_many.call_args.args
+        assert [entity.name for entity in entities] == ["Charizard"]
+
+    def test_get_pokemon_fields_selects_only_requested_columns(
+        self, pokemon_service: PokemonService, mock_pokemon_repository: Mock
+    ) -> None:
+        mock_pokemon_repository.get_projection.return_value = [
+            {"id": 1, "name": "Pikachu"}
+        ]
+
+        result = pokemon_service.get_pokemon_fields({"name", "id"}, 0, 10)
+
+        assert result == [{"id": 1, "name": "Pikachu"}]
+        mock_pokemon_repository.get_projection.assert_called_once_with(
+            ["id", "name"], 0, 10, None
+        )
+
+    def test_get_pokemon_fields_unknown_field(
+        self, pokemon_service: PokemonService, mock_pokemon_repository: Mock
+    ) -> None:
+        with pytest.raises(BusinessRuleException, match="Unknown fields: owner"):
+            pokemon_service.get_pokemon_fields({"name", "owner"})
+
+        mock_pokemon_repository.get_projection.assert_not_called()
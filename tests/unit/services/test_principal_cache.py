@@ -0,0 +1,20 @@
+from src.application.services.principal_cache import PrincipalCache
+from src.domain.entities.user import User
+
+
+class TestPrincipalCache:
+    def test_requests_get_their_own_copy(self) -> None:
+        cache = PrincipalCache(ttl_seconds=30)
+        user = User(id=1, username="ash", email="ash@pokemon.com", hashed_password="x")
+        cache.put(1, "token", user, token_expires_at=None)
+        user.is_superuser = True
+
+        first = cache.get(1, "token")
+        assert first is not None
+        first.trainer_id = 7
+        second = cache.get(1, "token")
+
+        assert second is not None
+        assert second is not first
+        assert not second.is_superuser
+        assert second.trainer_id is None
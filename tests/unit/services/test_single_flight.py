@@ -0,0 +1,86 @@
+from threading import Barrier, Event, Thread
+from time import sleep
+from unittest.mock import patch
+
+import pytest
+
+from src.application.services.single_flight import SingleFlight
+
+MONOTONIC = "src.application.services.single_flight.monotonic"
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_computation(self) -> None:
+        flight: SingleFlight[int] = SingleFlight()
+        release = Event()
+        calls: list[int] = []
+        results: list[int] = []
+        barrier = Barrier(5)
+
+        def compute() -> int:
+            calls.append(1)
+            release.wait(timeout=5)
+            return 42
+
+        def caller() -> None:
+            barrier.wait(timeout=5)
+            results.append(flight.do("leaderboard", compute))
+
+        threads = [Thread(target=caller) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for _ in range(500):
+            if flight.stats()["misses"] + flight.stats()["coalesced"] == 5:
+                break
+            sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == [42] * 5
+        assert len(calls) == 1
+        assert flight.stats()["coalesced"] == 4
+
+    def test_fresh_result_is_served_from_cache(self) -> None:
+        flight: SingleFlight[int] = SingleFlight(ttl_seconds=10)
+        computed = iter([1, 2])
+
+        with patch(MONOTONIC, side_effect=[0.0, 0.0, 5.0]):
+            assert flight.do("key", lambda: next(computed)) == 1
+            assert flight.do("key", lambda: next(computed)) == 1
+
+    def test_stale_result_is_served_while_revalidating(self) -> None:
+        flight: SingleFlight[str] = SingleFlight(ttl_seconds=1, stale_ttl_seconds=10)
+        with patch(MONOTONIC, return_value=0.0):
+            flight.do("key", lambda: "old")
+
+        stale_reads: list[str] = []
+
+        def revalidate() -> str:
+            stale_reads.append(flight.do("key", lambda: "unused"))
+            return "new"
+
+        with patch(MONOTONIC, return_value=5.0):
+            assert flight.do("key", revalidate) == "new"
+
+        assert stale_reads == ["old"]
+        assert flight.stats()["stale_hits"] == 1
+
+    def test_errors_propagate_and_are_not_cached(self) -> None:
+        flight: SingleFlight[int] = SingleFlight(ttl_seconds=10)
+
+        def fail() -> int:
+            raise RuntimeError("database is locked")
+
+        with pytest.raises(RuntimeError, match="database is locked"):
+            flight.do("key", fail)
+
+        assert flight.do("key", lambda: 7) == 7
+
+    def test_invalidate_drops_cached_results(self) -> None:
+        flight: SingleFlight[int] = SingleFlight(ttl_seconds=10)
+        flight.do("key", lambda: 1)
+
+        flight.invalidate()
+
+        assert flight.do("key", lambda: 2) == 2
@@ -40,8 +40,6 @@ class TestTeamService:
 
         mock_trainer_repository.get_by_id.return_value = trainer
         mock_pokemon_repository.get_by_id.return_value = pokemon
-        mock_team_repository.get_trainer_team_size.return_value = 0
-        mock_team_repository.get_team_member.return_value = None
         mock_team_repository.get_team_by_trainer.return_value = []
 
         mock_team_repository.add_pokemon_to_team.return_value = None
@@ -55,6 +53,8 @@ class TestTeamService:
         mock_trainer_repository.get_by_id.assert_has_calls([call(1), call(1)])
         mock_pokemon_repository.get_by_id.assert_called_once_with(1)
         mock_team_repository.add_pokemon_to_team.assert_called_once()
+        mock_team_repository.get_trainer_team_size.assert_not_called()
+        mock_team_repository.get_team_member.assert_not_called()
 
     def test_add_pokemon_trainer_not_found(
         self,
@@ -99,11 +99,16 @@ class TestTeamService:
 
         mock_trainer_repository.get_by_id.return_value = trainer
         mock_pokemon_repository.get_by_id.return_value = pokemon
-        mock_team_repository.get_trainer_team_size.return_value = 6
+        mock_team_repository.get_team_by_trainer.return_value = (
+            TeamFactory.full_team_for_trainer(1)
+        )
 
         with pytest.raises(BusinessRuleException, match="Maximum 6 Pokemon per team"):
             team_service.add_pokemon_to_team(add_dto)
 
+        mock_team_repository.get_team_by_trainer.assert_called_once_with(1)
+        mock_team_repository.add_pokemon_to_team.assert_not_called()
+
     def test_add_pokemon_already_in_team(
         self,
         team_service: TeamService,
@@ -118,8 +123,7 @@ class TestTeamService:
 
         mock_trainer_repository.get_by_id.return_value = trainer
         mock_pokemon_repository.get_by_id.return_value = pokemon
-        mock_team_repository.get_trainer_team_size.return_value = 1
-        mock_team_repository.get_team_member.return_value = existing_team_member
+        mock_team_repository.get_team_by_trainer.return_value = [existing_team_member]
 
         with pytest.raises(
             BusinessRuleException, match="Pokemon.*is already in trainer.*team"
@@ -141,8 +145,6 @@ class TestTeamService:
 
         mock_trainer_repository.get_by_id.return_value = trainer
         mock_pokemon_repository.get_by_id.return_value = pokemon
-        mock_team_repository.get_trainer_team_size.return_value = 1
-        mock_team_repository.get_team_member.return_value = None
         mock_team_repository.get_team_by_trainer.return_value = existing_team_members
 
         with pytest.raises(
@@ -150,6 +152,8 @@ class TestTeamService:
         ):
             team_service.add_pokemon_to_team(add_dto)
 
+        mock_team_repository.get_team_by_trainer.assert_called_once_with(1)
+
     def test_remove_pokemon_from_team_success(
         self,
         team_service: TeamService,
@@ -199,26 +203,30 @@ class TestTeamService:
         team_service: TeamService,
         mock_team_repository: Mock,
         mock_trainer_repository: Mock,
+        mock_pokemon_repository: Mock,
     ) -> None:
         team_member = TeamFactory.ash_pikachu_team_member()
         trainer = TrainerFactory.ash_ketchum()
         update_dto = TeamUpdatePositionDTOFactory.move_to_position_three()
 
-        mock_team_repository.get_team_member.return_value = team_member
-        mock_team_repository.get_team_by_trainer.return_value = []
+        mock_team_repository.get_team_by_trainer.return_value = [team_member]
         mock_team_repository.update_position.return_value = None
         mock_trainer_repository.get_by_id.return_value = trainer
+        mock_pokemon_repository.get_by_id.return_value = PokemonFactory.pikachu()
 
         result = team_service.update_pokemon_position(1, 1, update_dto)
 
         assert result.trainer_id == 1
         mock_team_repository.update_position.assert_called_once_with(1, 1, 3)
+        mock_team_repository.get_team_member.assert_not_called()
 
     def test_update_pokemon_position_not_in_team(
         self, team_service: TeamService, mock_team_repository: Mock
     ) -> None:
         update_dto = TeamUpdatePositionDTOFactory.move_to_position_three()
-        mock_team_repository.get_team_member.return_value = None
+        mock_team_repository.get_team_by_trainer.return_value = [
+            TeamFactory.ash_pikachu_team_member()
+        ]
 
         with pytest.raises(
             BusinessRuleException, match="Pokemon.*is not in trainer.*team"
@@ -230,11 +238,11 @@ class TestTeamService:
     ) -> None:
         team_member = TeamFactory.ash_pikachu_team_member()
         existing_members = [
-            TeamFactory.build(trainer_id=1, pokemon_id=2, position=3, is_active=True)
+            team_member,
+            TeamFactory.build(trainer_id=1, pokemon_id=2, position=3, is_active=True),
         ]
         update_dto = TeamUpdatePositionDTOFactory.move_to_position_three()
 
-        mock_team_repository.get_team_member.return_value = team_member
         mock_team_repository.get_team_by_trainer.return_value = existing_members
 
         with pytest.raises(
@@ -0,0 +1,53 @@
+from unittest.mock import Mock, patch
+
+from src.application.services.token_revocations import TokenRevocationList
+
+MONOTONIC = "src.application.services.token_revocations.monotonic"
+
+
+class TestTokenRevocationList:
+    def test_tokens_below_the_minimum_version_are_revoked(self) -> None:
+        revocations = TokenRevocationList(refresh_interval_seconds=30)
+        repository = Mock()
+        repository.get_revoked_tokens.return_value = {1: 2, 2: None}
+
+        revocations.refresh(repository)
+
+        assert revocations.is_revoked(1, 1)
+        assert not revocations.is_revoked(1, 2)
+        assert revocations.is_revoked(2, 5)
+        assert not revocations.is_revoked(3, 0)
+
+    def test_reloads_only_when_due_or_stale(self) -> None:
+        revocations = TokenRevocationList(refresh_interval_seconds=30)
+        repository = Mock()
+        repository.get_revoked_tokens.return_value = {}
+
+        with patch(MONOTONIC, return_value=0.0):
+            assert revocations.needs_refresh()
+            revocations.refresh(repository)
+            assert not revocations.needs_refresh()
+            revocations.refresh(repository)
+        with patch(MONOTONIC, return_value=31.0):
+            assert revocations.needs_refresh()
+
+        revocations.mark_stale()
+
+        assert revocations.needs_refresh()
+        assert repository.get_revoked_tokens.call_count == 1
+
+    def test_local_revocation_survives_a_concurrent_reload(self) -> None:
+        revocations = TokenRevocationList(refresh_interval_seconds=30)
+
+        def load_before_commit() -> dict[int, int | None]:
+            # The reload read the table just before this worker's write.
+            revocations.revoke(1, 3)
+            return {}
+
+        repository = Mock()
+        repository.get_revoked_tokens.side_effect = load_before_commit
+
+        revocations.refresh(repository)
+
+        assert revocations.is_revoked(1, 2)
+        assert revocations.stats() == {"size": 1, "refreshes": 1}
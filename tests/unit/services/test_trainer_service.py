@@ -4,6 +4,7 @@ import pytest
 
 from src.application.services.trainer_service import TrainerService
 from src.domain.enums.trainer_enums import Gender, Region
+from src.domain.exceptions import BusinessRuleException
 from tests.factories.trainer_factories import (
     PokemonSummaryDTOFactory,
     TrainerCreateDTOFactory,
@@ -100,7 +101,7 @@ class TestTrainerService:
         for i, trainer_dto in enumerate(result):
             assert trainer_dto.name == trainer_list[i].name
             assert trainer_dto.gender == trainer_list[i].gender.value
-        mock_trainer_repository.get_all.assert_called_once_with(0, 10)
+        mock_trainer_repository.get_all.assert_called_once_with(0, 10, None)
 
     def test_get_all_trainers_empty_list(
         self, trainer_service: TrainerService, mock_trainer_repository: Mock
@@ -110,7 +111,7 @@ class TestTrainerService:
         result = trainer_service.get_all_trainers()
 
         assert len(result) == 0
-        mock_trainer_repository.get_all.assert_called_once_with(0, 100)
+        mock_trainer_repository.get_all.assert_called_once_with(0, 100, None)
 
     def test_get_all_trainers_with_pagination(
         self, trainer_service: TrainerService, mock_trainer_repository: Mock
@@ -121,7 +122,7 @@ class TestTrainerService:
         result = trainer_service.get_all_trainers(skip=10, limit=20)
 
         assert len(result) == 5
-        mock_trainer_repository.get_all.assert_called_once_with(10, 20)
+        mock_trainer_repository.get_all.assert_called_once_with(10, 20, None)
 
     def test_update_trainer_success(
         self, trainer_service: TrainerService, mock_trainer_repository: Mock
@@ -253,3 +254,75 @@ class TestTrainerService:
         assert len(result.pokemon_team) == 2
         assert result.pokemon_team[0].name == "Pikachu"
         assert result.pokemon_team[1].name == "Charizard"
+
+    def test_get_trainers_fields_skips_team_lookups(
+        self,
+        trainer_service_with_deps: TrainerService,
+        mock_trainer_repository: Mock,
+        mock_team_repository: Mock,
+    ) -> None:
+        mock_trainer_repository.get_projection.return_value = [
+            {"id": 1, "name": "Ash"}
+        ]
+
+        result = trainer_service_with_deps.get_trainers_fields({"name"}, 0, 10)
+
+        assert result == [{"name": "Ash"}]
+        mock_trainer_repository.get_projection.assert_called_once_with(
+            ["id", "name"], 0, 10, None
+        )
+        mock_team_repository.get_team_by_trainer.assert_not_called()
+
+    def test_get_trainers_fields_team_size_counts_team_rows(
+        self,
+        trainer_service_with_deps: TrainerService,
+        mock_trainer_repository: Mock,
+        mock_team_repository: Mock,
+        mock_pokemon_repository: Mock,
+    ) -> None:
+        mock_trainer_repository.get_projection.return_value = [{"id": 1}]
+        mock_team_repository.get_team_by_trainer.return_value = [Mock(), Mock()]
+
+        result = trainer_service_with_deps.get_trainers_fields({"id", "team_size"})
+
+        assert result == [{"id": 1, "team_size": 2}]
+        mock_pokemon_repository.get_by_id.assert_not_called()
+
+    def test_get_trainer_fields_by_id_builds_requested_team(
+        self,
+        trainer_service_with_deps: TrainerService,
+        mock_trainer_repository: Mock,
+        mock_team_repository: Mock,
+        mock_pokemon_repository: Mock,
+    ) -> None:
+        from tests.factories.pokemon_factories import PokemonFactory
+
+        mock_trainer_repository.get_projection_by_id.return_value = {
+            "id": 1,
+            "name": "Ash",
+        }
+        mock_team_repository.get_team_by_trainer.return_value = [Mock(pokemon_id=1)]
+        mock_pokemon_repository.get_by_id.return_value = PokemonFactory.pikachu()
+
+        result = trainer_service_with_deps.get_trainer_fields_by_id(
+            1, {"name", "pokemon_team"}
+        )
+
+        assert result is not None
+        assert list(result) == ["name", "pokemon_team"]
+        assert [pokemon["name"] for pokemon in result["pokemon_team"]] == ["Pikachu"]
+
+    def test_get_trainer_fields_by_id_not_found(
+        self, trainer_service: TrainerService, mock_trainer_repository: Mock
+    ) -> None:
+        mock_trainer_repository.get_projection_by_id.return_value = None
+
+        assert trainer_service.get_trainer_fields_by_id(999, {"name"}) is None
+
+    def test_get_trainers_fields_unknown_field(
+        self, trainer_service: TrainerService, mock_trainer_repository: Mock
+    ) -> None:
+        with pytest.raises(BusinessRuleException, match="Unknown fields: password"):
+            trainer_service.get_trainers_fields({"name", "password"})
+
+        mock_trainer_repository.get_projection.assert_not_called()